@@ -0,0 +1,83 @@
+"""
+Per-query cost of the read paths with and without the write-time canonical
+fields. The same store is measured twice: once as written by older versions
+(no shadow fields / schema_version, so readers normalise on the fly) and once
+after Repository.migrate_canonical_fields.
+
+    python -m benchmarks.canonical_fields [candidates] [jobs]
+"""
+import json
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from src.domain.canonical import JOB_SHADOWED, CANDIDATE_SHADOWED, canonical_candidate, canonical_job
+from src.services.ranking_engine import EDU_SCORES, RankingEngine
+from src.services.result_cache import ResultCache
+from src.services.screening_service import ScreeningService
+from src.storage.indexes import CandidateSearchIndex, EmailIndex, JobSearchIndex, JobSkillIndex
+from src.storage.repository import Repository
+
+SKILLS = [f"skill {n}" for n in range(60)]
+
+
+def make_store(n_candidates: int, n_jobs: int) -> dict:
+    rnd = random.Random(1)
+    jobs = {f"j{i}": canonical_job({
+        "job_id": f"j{i}", "title": f"Senior Role {i % 300}", "location": rnd.choice(["London", "Leeds", "New York"]),
+        "job_type": "full_time", "min_salary": 30000, "max_salary": 60000,
+        "required_skills": rnd.sample(SKILLS, 3), "min_experience_years": rnd.randint(0, 5), "visa_required": False,
+    }) for i in range(n_jobs)}
+    candidates = {f"c{i}": canonical_candidate({
+        "candidate_id": f"c{i}", "name": f"Cand {i}", "email": f"Cand.{i}@Example.com", "phone": "+441234567890",
+        "location": rnd.choice(["London", "Leeds", "York"]), "years_experience": rnd.randint(0, 12),
+        "skills": rnd.sample(SKILLS, 8), "education_level": rnd.choice(list(EDU_SCORES)), "visa_status": "citizen",
+    }) for i in range(n_candidates)}
+    return {"jobs": jobs, "candidates": candidates, "applications": {}, "interviews": {}}
+
+
+def legacy(store: dict) -> dict:
+    strip = {f"{f}_norm" for f in JOB_SHADOWED + CANDIDATE_SHADOWED} | {"schema_version"}
+    return dict(store, **{section: {rid: {k: v for k, v in rec.items() if k not in strip}
+                                    for rid, rec in store[section].items()}
+                          for section in ("jobs", "candidates")})
+
+
+def measure(path: Path, data: dict) -> dict:
+    path.write_text(json.dumps(data))
+    repo = Repository(path)
+    db = repo.load()
+    db.indexes["screening_results"] = ResultCache(maxsize=0)  # time the scan, not the memo
+    screening = ScreeningService(repo)
+    cids = list(db["candidates"])
+    job_id = next(iter(db["jobs"]))
+    queries = {
+        "filter_eligibility (all candidates)": lambda: screening.filter_eligibility(job_id, cids),
+        "match_jobs_for_candidate": lambda: screening.match_jobs_for_candidate(cids[0]),
+        "build JobSearchIndex": lambda: JobSearchIndex.build({"jobs": dict(db["jobs"])}),
+        "build JobSkillIndex": lambda: JobSkillIndex.build({"jobs": dict(db["jobs"])}),
+        "build EmailIndex": lambda: EmailIndex.build({"candidates": dict(db["candidates"])}),
+        "build CandidateSearchIndex": lambda: CandidateSearchIndex.build({"candidates": dict(db["candidates"])}, EDU_SCORES),
+        "build RankingEngine": lambda: RankingEngine.build({"candidates": dict(db["candidates"])}),
+    }
+    return {name: min(timeit.repeat(fn, number=1, repeat=5)) for name, fn in queries.items()}
+
+
+def main(argv) -> None:
+    n_candidates = int(argv[1]) if len(argv) > 1 else 20000
+    n_jobs = int(argv[2]) if len(argv) > 2 else 2000
+    store = make_store(n_candidates, n_jobs)
+    with tempfile.TemporaryDirectory() as tmp:
+        before = measure(Path(tmp) / "legacy.json", legacy(store))
+        after = measure(Path(tmp) / "canonical.json", store)
+    print(f"{n_candidates} candidates, {n_jobs} jobs (best of 5, ms)")
+    print(f"{'query':40} {'legacy':>9} {'canonical':>10} {'saved':>7}")
+    for name in before:
+        b, a = before[name] * 1000, after[name] * 1000
+        print(f"{name:40} {b:9.2f} {a:10.2f} {(1 - a / b) * 100:6.1f}%")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
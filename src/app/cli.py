@@ -1,19 +1,31 @@
+from src.app.config import STORAGE_BACKEND
 from src.storage.repository import Repository
+from src.storage.split_repository import SplitRepository
+from src.storage.sqlite_repository import SqliteRepository
 from src.services.job_service import JobService
 from src.services.candidate_service import CandidateService
 from src.services.application_service import ApplicationService
 from src.services.screening_service import ScreeningService
 from src.services.interview_service import InterviewService
+from src.services.scheduler_service import SchedulerService
 from src.app.exceptions import ValidationError, NotFoundError, ConflictError, StateError
 
 class CLI:
     def __init__(self):
-        repo = Repository()
+        if STORAGE_BACKEND == "sqlite":
+            repo = SqliteRepository()
+        elif STORAGE_BACKEND == "split":
+            repo = SplitRepository()
+        else:
+            repo = Repository()
+        # upgrades older stores once (audit trails out of records, canonical job/candidate fields)
+        repo.run_pending_migrations()
         self.jobs = JobService(repo)
         self.candidates = CandidateService(repo)
         self.apps = ApplicationService(repo)
         self.screening = ScreeningService(repo)
         self.interviews = InterviewService(repo)
+        self.scheduler = SchedulerService(repo)
 
     def run(self) -> None:
         while True:
@@ -28,6 +40,15 @@ class CLI:
             print("8) Schedule Interview")
             print("9) Exit")
             print("10) Bulk Import (JSON)")
+            print("11) Auto-schedule Shortlisted Interviews")
+            print("12) Top Candidates for Job")
+            print("13) Match Jobs for Candidate")
+            print("14) Batch Screen All Jobs")
+            print("15) Bulk Import (NDJSON stream)")
+            print("16) Export Data (NDJSON/CSV)")
+            print("17) Bulk Update Application Status")
+            print("18) Full-text Job Search")
+            print("19) Search Candidates")
 
             choice = input("Choose: ").strip()
             try:
@@ -49,6 +70,24 @@ class CLI:
                     self._schedule_interview()
                 elif choice == "10":
                     self._bulk_import()
+                elif choice == "11":
+                    self._auto_schedule()
+                elif choice == "12":
+                    self._top_candidates()
+                elif choice == "13":
+                    self._match_jobs()
+                elif choice == "14":
+                    self._batch_screen()
+                elif choice == "15":
+                    self._stream_import()
+                elif choice == "16":
+                    self._export()
+                elif choice == "17":
+                    self._bulk_update_status()
+                elif choice == "18":
+                    self._search_jobs_text()
+                elif choice == "19":
+                    self._search_candidates()
                 elif choice == "9":
                     print("Bye.")
                     return
@@ -94,10 +133,43 @@ class CLI:
         k = input("keyword: ")
         loc = input("location: ")
         jt = input("job_type: ")
-        res = self.jobs.search_jobs(k, loc, jt)
-        print(f"Found {len(res)} job(s).")
-        for j in res:
+        salary = [int(v) if v.strip() else None for v in input("salary range (min-max, either blank): ").split("-", 1)]
+        salary += [None] * (2 - len(salary))
+        exp = input("max years of experience required (blank for any): ").strip()
+        page = input("page (default 1): ").strip()
+        res = self.jobs.search_jobs_faceted(k, loc, jt, offset=(int(page) - 1) * 20 if page else 0, limit=20,
+                                            salary_min=salary[0], salary_max=salary[1],
+                                            max_experience=int(exp) if exp else None)
+        print(f"Found {res['total']} job(s).")
+        for j in res["results"]:
             print("-", j["job_id"], j["title"], "|", j["location"])
+        for facet, counts in res["facets"].items():
+            print(f"{facet}:", ", ".join(f"{v} ({n})" for v, n in sorted(counts.items(), key=lambda c: (-c[1], c[0]))))
+
+    def _search_jobs_text(self):
+        query = input("search: ")
+        k = input("how many (default 10): ").strip()
+        fuzzy = input("tolerate typos (y/n): ").strip().lower() == "y"
+        for j in self.jobs.search_jobs_text(query, int(k) if k else 10, fuzzy=fuzzy):
+            print(f"- {j['job_id']} {j['title']} | {j['location']} ({j['score']})")
+
+    def _search_candidates(self):
+        skills = [s for s in input("skills (comma): ").split(",") if s.strip()]
+        match = input("match all or any skill (default all): ").strip().lower() or "all"
+        loc = input("location: ")
+        years = input("min years_experience (blank for any): ").strip()
+        edu = input("min education_level (blank for any): ").strip() or None
+        page = input("page (default 1): ").strip()
+        filters = dict(skills=skills, match=match, location=loc, min_experience=int(years) if years else None,
+                       min_education=edu)
+        res = self.candidates.search_candidates(**filters, offset=(int(page) - 1) * 20 if page else 0, limit=20)
+        print(f"Found {res['total']} candidate(s).")
+        for c in res["results"]:
+            print("-", c["candidate_id"], c["name"], "|", c["location"], "|", ", ".join(c["skills"]))
+        job_id = input("rank all matches for job_id (blank to skip): ").strip()
+        if job_id:
+            for r in self.screening.rank_candidates(job_id, self.candidates.search_candidate_ids(**filters)):
+                print(r)
 
     def _update_status(self):
         aid = input("application_id: ")
@@ -106,6 +178,20 @@ class CLI:
         a = self.apps.update_application_status(aid, status, reason)
         print("Updated:", a["application_id"], a["status"])
 
+    def _bulk_update_status(self):
+        ids = [a.strip() for a in input("application_ids (comma, blank to select by job): ").split(",") if a.strip()]
+        job_id = current = None
+        if not ids:
+            job_id = input("job_id: ")
+            current = input("current status (blank for any): ").strip() or None
+        status = input("new_status (screened/shortlisted/rejected/interview_scheduled): ")
+        reason = input("reason: ")
+        res = self.apps.bulk_update_status(ids or None, status, reason, job_id=job_id, current_status=current)
+        print(f"Updated {res['updated']}, failed {res['failed']}.")
+        for r in res["results"]:
+            if not r["ok"]:
+                print("-", r["application_id"], r["error"])
+
     def _filter_eligibility(self):
         job_id = input("job_id: ")
         cids = input("candidate_ids (comma): ").split(",")
@@ -120,6 +206,21 @@ class CLI:
         for r in res:
             print(r)
 
+    def _top_candidates(self):
+        job_id = input("job_id: ")
+        k = int(input("how many (k): "))
+        eligible_only = input("eligible only (y/n): ").strip().lower() != "n"
+        res = self.screening.top_k_candidates(job_id, k, eligible_only)
+        for r in res:
+            print(r)
+
+    def _match_jobs(self):
+        cid = input("candidate_id: ")
+        res = self.screening.match_jobs_for_candidate(cid)
+        print(f"Eligible for {len(res)} job(s).")
+        for r in res:
+            print(r)
+
     def _schedule_interview(self):
         iid = input("interview_id: ")
         aid = input("application_id: ")
@@ -130,11 +231,82 @@ class CLI:
         itv = self.interviews.schedule_interview(iid, aid, ts, dur, interviewer, loc)
         print("Scheduled:", itv["interview_id"])
 
+    def _auto_schedule(self):
+        job_id = input("job_id: ")
+        dur = int(input("slot duration_minutes: "))
+        loc = input("location: ")
+        availability = {}
+        while True:
+            interviewer = input("interviewer (blank to finish): ").strip()
+            if not interviewer:
+                break
+            spans = input("windows start/end ISO (comma, e.g. 2025-12-20T09:00/2025-12-20T12:00): ").split(",")
+            availability[interviewer] = [tuple(w.strip().split("/", 1)) for w in spans if "/" in w]
+        report = self.scheduler.schedule_shortlisted(job_id, availability, dur, loc)
+        for s in report["scheduled"]:
+            print("-", s["application_id"], s["scheduled_time"], s["interviewer"])
+        print(f"Scheduled {len(report['scheduled'])}, unscheduled {len(report['unscheduled'])}.")
+
+    def _batch_screen(self):
+        from src.services.batch_screening_service import BatchScreeningService
+        svc = BatchScreeningService(self.jobs.repo)
+        path = input("Output file (e.g. data/screening.jsonl): ").strip()
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+        summary = svc.screen_all(path, fmt)
+        print(f"Screened {summary['jobs']} job(s), {summary['rows']} eligible match(es) -> {summary['output']}")
+
     def _bulk_import(self):
         from src.services.bulk_import_service import BulkImportService
         svc = BulkImportService(self.jobs.repo)  # uses same Repository instance type
         path = input("Path to bulk JSON file (e.g. data/bulk_import.json): ").strip()
-        report = svc.import_from_json(path)
+        mode = input("Mode - insert, validate or upsert (default insert): ").strip().lower()
+        if mode == "upsert":
+            report = svc.import_upsert(path)
+        elif mode == "validate":
+            report = svc.import_validated(path)
+        else:
+            report = svc.import_from_json(path)
+        print("Import report:")
+        print(report)
+
+    def _export(self):
+        from src.services.export_service import ExportService
+        svc = ExportService(self.jobs.repo)
+        what = input("Export (jobs/candidates/applications/interviews/search/ranking): ").strip().lower()
+        path = input("Output file (e.g. data/export.ndjson or .csv): ").strip()
+        fmt = "csv" if path.lower().endswith(".csv") else "ndjson"
+        fields = [f.strip() for f in input("fields (comma, blank for all): ").split(",") if f.strip()] or None
+        if what == "search":
+            summary = svc.export_search_jobs(path, input("keyword: "), input("location: "), input("job_type: "),
+                                             fmt=fmt, fields=fields)
+        elif what == "ranking":
+            summary = svc.export_ranking(input("job_id: "), path, fmt=fmt, fields=fields)
+        else:
+            filters = {}
+            for pair in input("filters (field=value, comma separated): ").split(","):
+                if "=" in pair:
+                    field, value = pair.split("=", 1)
+                    filters[field.strip()] = value.strip()
+            summary = svc.export_collection(what, path, fmt=fmt, fields=fields, filters=filters)
+        print(f"Exported {summary['rows']} row(s) -> {summary['output']}")
+
+    def _stream_import(self):
+        from src.services.bulk_import_service import BulkImportService
+        svc = BulkImportService(self.jobs.repo)
+        path = input("Path to NDJSON file (e.g. data/ats_export.ndjson): ").strip()
+        if svc.repo.saves_incrementally:
+            chunk = input("Records per commit (default 1000): ").strip()
+        else:
+            # each save rewrites the store, so import_ndjson spaces commits out by store size instead
+            chunk = ""
+            print("This store is rewritten on every save: commits wait for at least as many new records "
+                  "as the store already holds (1000 minimum).")
+
+        def show(p):
+            pct = 100 * p["bytes"] // p["total_bytes"] if p["total_bytes"] else 100
+            print(f"  {p['lines']} line(s), {pct}% ({p['chunks']} chunk(s) committed)")
+
+        report = svc.import_ndjson(path, chunk_size=int(chunk) if chunk else 1000, progress=show)
         print("Import report:")
         print(report)
 
@@ -1,6 +1,12 @@
+import os
 from pathlib import Path
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 DATA_FILE = DATA_DIR / "recruiter_data.json"
+SQLITE_FILE = DATA_DIR / "recruiter_data.sqlite3"
+SPLIT_DIR = DATA_DIR / "recruiter_data"
+
+# "json" (default), "split" (one file per collection) or "sqlite"
+STORAGE_BACKEND = os.environ.get("RECRUITER_STORAGE", "json")
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List
+
+from src.app.utils import normalise_skills, normalise_text
+
+# Jobs and candidates are canonicalised once, when they are written: coded
+# fields (job_type, skills, education_level, visa_status) are stored
+# normalised in place, free-text fields the user sees keep their spelling and
+# get a normalised shadow copy ("<field>_norm"). Records carrying the current
+# schema_version are trusted by readers; older ones are normalised on read
+# until Repository.migrate_canonical_fields rewrites them.
+
+SCHEMA_VERSION = 2
+
+JOB_SHADOWED = ("title", "location")
+CANDIDATE_SHADOWED = ("email", "location")
+
+# storage-only fields (source_hash is kept by upsert imports); services and
+# exports hand records out through public_view
+INTERNAL_FIELDS = frozenset({f"{f}_norm" for f in JOB_SHADOWED + CANDIDATE_SHADOWED}
+                            | {"schema_version", "source_hash"})
+
+
+def _text(value: Any) -> str:
+    return normalise_text(value if isinstance(value, str) else "" if value is None else str(value))
+
+
+def _skills(value: Any) -> List[str]:
+    return normalise_skills([str(s) for s in value]) if isinstance(value, list) else []
+
+
+def is_current(rec: Dict[str, Any]) -> bool:
+    return rec.get("schema_version") == SCHEMA_VERSION
+
+
+def canonical_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(job)
+    out["job_type"] = _text(job.get("job_type"))
+    out["required_skills"] = _skills(job.get("required_skills"))
+    for field in JOB_SHADOWED:
+        out[f"{field}_norm"] = _text(job.get(field))
+    out["schema_version"] = SCHEMA_VERSION
+    return out
+
+
+def canonical_candidate(cand: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(cand)
+    out["skills"] = _skills(cand.get("skills"))
+    out["education_level"] = _text(cand.get("education_level", "unknown"))
+    out["visa_status"] = _text(cand.get("visa_status", "unknown"))
+    for field in CANDIDATE_SHADOWED:
+        out[f"{field}_norm"] = _text(cand.get(field))
+    out["schema_version"] = SCHEMA_VERSION
+    return out
+
+
+def public_view(rec: Dict[str, Any]) -> Dict[str, Any]:
+    """A copy of a stored record without the canonical bookkeeping fields."""
+    return {k: v for k, v in rec.items() if k not in INTERNAL_FIELDS}
+
+
+def norm_field(rec: Dict[str, Any], field: str) -> str:
+    """Normalised value of a shadowed free-text field."""
+    value = rec.get(f"{field}_norm")
+    return value if value is not None and is_current(rec) else _text(rec.get(field))
+
+
+def norm_term(rec: Dict[str, Any], field: str, default: str = "") -> str:
+    """A coded field (job_type, education_level, visa_status), normalised."""
+    return rec.get(field, default) if is_current(rec) else _text(rec.get(field, default))
+
+
+def norm_skills(rec: Dict[str, Any], field: str) -> List[str]:
+    """A skill list, normalised and de-duplicated."""
+    return rec.get(field) or [] if is_current(rec) else _skills(rec.get(field))
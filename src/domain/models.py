@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional
+from typing import List, Dict
 from datetime import datetime
 
 @dataclass
@@ -42,13 +42,6 @@ class Application:
     status: str
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    audit_trail: List[Dict] = field(default_factory=list)
-
-    def add_audit(self, action: str, details: Optional[Dict] = None) -> None:
-        self.audit_trail.append(
-            {"ts": datetime.utcnow().isoformat(), "action": action, "details": details or {}}
-        )
-        self.updated_at = datetime.utcnow().isoformat()
 
     def to_dict(self) -> Dict:
         return asdict(self)
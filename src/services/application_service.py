@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from src.app.exceptions import ValidationError, NotFoundError, ConflictError, StateError
 from src.app.utils import ensure_non_empty, normalise_text
@@ -6,6 +6,16 @@ from src.domain.enums import ApplicationStatus
 from src.domain.models import Application
 from src.storage.repository import Repository
 
+STATUSES = frozenset(s.value for s in ApplicationStatus)
+ALLOWED_TRANSITIONS = {
+    ApplicationStatus.APPLIED.value: frozenset({ApplicationStatus.SCREENED.value, ApplicationStatus.REJECTED.value}),
+    ApplicationStatus.SCREENED.value: frozenset({ApplicationStatus.SHORTLISTED.value, ApplicationStatus.REJECTED.value}),
+    ApplicationStatus.SHORTLISTED.value: frozenset({ApplicationStatus.INTERVIEW_SCHEDULED.value, ApplicationStatus.REJECTED.value}),
+    ApplicationStatus.REJECTED.value: frozenset(),
+    ApplicationStatus.WITHDRAWN.value: frozenset(),
+    ApplicationStatus.INTERVIEW_SCHEDULED.value: frozenset(),
+}
+
 class ApplicationService:
     def __init__(self, repo: Repository):
         self.repo = repo
@@ -24,9 +34,8 @@ class ApplicationService:
         if aid in db["applications"]:
             raise ValidationError("Application ID already exists.")
 
-        for a in db["applications"].values():
-            if a["job_id"] == jid and a["candidate_id"] == cid and a["status"] != ApplicationStatus.WITHDRAWN.value:
-                raise ConflictError("Duplicate application for same job and candidate.")
+        if self.repo.active_application(jid, cid) is not None:
+            raise ConflictError("Duplicate application for same job and candidate.")
 
         app = Application(
             application_id=aid,
@@ -34,8 +43,8 @@ class ApplicationService:
             candidate_id=cid,
             status=ApplicationStatus.APPLIED.value
         )
-        app.add_audit("created", {"job_id": jid, "candidate_id": cid})
         db["applications"][aid] = app.to_dict()
+        self.repo.append_audit(aid, "created", {"job_id": jid, "candidate_id": cid})
         self.repo.save(db)
         return app.to_dict()
 
@@ -45,6 +54,7 @@ class ApplicationService:
         app = db["applications"].get(aid)
         if not app:
             raise NotFoundError("Application not found.")
+        app = dict(app)
 
         current = app["status"]
         if current in [ApplicationStatus.REJECTED.value, ApplicationStatus.WITHDRAWN.value]:
@@ -52,22 +62,37 @@ class ApplicationService:
 
         app["status"] = ApplicationStatus.WITHDRAWN.value
         app["updated_at"] = datetime.utcnow().isoformat()
-        app["audit_trail"].append({"ts": datetime.utcnow().isoformat(), "action": "withdrawn", "details": {}})
         db["applications"][aid] = app
+        self.repo.append_audit(aid, "withdrawn")
         self.repo.save(db)
         return app
 
-    def get_application_status(self, application_id: str) -> Dict[str, Any]:
+    def get_application_status(self, application_id: str, since: str = None, until: str = None,
+                               offset: int = 0, limit: int = None) -> Dict[str, Any]:
+        """Status plus one page of the audit trail (since <= ts < until, oldest first); audit_total counts all matches."""
         db = self.repo.load()
         aid = normalise_text(application_id)
         app = db["applications"].get(aid)
         if not app:
             raise NotFoundError("Application not found.")
+        for name, ts in (("since", since), ("until", until)):
+            if ts:
+                try:
+                    datetime.fromisoformat(ts)
+                except ValueError:
+                    raise ValidationError(f"{name} must be ISO format.")
+        if offset < 0:
+            raise ValidationError("offset cannot be negative.")
+        if limit is not None and limit <= 0:
+            raise ValidationError("limit must be positive.")
+
+        trail, total = self.repo.audit_trail(aid, since, until, offset, limit)
         return {
             "application_id": app["application_id"],
             "status": app["status"],
             "updated_at": app["updated_at"],
-            "audit_trail": app.get("audit_trail", [])
+            "audit_trail": trail,
+            "audit_total": total
         }
 
     def update_application_status(self, application_id: str, new_status: str, reason: str = "") -> Dict[str, Any]:
@@ -78,35 +103,78 @@ class ApplicationService:
             raise NotFoundError("Application not found.")
 
         ns = normalise_text(new_status)
-        allowed = {
-            ApplicationStatus.APPLIED.value: {ApplicationStatus.SCREENED.value, ApplicationStatus.REJECTED.value},
-            ApplicationStatus.SCREENED.value: {ApplicationStatus.SHORTLISTED.value, ApplicationStatus.REJECTED.value},
-            ApplicationStatus.SHORTLISTED.value: {ApplicationStatus.INTERVIEW_SCHEDULED.value, ApplicationStatus.REJECTED.value},
-            ApplicationStatus.REJECTED.value: set(),
-            ApplicationStatus.WITHDRAWN.value: set(),
-            ApplicationStatus.INTERVIEW_SCHEDULED.value: set(),
-        }
-
-        cur = app["status"]
-        if ns not in [s.value for s in ApplicationStatus]:
+        if ns not in STATUSES:
             raise ValidationError("Unknown status.")
+        self._check_transition(app["status"], ns)
+
+        app = self._apply_status(db, aid, app, ns, reason)
+        self.repo.save(db)
+        return app
+
+    @staticmethod
+    def _check_transition(cur: str, ns: str) -> None:
         if ns == cur:
             raise ValidationError("Status unchanged.")
-        if ns not in allowed.get(cur, set()):
+        if ns not in ALLOWED_TRANSITIONS.get(cur, frozenset()):
             raise StateError(f"Invalid transition: {cur} -> {ns}")
 
+    def _apply_status(self, db: Dict[str, Any], aid: str, app: Dict[str, Any], ns: str, reason: str) -> Dict[str, Any]:
+        cur = app["status"]
+        app = dict(app)
         app["status"] = ns
         app["updated_at"] = datetime.utcnow().isoformat()
-        app["audit_trail"].append(
-            {"ts": datetime.utcnow().isoformat(), "action": "status_change", "details": {"from": cur, "to": ns, "reason": reason}}
-        )
         db["applications"][aid] = app
-        self.repo.save(db)
+        self.repo.append_audit(aid, "status_change", {"from": cur, "to": ns, "reason": reason})
         return app
 
+    def bulk_update_status(self, application_ids: Optional[List[str]], new_status: str, reason: str = "",
+                           job_id: str = None, current_status: str = None) -> Dict[str, Any]:
+        """
+        Move many applications to ``new_status`` in one save. Applications are given by id,
+        or selected as every application of ``job_id`` (optionally only those in
+        ``current_status``). Each one succeeds or fails on its own; the per-id results
+        are returned in selection order.
+        """
+        ns = normalise_text(new_status)
+        if ns not in STATUSES:
+            raise ValidationError("Unknown status.")
+        if application_ids is None and not job_id:
+            raise ValidationError("Give application ids or a job_id to select by.")
+
+        results = []
+        with self.repo.transaction() as db:
+            if application_ids is not None:
+                selected = [normalise_text(a) for a in application_ids]
+            else:
+                jid = normalise_text(job_id)
+                if jid not in db["jobs"]:
+                    raise NotFoundError("Job not found.")
+                cs = normalise_text(current_status) if current_status else None
+                if cs is not None and cs not in STATUSES:
+                    raise ValidationError("Unknown status.")
+                selected = [a["application_id"] for a in self.repo.applications_for_job(jid)
+                            if cs is None or a["status"] == cs]
+
+            for aid in selected:
+                app = db["applications"].get(aid)
+                try:
+                    if not app:
+                        raise NotFoundError("Application not found.")
+                    self._check_transition(app["status"], ns)
+                except (NotFoundError, ValidationError, StateError) as e:
+                    results.append({"application_id": aid, "ok": False, "error": str(e)})
+                    continue
+                self._apply_status(db, aid, app, ns, reason)
+                results.append({"application_id": aid, "ok": True, "status": ns})
+
+            updated = sum(1 for r in results if r["ok"])
+            if updated:
+                self.repo.save(db)
+        return {"updated": updated, "failed": len(results) - updated, "results": results}
+
     def list_applications_for_job(self, job_id: str) -> List[Dict[str, Any]]:
         db = self.repo.load()
         jid = normalise_text(job_id)
         if jid not in db["jobs"]:
             raise NotFoundError("Job not found.")
-        return [a for a in db["applications"].values() if a["job_id"] == jid]
+        return self.repo.applications_for_job(jid)
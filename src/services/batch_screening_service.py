@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+from src.app.exceptions import NotFoundError, ValidationError
+from src.app.utils import normalise_text
+from src.services.ranking_engine import DEFAULT_WEIGHTS, RankingEngine
+from src.storage.repository import Repository
+
+CSV_FIELDS = ["job_id", "rank", "candidate_id", "score", "skills", "experience", "education"]
+
+# per-process ranking engine, built once by _init_worker
+_engine: Optional[RankingEngine] = None
+
+
+def _init_worker(candidates: Dict[str, Any]) -> None:
+    global _engine
+    _engine = RankingEngine.build({"candidates": candidates})
+
+
+def _screen_jobs(jobs: List[Dict[str, Any]], weights: Dict[str, float], limit: Optional[int],
+                 engine: Optional[RankingEngine] = None) -> List[Dict[str, Any]]:
+    engine = engine or _engine
+    out = []
+    for job in jobs:
+        ranked = engine.top_k(job, limit or len(engine.ids) or 1, weights, eligible_only=True)
+        out.append({"job_id": job["job_id"], "eligible_count": len(ranked), "candidates": ranked})
+    return out
+
+
+class BatchScreeningService:
+    """
+    Screens many jobs against the whole candidate pool in one go.
+    The store is loaded once; each worker process builds its own ranking
+    engine from the candidate pool and takes jobs in chunks. Per-job results
+    (eligible candidates, best first, with score breakdown) are streamed to a
+    JSON Lines or CSV file as chunks finish, with a bounded number of chunks
+    in flight so memory does not grow with the number of jobs.
+    """
+
+    def __init__(self, repo: Repository):
+        self.repo = repo
+
+    def screen_all(self, output_path: str, fmt: str = "jsonl", job_ids: Optional[List[str]] = None,
+                   workers: Optional[int] = None, chunk_size: int = 50, limit: Optional[int] = None,
+                   weights: Dict[str, float] = None) -> Dict[str, Any]:
+        if fmt not in ("jsonl", "csv"):
+            raise ValidationError("Output format must be jsonl or csv.")
+        if chunk_size <= 0:
+            raise ValidationError("chunk_size must be positive.")
+        if limit is not None and limit <= 0:
+            raise ValidationError("limit must be positive.")
+
+        db = self.repo.load()
+        jobs = self._select_jobs(db, job_ids)
+        candidates = dict(db["candidates"].items())
+        weights = weights or DEFAULT_WEIGHTS
+        workers = workers or os.cpu_count() or 1
+
+        summary = {"jobs": 0, "rows": 0, "output": str(output_path)}
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f) if fmt == "csv" else None
+            if writer:
+                writer.writerow(CSV_FIELDS)
+            for result in self._run(jobs, candidates, weights, limit, workers, chunk_size):
+                summary["jobs"] += 1
+                summary["rows"] += result["eligible_count"]
+                if writer:
+                    for rank, r in enumerate(result["candidates"], start=1):
+                        b = r["breakdown"]
+                        writer.writerow([result["job_id"], rank, r["candidate_id"], r["score"],
+                                         b["skills"], b["experience"], b["education"]])
+                else:
+                    f.write(json.dumps(result, separators=(",", ":")) + "\n")
+        return summary
+
+    @staticmethod
+    def _select_jobs(db: Dict[str, Any], job_ids: Optional[List[str]]) -> List[Dict[str, Any]]:
+        if job_ids is None:
+            return list(db["jobs"].values())
+        jobs = []
+        for raw in job_ids:
+            job = db["jobs"].get(normalise_text(raw))
+            if not job:
+                raise NotFoundError(f"Job not found: {raw}")
+            jobs.append(job)
+        return jobs
+
+    @staticmethod
+    def _run(jobs: List[Dict[str, Any]], candidates: Dict[str, Any], weights: Dict[str, float],
+             limit: Optional[int], workers: int, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        chunks = (jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size))
+        if workers == 1:
+            engine = RankingEngine.build({"candidates": candidates})
+            for chunk in chunks:
+                yield from _screen_jobs(chunk, weights, limit, engine)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(candidates,)) as pool:
+            pending = set()
+            for chunk in chunks:
+                pending.add(pool.submit(_screen_jobs, chunk, weights, limit))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield from fut.result()
+            for fut in as_completed(pending):
+                yield from fut.result()
@@ -1,12 +1,54 @@
+import hashlib
 import json
+import os
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
 
-from src.app.exceptions import ValidationError
+from src.app.exceptions import StateError, ValidationError
 from src.app.utils import normalise_text
+from src.domain.canonical import canonical_candidate, canonical_job
+from src.domain.enums import ApplicationStatus
+from src.services.application_service import ApplicationService
+from src.services.candidate_service import EDITABLE_FIELDS as CANDIDATE_FIELDS, CandidateService
+from src.services.import_validation import CLEANERS, clean_chunk
+from src.services.job_service import EDITABLE_FIELDS as JOB_FIELDS, JobService
 from src.storage.repository import Repository
 
 
+# NDJSON "type" tag -> (section, id field); singular and plural tags are both accepted
+ENTITY_TYPES = {
+    "job": ("jobs", "job_id"),
+    "candidate": ("candidates", "candidate_id"),
+    "application": ("applications", "application_id"),
+    "interview": ("interviews", "interview_id"),
+}
+_ID_FIELDS = {section: id_field for section, id_field in ENTITY_TYPES.values()}
+ENTITY_TYPES.update({entry[0]: entry for entry in list(ENTITY_TYPES.values())})
+
+# raw (insert-mode) records still get the write-time canonical fields readers rely on
+_CANONICAL = {"jobs": canonical_job, "candidates": canonical_candidate}
+
+# errors kept per report section, so a bad multi-GB file cannot grow the report without bound
+MAX_REPORTED_ERRORS = 100
+
+
+def _new_report() -> Dict[str, Any]:
+    return {section: {"imported": 0, "skipped": 0, "errors": []}
+            for section in ("jobs", "candidates", "applications", "interviews")}
+
+
+def _record_error(entry: Dict[str, Any], message: str) -> None:
+    entry["skipped"] += 1
+    if len(entry["errors"]) < MAX_REPORTED_ERRORS:
+        entry["errors"].append(message)
+
+
+def _content(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in rec.items() if k != "source_hash"}
+
+
 class BulkImportService:
     """
     Bulk import into the JSON data store.
@@ -17,12 +59,15 @@ class BulkImportService:
       "applications": [ {...}, {...} ],
       "interviews": [ {...}, {...} ]
     }
+    import_ndjson streams newline-delimited JSON instead, one record per line
+    tagged with its entity type: {"type": "candidate", "candidate_id": ...}
     """
 
     def __init__(self, repo: Repository):
         self.repo = repo
 
-    def import_from_json(self, file_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _read_payload(file_path: str) -> Dict[str, Any]:
         path = Path(file_path)
         if not path.exists():
             raise ValidationError("Bulk file not found.")
@@ -34,22 +79,18 @@ class BulkImportService:
 
         if not isinstance(payload, dict):
             raise ValidationError("Bulk JSON must be an object.")
+        return payload
 
-        db = self.repo.load()
-
-        report = {
-            "jobs": {"imported": 0, "skipped": 0, "errors": []},
-            "candidates": {"imported": 0, "skipped": 0, "errors": []},
-            "applications": {"imported": 0, "skipped": 0, "errors": []},
-            "interviews": {"imported": 0, "skipped": 0, "errors": []},
-        }
-
-        self._merge_section(db, payload, "jobs", "job_id", report)
-        self._merge_section(db, payload, "candidates", "candidate_id", report)
-        self._merge_section(db, payload, "applications", "application_id", report)
-        self._merge_section(db, payload, "interviews", "interview_id", report)
+    def import_from_json(self, file_path: str) -> Dict[str, Any]:
+        payload = self._read_payload(file_path)
+        report = _new_report()
 
-        self.repo.save(db)
+        with self.repo.transaction() as db:
+            self._merge_section(db, payload, "jobs", "job_id", report)
+            self._merge_section(db, payload, "candidates", "candidate_id", report)
+            self._merge_section(db, payload, "applications", "application_id", report)
+            self._merge_section(db, payload, "interviews", "interview_id", report)
+            self.repo.save(db)
         return report
 
     def _merge_section(
@@ -67,23 +108,267 @@ class BulkImportService:
             raise ValidationError(f'"{section}" must be a list.')
 
         for idx, item in enumerate(items):
-            if not isinstance(item, dict):
-                report[section]["skipped"] += 1
-                report[section]["errors"].append(f"{section}[{idx}]: not an object")
-                continue
-
-            raw_id = item.get(id_field)
-            if not raw_id or not str(raw_id).strip():
-                report[section]["skipped"] += 1
-                report[section]["errors"].append(f"{section}[{idx}]: missing {id_field}")
-                continue
-
-            obj_id = normalise_text(str(raw_id))
-            if obj_id in db[section]:
-                report[section]["skipped"] += 1
-                continue
-
-            # Store with normalised ID
-            item[id_field] = obj_id
-            db[section][obj_id] = item
-            report[section]["imported"] += 1
+            self._merge_item(db, section, id_field, item, f"{section}[{idx}]", report)
+
+    @staticmethod
+    def _merge_item(db: Dict[str, Any], section: str, id_field: str, item: Any,
+                    where: str, report: Dict[str, Any]) -> None:
+        if not isinstance(item, dict):
+            report[section]["skipped"] += 1
+            report[section]["errors"].append(f"{where}: not an object")
+            return
+
+        raw_id = item.get(id_field)
+        if not raw_id or not str(raw_id).strip():
+            report[section]["skipped"] += 1
+            report[section]["errors"].append(f"{where}: missing {id_field}")
+            return
+
+        obj_id = normalise_text(str(raw_id))
+        if obj_id in db[section]:
+            report[section]["skipped"] += 1
+            return
+
+        # Store with normalised ID
+        item[id_field] = obj_id
+        db[section][obj_id] = _CANONICAL[section](item) if section in _CANONICAL else item
+        report[section]["imported"] += 1
+
+    def import_validated(self, file_path: str, workers: Optional[int] = None,
+                         chunk_size: int = 500) -> Dict[str, Any]:
+        """
+        Like import_from_json, but every record goes through the same checks and
+        normalisation as the create_* services. Record-level validation runs in
+        chunks across a process pool; references, unique ids/emails, duplicate
+        applications and interviewer double-booking are then checked in jobs ->
+        candidates -> applications -> interviews order against the store plus
+        everything accepted so far. All accepted records are saved once.
+        """
+        if chunk_size <= 0:
+            raise ValidationError("chunk_size must be positive.")
+        payload = self._read_payload(file_path)
+        tasks = []
+        for section in ("jobs", "candidates", "applications", "interviews"):
+            items = payload.get(section) or []
+            if not isinstance(items, list):
+                raise ValidationError(f'"{section}" must be a list.')
+            tasks.extend((section, i, items[i:i + chunk_size]) for i in range(0, len(items), chunk_size))
+        workers = workers or os.cpu_count() or 1
+
+        report = _new_report()
+        with self.repo.transaction() as db:
+            if workers == 1 or len(tasks) <= 1:
+                self._apply_cleaned(db, tasks, map(clean_chunk, tasks), report)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    self._apply_cleaned(db, tasks, pool.map(clean_chunk, tasks), report)
+            self.repo.save(db)
+        return report
+
+    def _apply_cleaned(self, db: Dict[str, Any], tasks: List[Tuple[str, int, List[Any]]],
+                       results: Iterator[List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]],
+                       report: Dict[str, Any]) -> None:
+        # results arrive in task order, so every referenced record has been settled first
+        for (section, _, _), cleaned in zip(tasks, results):
+            entry = report[section]
+            for idx, rec, error in cleaned:
+                error = error or self._reference_error(db, section, rec)
+                if error:
+                    entry["skipped"] += 1
+                    entry["errors"].append(f"{section}[{idx}]: {error}")
+                    continue
+                self._store(db, section, rec)
+                entry["imported"] += 1
+
+    def _store(self, db: Dict[str, Any], section: str, rec: Dict[str, Any]) -> None:
+        obj_id = rec[_ID_FIELDS[section]]
+        # trails were checked by clean_application
+        for e in rec.pop("audit_trail", None) or []:
+            self.repo.append_audit(obj_id, e["action"], e["details"], e["ts"])
+        db[section][obj_id] = rec
+
+    def _reference_error(self, db: Dict[str, Any], section: str, rec: Dict[str, Any]) -> Optional[str]:
+        if rec[_ID_FIELDS[section]] in db[section]:
+            return f"{_ID_FIELDS[section]} already exists: {rec[_ID_FIELDS[section]]}"
+        if section == "candidates":
+            if self.repo.candidate_id_for_email(rec["email"]) is not None:
+                return "Email already exists."
+        elif section == "applications":
+            if rec["job_id"] not in db["jobs"]:
+                return f"Job not found: {rec['job_id']}"
+            if rec["candidate_id"] not in db["candidates"]:
+                return f"Candidate not found: {rec['candidate_id']}"
+            if (rec["status"] != ApplicationStatus.WITHDRAWN.value
+                    and self.repo.active_application(rec["job_id"], rec["candidate_id"]) is not None):
+                return "Duplicate application for same job and candidate."
+        elif section == "interviews":
+            if rec["application_id"] not in db["applications"]:
+                return f"Application not found: {rec['application_id']}"
+            if not rec["cancelled"]:
+                start = datetime.fromisoformat(rec["scheduled_time"])
+                end = start + timedelta(minutes=rec["duration_minutes"])
+                if self.repo.overlapping_interview(rec["interviewer"], start, end) is not None:
+                    return "Interviewer is double-booked."
+        return None
+
+    def import_upsert(self, file_path: str) -> Dict[str, Any]:
+        """
+        Insert new records and update changed ones, keyed on a hash of each incoming
+        record kept in its ``source_hash`` field. Records whose hash matches are left
+        alone without being validated or written, so a re-import only pays for what
+        changed. New records go through the validated path. Changed jobs and
+        candidates are updated through edit_job_posting/update_candidate_profile,
+        limited to their editable fields. Changed applications can only move status
+        along the allowed transitions, and changed interviews are reported as errors.
+        """
+        payload = self._read_payload(file_path)
+        report = {section: {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0, "errors": []}
+                  for section in _ID_FIELDS}
+
+        with self.repo.transaction() as db:
+            for section, id_field in _ID_FIELDS.items():
+                items = payload.get(section) or []
+                if not isinstance(items, list):
+                    raise ValidationError(f'"{section}" must be a list.')
+                for idx, item in enumerate(items):
+                    try:
+                        outcome = self._upsert_item(db, section, id_field, item)
+                    except (ValidationError, StateError, TypeError, ValueError) as e:
+                        report[section]["skipped"] += 1
+                        report[section]["errors"].append(f"{section}[{idx}]: {e}")
+                        continue
+                    report[section][outcome] += 1
+            # an unchanged re-import writes nothing
+            if any(r["inserted"] + r["updated"] for r in report.values()):
+                self.repo.save(db)
+        return report
+
+    def _upsert_item(self, db: Dict[str, Any], section: str, id_field: str, item: Any) -> str:
+        if not isinstance(item, dict):
+            raise ValidationError("not an object")
+        digest = hashlib.sha1(json.dumps(item, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+        if not item.get(id_field) or not str(item[id_field]).strip():
+            raise ValidationError(f"missing {id_field}")
+        obj_id = normalise_text(str(item[id_field]))
+
+        current = db[section].get(obj_id)
+        if current is None:
+            rec = CLEANERS[section](item)
+            error = self._reference_error(db, section, rec)
+            if error:
+                raise ValidationError(error)
+            self._store(db, section, dict(rec, source_hash=digest))
+            return "inserted"
+        if current.get("source_hash") == digest:
+            return "unchanged"
+
+        if section == "jobs":
+            JobService(self.repo).edit_job_posting(obj_id, {k: v for k, v in item.items() if k in JOB_FIELDS})
+        elif section == "candidates":
+            CandidateService(self.repo).update_candidate_profile(
+                obj_id, {k: v for k, v in item.items() if k in CANDIDATE_FIELDS})
+        elif section == "applications":
+            status = normalise_text(str(item.get("status") or current["status"]))
+            if status != current["status"]:
+                ApplicationService(self.repo).update_application_status(obj_id, status, "bulk import")
+        elif CLEANERS[section](item) != _content(current):
+            raise ValidationError("interviews cannot be changed by import")
+
+        updated = db[section][obj_id]
+        db[section][obj_id] = dict(updated, source_hash=digest)
+        return "updated" if _content(updated) != _content(current) else "unchanged"
+
+    def import_ndjson(self, file_path: str, chunk_size: int = 1000, resume: bool = True,
+                      progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Stream an NDJSON file into the store, committing every ``chunk_size`` records.
+        After each commit the byte offset reached is checkpointed next to the input
+        file, so a crashed run picks up after its last committed chunk. Records are
+        only ever added, never overwritten, so replaying a chunk is harmless.
+        ``progress`` gets {"lines", "bytes", "total_bytes", "chunks"} after each commit.
+
+        Where a save rewrites the whole store (the default JSON file and the split
+        layout), a commit also waits until at least as many records are pending as
+        the store held at the previous one. Every rewrite then at least doubles
+        the store, so the total written stays linear in its final size.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise ValidationError("Bulk file not found.")
+        if chunk_size <= 0:
+            raise ValidationError("chunk_size must be positive.")
+
+        checkpoint_path = path.with_name(path.name + ".progress")
+        st = path.stat()
+        source = [st.st_size, st.st_mtime_ns]
+        state = self._read_checkpoint(checkpoint_path) if resume else None
+        if state is None or state.get("source") != source:
+            state = {"source": source, "offset": 0, "lines": 0, "chunks": 0,
+                     "report": dict(_new_report(), lines={"skipped": 0, "errors": []})}
+        report = state["report"]
+
+        records = self._iter_ndjson(path, state["offset"], state["lines"])
+        while True:
+            with self.repo.transaction() as db:
+                batch = chunk_size
+                if not self.repo.saves_incrementally:
+                    batch = max(chunk_size, sum(len(db[section]) for section in _ID_FIELDS))
+                count = 0
+                for line_no, offset, record in records:
+                    state["lines"], state["offset"] = line_no, offset
+                    self._merge_line(db, record, f"line {line_no}", report)
+                    count += 1
+                    if count >= batch:
+                        break
+                if count:
+                    self.repo.save(db)
+            if not count:
+                break
+            state["chunks"] += 1
+            self._write_checkpoint(checkpoint_path, state)
+            if progress is not None:
+                progress({"lines": state["lines"], "bytes": state["offset"],
+                          "total_bytes": source[0], "chunks": state["chunks"]})
+
+        checkpoint_path.unlink(missing_ok=True)
+        return report
+
+    @staticmethod
+    def _iter_ndjson(path: Path, offset: int, line_no: int) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (line number, byte offset after the line, parsed record or the raw bad line)."""
+        with path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                offset += len(raw)
+                line_no += 1
+                if not raw.strip():
+                    continue
+                try:
+                    yield line_no, offset, json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    yield line_no, offset, raw
+
+    def _merge_line(self, db: Dict[str, Any], record: Any, where: str, report: Dict[str, Any]) -> None:
+        if not isinstance(record, dict):
+            _record_error(report["lines"], f"{where}: invalid JSON object")
+            return
+        entity = ENTITY_TYPES.get(normalise_text(str(record.pop("type", ""))))
+        if entity is None:
+            _record_error(report["lines"], f"{where}: unknown or missing type")
+            return
+        section, id_field = entity
+        self._merge_item(db, section, id_field, record, where, report)
+        del report[section]["errors"][MAX_REPORTED_ERRORS:]
+
+    @staticmethod
+    def _read_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_checkpoint(path: Path, state: Dict[str, Any]) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, path)
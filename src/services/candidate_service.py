@@ -1,9 +1,16 @@
-from typing import Dict, Any, List
+import heapq
+from typing import Dict, Any, List, Optional, Set
 from src.app.exceptions import ValidationError, NotFoundError
 from src.app.utils import ensure_non_empty, validate_email, validate_phone, normalise_text, normalise_skills
+from src.domain.canonical import canonical_candidate, public_view
 from src.domain.models import CandidateProfile
+from src.services.ranking_engine import EDU_SCORES
+from src.storage.indexes import CandidateSearchIndex
 from src.storage.repository import Repository
 
+EDITABLE_FIELDS = {"name", "email", "phone", "location", "years_experience",
+                   "skills", "education_level", "visa_status"}
+
 class CandidateService:
     def __init__(self, repo: Repository):
         self.repo = repo
@@ -23,10 +30,8 @@ class CandidateService:
         cid = normalise_text(candidate_id)
         if cid in db["candidates"]:
             raise ValidationError("Candidate ID already exists.")
-        email_norm = normalise_text(email)
-        for c in db["candidates"].values():
-            if normalise_text(c["email"]) == email_norm:
-                raise ValidationError("Email already exists.")
+        if self.repo.candidate_id_for_email(email) is not None:
+            raise ValidationError("Email already exists.")
 
         profile = CandidateProfile(
             candidate_id=cid,
@@ -39,9 +44,10 @@ class CandidateService:
             education_level=normalise_text(education_level or "unknown"),
             visa_status=normalise_text(visa_status or "unknown"),
         )
-        db["candidates"][cid] = profile.to_dict()
+        record = canonical_candidate(profile.to_dict())
+        db["candidates"][cid] = record
         self.repo.save(db)
-        return profile.to_dict()
+        return public_view(record)
 
     def update_candidate_profile(self, candidate_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         db = self.repo.load()
@@ -49,11 +55,10 @@ class CandidateService:
         prof = db["candidates"].get(cid)
         if not prof:
             raise NotFoundError("Candidate not found.")
+        prof = dict(prof)
 
-        allowed = {"name", "email", "phone", "location", "years_experience",
-                   "skills", "education_level", "visa_status"}
         for k in updates.keys():
-            if k not in allowed:
+            if k not in EDITABLE_FIELDS:
                 raise ValidationError(f"Field not editable: {k}")
 
         if "name" in updates:
@@ -62,10 +67,8 @@ class CandidateService:
 
         if "email" in updates:
             validate_email(str(updates["email"]))
-            email_norm = normalise_text(str(updates["email"]))
-            for other_id, c in db["candidates"].items():
-                if other_id != cid and normalise_text(c["email"]) == email_norm:
-                    raise ValidationError("Email already exists.")
+            if self.repo.candidate_id_for_email(str(updates["email"]), exclude_id=cid) is not None:
+                raise ValidationError("Email already exists.")
             prof["email"] = str(updates["email"]).strip()
 
         if "phone" in updates:
@@ -91,9 +94,10 @@ class CandidateService:
         if "visa_status" in updates:
             prof["visa_status"] = normalise_text(str(updates["visa_status"]))
 
+        prof = canonical_candidate(prof)
         db["candidates"][cid] = prof
         self.repo.save(db)
-        return prof
+        return public_view(prof)
 
     def view_candidate_profile(self, candidate_id: str) -> Dict[str, Any]:
         db = self.repo.load()
@@ -101,4 +105,58 @@ class CandidateService:
         prof = db["candidates"].get(cid)
         if not prof:
             raise NotFoundError("Candidate not found.")
-        return prof
+        return public_view(prof)
+
+    def _search_index(self) -> CandidateSearchIndex:
+        # education levels are ordered the way ranking scores them
+        return self.repo.index("candidate_search", lambda db: CandidateSearchIndex.build(db, EDU_SCORES))
+
+    def search_candidate_ids(self, skills: Optional[List[str]] = None, match: str = "all", location: str = "",
+                             min_experience: Optional[int] = None, max_experience: Optional[int] = None,
+                             min_education: Optional[str] = None) -> List[str]:
+        """
+        Ids of candidates with all (``match="all"``) or any (``match="any"``) of ``skills``, a location
+        containing ``location``, years of experience within the bounds and at least ``min_education``,
+        in id order. The list can be passed straight to rank_candidates or filter_eligibility.
+        """
+        return sorted(self._matching_ids(skills, match, location, min_experience, max_experience, min_education))
+
+    def search_candidates(self, skills: Optional[List[str]] = None, match: str = "all", location: str = "",
+                          min_experience: Optional[int] = None, max_experience: Optional[int] = None,
+                          min_education: Optional[str] = None, offset: int = 0, limit: int = 20) -> Dict[str, Any]:
+        """One page of search_candidate_ids as profiles, plus the total number of matches."""
+        if offset < 0:
+            raise ValidationError("offset cannot be negative.")
+        if limit <= 0:
+            raise ValidationError("limit must be positive.")
+        ids = self._matching_ids(skills, match, location, min_experience, max_experience, min_education)
+        candidates = self.repo.load()["candidates"]
+        return {
+            "total": len(ids),
+            "offset": offset,
+            "limit": limit,
+            "results": [public_view(candidates[cid]) for cid in heapq.nsmallest(offset + limit, ids)[offset:]],
+        }
+
+    def _matching_ids(self, skills: Optional[List[str]], match: str, location: str, min_experience: Optional[int],
+                      max_experience: Optional[int], min_education: Optional[str]) -> Set[str]:
+        if match not in ("all", "any"):
+            raise ValidationError("match must be 'all' or 'any'.")
+        if min_experience is not None and max_experience is not None and min_experience > max_experience:
+            raise ValidationError("min_experience cannot exceed max_experience.")
+        if min_education is not None and normalise_text(min_education) not in EDU_SCORES:
+            raise ValidationError(f"Unknown education level: {min_education}")
+        idx = self._search_index()
+        wanted, loc = normalise_skills(skills or []), normalise_text(location)
+
+        sets, ranges = [], []
+        if wanted:
+            sets.append(idx.with_skills(wanted, any_skill=match == "any"))
+        if loc:
+            sets.append(idx.with_location(loc))
+        if min_experience is not None or max_experience is not None:
+            ranges.append(("years_experience", min_experience, max_experience))
+        if min_education is not None:
+            ranges.append(("education", idx.education_rank(min_education), None))
+        ids = idx.ranges.intersect(sets, ranges)
+        return idx.ids() if ids is None else ids
@@ -0,0 +1,110 @@
+import csv
+import dataclasses
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from src.app.exceptions import ValidationError
+from src.app.utils import normalise_text
+from src.domain.canonical import public_view
+from src.domain.models import Application, CandidateProfile, Interview, JobPosting
+from src.services.job_service import JobService
+from src.services.screening_service import ScreeningService
+from src.storage.repository import DEFAULT_DB, Repository
+
+# CSV columns when no fields are given: the model's fields, whatever the first record happens to hold
+SECTION_FIELDS = {section: [f.name for f in dataclasses.fields(model)] for section, model in (
+    ("jobs", JobPosting), ("candidates", CandidateProfile), ("applications", Application), ("interviews", Interview))}
+RANKING_FIELDS = ["job_id", "rank", "candidate_id", "score", "skills", "experience", "education"]
+
+_WRITE_BUFFER = 1 << 20
+
+
+def _matches(rec: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Every filter must hold: equality (case-insensitive for text), any-of for list filters, membership for list fields."""
+    for field, wanted in filters.items():
+        value = rec.get(field)
+        options = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+        options = {normalise_text(o) if isinstance(o, str) else o for o in options}
+        values = value if isinstance(value, list) else [value]
+        if not any((normalise_text(v) if isinstance(v, str) else v) in options for v in values):
+            return False
+    return True
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, list) and all(not isinstance(v, (dict, list)) for v in value):
+        return ";".join(str(v) for v in value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class ExportService:
+    """
+    Streams collections, job searches and rankings to NDJSON or CSV.
+    Rows are produced by generators and written through a large write buffer,
+    so a collection is read record by record rather than copied; ``fields``
+    projects each row and ``filters`` keeps only matching records.
+    """
+
+    def __init__(self, repo: Repository):
+        self.repo = repo
+        self.jobs = JobService(repo)
+        self.screening = ScreeningService(repo)
+
+    def export_collection(self, section: str, output_path: str, fmt: str = "ndjson",
+                          fields: Optional[List[str]] = None, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if section not in DEFAULT_DB:
+            raise ValidationError(f"Unknown collection: {section}")
+        rows = (public_view(rec) for rec in self.repo.iter_section(section))
+        if filters:
+            rows = (rec for rec in rows if _matches(rec, filters))
+        return self._write(rows, output_path, fmt, fields, SECTION_FIELDS[section])
+
+    def export_search_jobs(self, output_path: str, keyword: str = "", location: str = "", job_type: str = "",
+                           fmt: str = "ndjson", fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        return self._write(self.jobs.search_jobs(keyword, location, job_type), output_path, fmt, fields,
+                           SECTION_FIELDS["jobs"])
+
+    def export_ranking(self, job_id: str, output_path: str, candidate_ids: Optional[List[str]] = None,
+                       fmt: str = "ndjson", fields: Optional[List[str]] = None,
+                       weights: Dict[str, float] = None) -> Dict[str, Any]:
+        """Rank ``candidate_ids`` (default: every candidate) for the job, one row per candidate, best first."""
+        jid = normalise_text(job_id)
+        if candidate_ids is None:
+            candidate_ids = list(self.repo.load()["candidates"])
+        ranked = self.screening.rank_candidates(jid, candidate_ids, weights)
+        rows = ({"job_id": jid, "rank": n, "candidate_id": r["candidate_id"], "score": r["score"], **r["breakdown"]}
+                for n, r in enumerate(ranked, start=1))
+        return self._write(rows, output_path, fmt, fields, RANKING_FIELDS)
+
+    def _write(self, rows: Iterable[Dict[str, Any]], output_path: str, fmt: str,
+               fields: Optional[List[str]], csv_fields: List[str]) -> Dict[str, Any]:
+        """``fields`` projects every row; without it NDJSON rows are written whole and CSV uses ``csv_fields``."""
+        if fmt not in ("ndjson", "csv"):
+            raise ValidationError("Export format must be ndjson or csv.")
+        if fmt == "csv" and not fields:
+            fields = csv_fields
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as f:
+            if fmt == "csv":
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                for rec in rows:
+                    writer.writerow([_csv_cell(rec.get(field)) for field in fields])
+                    count += 1
+            else:
+                for rec in self._project(rows, fields):
+                    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+                    count += 1
+        return {"rows": count, "output": str(output_path)}
+
+    @staticmethod
+    def _project(rows: Iterator[Dict[str, Any]], fields: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        if not fields:
+            return rows
+        return ({field: rec.get(field) for field in fields} for rec in rows)
@@ -0,0 +1,185 @@
+from datetime import datetime
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from src.app.exceptions import ValidationError
+from src.app.utils import (ensure_non_empty, normalise_skills, normalise_text, validate_email,
+                           validate_phone, validate_salary)
+from src.domain.canonical import canonical_candidate, canonical_job
+from src.domain.enums import ApplicationStatus
+from src.domain.models import Application, CandidateProfile, Interview, JobPosting
+
+# Record-level checks and normalisation for bulk imports, mirroring the create_*
+# services. They look at one record only, so they can run in worker processes;
+# anything that needs the store (uniqueness, references) is checked afterwards.
+
+
+def _as_int(record: Dict[str, Any], field: str, default: Any = None) -> int:
+    value = record.get(field, default)
+    if isinstance(value, bool):
+        raise ValidationError(f"{field} must be an integer.")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"{field} must be an integer.")
+
+
+def _id(record: Dict[str, Any], field: str) -> str:
+    ensure_non_empty(field, record.get(field))
+    return normalise_text(str(record[field]))
+
+
+def _skills(record: Dict[str, Any], field: str) -> List[str]:
+    value = record.get(field)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(s, str) for s in value):
+        raise ValidationError(f"{field} must be a list of strings.")
+    return normalise_skills(value)
+
+
+def _audit_trail(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    trail = record.get("audit_trail")
+    if not isinstance(trail, list):
+        raise ValidationError("audit_trail must be a list.")
+    entries = []
+    for e in trail:
+        if not isinstance(e, dict) or not isinstance(e.get("ts"), str) or not isinstance(e.get("action"), str):
+            raise ValidationError("audit_trail entries need a ts and an action string.")
+        try:
+            datetime.fromisoformat(e["ts"])
+        except ValueError:
+            raise ValidationError("audit_trail ts must be ISO format.")
+        details = e.get("details", {})
+        if not isinstance(details, dict):
+            raise ValidationError("audit_trail details must be an object.")
+        entries.append({"ts": e["ts"], "action": e["action"], "details": details})
+    return entries
+
+
+def _clean(value: Any) -> str:
+    return " ".join(str(value).strip().split())
+
+
+def _timestamps(record: Dict[str, Any], out: Dict[str, Any], *fields: str) -> Dict[str, Any]:
+    # keep the source system's timestamps when they are valid ISO strings
+    for f in fields:
+        if isinstance(record.get(f), str):
+            try:
+                datetime.fromisoformat(record[f])
+                out[f] = record[f]
+            except ValueError:
+                raise ValidationError(f"{f} must be ISO format.")
+    return out
+
+
+def clean_job(record: Dict[str, Any]) -> Dict[str, Any]:
+    for f in ("title", "location", "job_type"):
+        ensure_non_empty(f, record.get(f))
+    min_salary, max_salary = _as_int(record, "min_salary"), _as_int(record, "max_salary")
+    validate_salary(min_salary, max_salary)
+    min_exp = _as_int(record, "min_experience_years", 0)
+    if min_exp < 0:
+        raise ValidationError("Experience years cannot be negative.")
+    job = JobPosting(
+        job_id=_id(record, "job_id"),
+        title=_clean(record["title"]),
+        location=_clean(record["location"]),
+        job_type=normalise_text(str(record["job_type"])),
+        min_salary=min_salary,
+        max_salary=max_salary,
+        required_skills=_skills(record, "required_skills"),
+        min_experience_years=min_exp,
+        visa_required=bool(record.get("visa_required", False)),
+    )
+    return canonical_job(_timestamps(record, job.to_dict(), "created_at"))
+
+
+def clean_candidate(record: Dict[str, Any]) -> Dict[str, Any]:
+    ensure_non_empty("name", record.get("name"))
+    validate_email(str(record.get("email") or ""))
+    validate_phone(str(record.get("phone") or ""))
+    ensure_non_empty("location", record.get("location"))
+    years = _as_int(record, "years_experience", 0)
+    if years < 0:
+        raise ValidationError("years_experience cannot be negative.")
+    profile = CandidateProfile(
+        candidate_id=_id(record, "candidate_id"),
+        name=_clean(record["name"]),
+        email=str(record["email"]).strip(),
+        phone=str(record["phone"]).strip(),
+        location=_clean(record["location"]),
+        years_experience=years,
+        skills=_skills(record, "skills"),
+        education_level=normalise_text(str(record.get("education_level") or "unknown")),
+        visa_status=normalise_text(str(record.get("visa_status") or "unknown")),
+    )
+    return canonical_candidate(_timestamps(record, profile.to_dict(), "updated_at"))
+
+
+def clean_application(record: Dict[str, Any]) -> Dict[str, Any]:
+    status = normalise_text(str(record.get("status") or ApplicationStatus.APPLIED.value))
+    if status not in {s.value for s in ApplicationStatus}:
+        raise ValidationError(f"Invalid status: {status}")
+    app = Application(
+        application_id=_id(record, "application_id"),
+        job_id=_id(record, "job_id"),
+        candidate_id=_id(record, "candidate_id"),
+        status=status,
+    )
+    rec = _timestamps(record, app.to_dict(), "created_at", "updated_at")
+    # carried along for the importer, which moves it into the audit log
+    trail = _audit_trail(record) if record.get("audit_trail") is not None else []
+    if trail:
+        rec["audit_trail"] = trail
+    else:
+        rec["audit_trail"] = [{"ts": datetime.utcnow().isoformat(), "action": "created",
+                               "details": {"job_id": app.job_id, "candidate_id": app.candidate_id}}]
+    return rec
+
+
+def clean_interview(record: Dict[str, Any]) -> Dict[str, Any]:
+    ensure_non_empty("interviewer", record.get("interviewer"))
+    try:
+        start = datetime.fromisoformat(str(record.get("scheduled_time")))
+    except ValueError:
+        raise ValidationError("scheduled_time must be ISO format.")
+    duration = _as_int(record, "duration_minutes")
+    if duration <= 0 or duration > 240:
+        raise ValidationError("duration_minutes must be between 1 and 240.")
+    location = record.get("location")
+    return Interview(
+        interview_id=_id(record, "interview_id"),
+        application_id=_id(record, "application_id"),
+        scheduled_time=start.isoformat(),
+        duration_minutes=duration,
+        interviewer=_clean(record["interviewer"]).lower(),
+        location=_clean(location) if location else "online",
+        cancelled=bool(record.get("cancelled", False)),
+    ).to_dict()
+
+
+CLEANERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "jobs": clean_job,
+    "candidates": clean_candidate,
+    "applications": clean_application,
+    "interviews": clean_interview,
+}
+
+
+def clean_chunk(task: Tuple[str, int, List[Any]]) -> List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Clean ``(section, first index, records)``; returns (index, record, None) or (index, None, error) per record."""
+    section, start, records = task
+    cleaner = CLEANERS[section]
+    out = []
+    for idx, record in enumerate(records, start=start):
+        if not isinstance(record, dict):
+            out.append((idx, None, "not an object"))
+            continue
+        try:
+            out.append((idx, cleaner(record), None))
+        except ValidationError as e:
+            out.append((idx, None, str(e)))
+        except (TypeError, ValueError, AttributeError) as e:
+            # a malformed value the checks above did not anticipate still only rejects its own record
+            out.append((idx, None, f"invalid record: {e}"))
+    return out
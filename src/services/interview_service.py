@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from src.app.exceptions import ValidationError, NotFoundError, ConflictError
 from src.app.utils import normalise_text, ensure_non_empty
@@ -40,16 +40,8 @@ class InterviewService:
         end = start + timedelta(minutes=int(duration_minutes))
         interviewer_norm = " ".join(interviewer.strip().split()).lower()
 
-        for itv in db["interviews"].values():
-            if itv.get("cancelled"):
-                continue
-            if itv["interviewer"].lower() != interviewer_norm:
-                continue
-            existing_start = datetime.fromisoformat(itv["scheduled_time"])
-            existing_end = existing_start + timedelta(minutes=int(itv["duration_minutes"]))
-            overlap = (start < existing_end) and (end > existing_start)
-            if overlap:
-                raise ConflictError("Interviewer is double-booked.")
+        if self.repo.overlapping_interview(interviewer_norm, start, end) is not None:
+            raise ConflictError("Interviewer is double-booked.")
 
         interview = Interview(
             interview_id=iid,
@@ -62,10 +54,22 @@ class InterviewService:
         )
         db["interviews"][iid] = interview.to_dict()
 
+        app = dict(app)
         app["status"] = ApplicationStatus.INTERVIEW_SCHEDULED.value
-        app["audit_trail"].append({"ts": datetime.utcnow().isoformat(), "action": "interview_scheduled", "details": {"interview_id": iid}})
         app["updated_at"] = datetime.utcnow().isoformat()
         db["applications"][aid] = app
+        self.repo.append_audit(aid, "interview_scheduled", {"interview_id": iid})
 
         self.repo.save(db)
         return interview.to_dict()
+
+    def interviewer_bookings(self, interviewer: str, from_iso: str, to_iso: str) -> List[Dict[str, Any]]:
+        ensure_non_empty("interviewer", interviewer)
+        try:
+            start = datetime.fromisoformat(from_iso)
+            end = datetime.fromisoformat(to_iso)
+        except ValueError:
+            raise ValidationError("Range bounds must be ISO format.")
+        if end <= start:
+            raise ValidationError("Range end must be after range start.")
+        return self.repo.interviewer_bookings(" ".join(interviewer.strip().split()).lower(), start, end)
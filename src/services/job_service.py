@@ -1,9 +1,17 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple
 from src.app.exceptions import ValidationError, NotFoundError
 from src.app.utils import ensure_non_empty, validate_salary, ensure_unique_id, normalise_text, normalise_skills
+from src.domain.canonical import canonical_job, public_view
 from src.domain.models import JobPosting
+from src.storage.indexes import JobSearchIndex, JobTextIndex
 from src.storage.repository import Repository
 
+EDITABLE_FIELDS = {"title", "location", "job_type", "min_salary", "max_salary",
+                   "required_skills", "min_experience_years", "visa_required"}
+
+# (indexed numeric field, lower bound, upper bound), bounds inclusive, None = open
+RangeFilter = Tuple[str, Optional[float], Optional[float]]
+
 class JobService:
     def __init__(self, repo: Repository):
         self.repo = repo
@@ -34,9 +42,10 @@ class JobService:
             min_experience_years=int(min_experience_years),
             visa_required=bool(visa_required),
         )
-        db["jobs"][job.job_id] = job.to_dict()
+        record = canonical_job(job.to_dict())
+        db["jobs"][job.job_id] = record
         self.repo.save(db)
-        return job.to_dict()
+        return public_view(record)
 
     def edit_job_posting(self, job_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         db = self.repo.load()
@@ -44,11 +53,10 @@ class JobService:
         job = db["jobs"].get(job_id_norm)
         if not job:
             raise NotFoundError("Job not found.")
+        job = dict(job)
 
-        allowed = {"title", "location", "job_type", "min_salary", "max_salary",
-                   "required_skills", "min_experience_years", "visa_required"}
         for k in updates.keys():
-            if k not in allowed:
+            if k not in EDITABLE_FIELDS:
                 raise ValidationError(f"Field not editable: {k}")
 
         if "title" in updates:
@@ -81,23 +89,87 @@ class JobService:
         if "visa_required" in updates:
             job["visa_required"] = bool(updates["visa_required"])
 
+        job = canonical_job(job)
         db["jobs"][job_id_norm] = job
         self.repo.save(db)
-        return job
-
-    def search_jobs(self, keyword: str = "", location: str = "", job_type: str = "") -> List[Dict[str, Any]]:
-        db = self.repo.load()
-        k = normalise_text(keyword)
-        loc = normalise_text(location)
-        jt = normalise_text(job_type)
-
-        results = []
-        for job in db["jobs"].values():
-            title_match = (not k) or (k in normalise_text(job["title"]))
-            loc_match = (not loc) or (loc in normalise_text(job["location"]))
-            type_match = (not jt) or (jt == normalise_text(job["job_type"]))
-            if title_match and loc_match and type_match:
-                results.append(job)
-
-        results.sort(key=lambda j: (normalise_text(j["title"]), normalise_text(j["location"])))
-        return results
+        return public_view(job)
+
+    def _matching_ids(self, keyword: str, location: str, job_type: str, ranges: List[RangeFilter]) -> Optional[Set[str]]:
+        """Ids matching the filters, or None when there are none (every job matches)."""
+        idx = self.repo.index("job_search", JobSearchIndex.build)
+        k, loc, jt = normalise_text(keyword), normalise_text(location), normalise_text(job_type)
+        sets = []
+        if jt:
+            sets.append(idx.with_type(jt))
+        if loc:
+            sets.append(idx.with_location(loc))
+        if k:
+            sets.append(idx.with_title(k))
+        return idx.ranges.intersect(sets, ranges)
+
+    @staticmethod
+    def _ranges(salary_min: Optional[float], salary_max: Optional[float],
+                min_experience: Optional[float], max_experience: Optional[float]) -> List[RangeFilter]:
+        """
+        Range filters on the indexed numeric columns. A job's salary band overlaps
+        [salary_min, salary_max] when its max_salary >= salary_min and its
+        min_salary <= salary_max; experience bounds apply to min_experience_years.
+        """
+        for name, value in (("salary_min", salary_min), ("salary_max", salary_max),
+                            ("min_experience", min_experience), ("max_experience", max_experience)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValidationError(f"{name} must be a number.")
+        if salary_min is not None and salary_max is not None and salary_min > salary_max:
+            raise ValidationError("salary_min cannot exceed salary_max.")
+        if min_experience is not None and max_experience is not None and min_experience > max_experience:
+            raise ValidationError("min_experience cannot exceed max_experience.")
+        ranges: List[RangeFilter] = []
+        if salary_min is not None:
+            ranges.append(("max_salary", salary_min, None))
+        if salary_max is not None:
+            ranges.append(("min_salary", None, salary_max))
+        if min_experience is not None or max_experience is not None:
+            ranges.append(("min_experience_years", min_experience, max_experience))
+        return ranges
+
+    def search_jobs(self, keyword: str = "", location: str = "", job_type: str = "",
+                    salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+                    min_experience: Optional[float] = None, max_experience: Optional[float] = None) -> List[Dict[str, Any]]:
+        jobs = self.repo.load()["jobs"]
+        idx = self.repo.index("job_search", JobSearchIndex.build)
+        ranges = self._ranges(salary_min, salary_max, min_experience, max_experience)
+        return [public_view(jobs[jid]) for jid in idx.page(self._matching_ids(keyword, location, job_type, ranges), 0, None)]
+
+    def search_jobs_faceted(self, keyword: str = "", location: str = "", job_type: str = "",
+                            offset: int = 0, limit: int = 20,
+                            salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+                            min_experience: Optional[float] = None, max_experience: Optional[float] = None) -> Dict[str, Any]:
+        """One page of search_jobs results plus the total and jobs-per-location/job_type counts over all matches."""
+        if offset < 0:
+            raise ValidationError("offset cannot be negative.")
+        if limit <= 0:
+            raise ValidationError("limit must be positive.")
+        jobs = self.repo.load()["jobs"]
+        idx = self.repo.index("job_search", JobSearchIndex.build)
+        ranges = self._ranges(salary_min, salary_max, min_experience, max_experience)
+        ids = self._matching_ids(keyword, location, job_type, ranges)
+        return {
+            "total": len(idx) if ids is None else len(ids),
+            "offset": offset,
+            "limit": limit,
+            "results": [public_view(jobs[jid]) for jid in idx.page(ids, offset, limit)],
+            "facets": idx.facets(ids),
+        }
+
+    def search_jobs_text(self, query: str, k: int = 10, prefix: bool = True, fuzzy: bool = False) -> List[Dict[str, Any]]:
+        """
+        Jobs ranked by BM25 relevance of ``query`` to title, location and required skills, best ``k`` first.
+        ``prefix`` lets "pyth" match "python"; ``fuzzy`` lets a token with no match fall back to the
+        closest spellings by shared trigrams. Each job carries its relevance as ``score``.
+        """
+        ensure_non_empty("query", query)
+        if k <= 0:
+            raise ValidationError("k must be positive.")
+        jobs = self.repo.load()["jobs"]
+        hits = self.repo.index("job_text", JobTextIndex.build).search(query, k, prefix, fuzzy)
+        return [dict(public_view(jobs[jid]), score=round(score, 4)) for jid, score in hits]
@@ -0,0 +1,221 @@
+import heapq
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Set
+
+from src.domain.canonical import norm_skills, norm_term
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the engine falls back to Python int bitsets
+    np = None
+
+EDU_SCORES = {"phd": 1.0, "masters": 0.8, "bachelors": 0.6, "diploma": 0.4, "unknown": 0.2}
+DEFAULT_WEIGHTS = {"skills": 0.5, "experience": 0.3, "education": 0.2}
+NO_SPONSORSHIP_STATUSES = {"no_sponsorship", "citizen", "pr", "settled"}
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class RankingEngine:
+    """
+    Column store of the candidate pool for scoring many candidates at once.
+    Skills are interned to integer ids and each candidate's skills packed into
+    a bitmask (a uint64 matrix when NumPy is installed); years of experience,
+    education score and visa eligibility sit in parallel arrays. Rows follow
+    the candidates collection through its listener and the NumPy arrays are
+    rebuilt lazily on the first query after a change.
+    """
+
+    def __init__(self):
+        self._skill_ids: Dict[str, int] = {}
+        self._row: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = []
+        self._masks: List[int] = []
+        self._exp: List[int] = []
+        self._edu: List[float] = []
+        self._visa_ok: List[bool] = []
+        self._free: List[int] = []
+        self._arrays = None
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "RankingEngine":
+        engine = cls()
+        for cid, cand in db["candidates"].items():
+            engine.update(cid, None, cand)
+        if hasattr(db["candidates"], "listeners"):
+            db["candidates"].listeners.append(engine.update)
+        return engine
+
+    def _intern(self, skill: str) -> int:
+        sid = self._skill_ids.get(skill)
+        if sid is None:
+            sid = self._skill_ids[skill] = len(self._skill_ids)
+        return sid
+
+    def update(self, cid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        self._arrays = None
+        row = self._row.get(cid)
+        if new is None:
+            if row is not None:
+                del self._row[cid]
+                self.ids[row] = None
+                self._masks[row] = 0
+                self._free.append(row)
+            return
+
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+            else:
+                row = len(self.ids)
+                self.ids.append(None)
+                self._masks.append(0)
+                self._exp.append(0)
+                self._edu.append(0.0)
+                self._visa_ok.append(False)
+            self._row[cid] = row
+        mask = 0
+        for skill in norm_skills(new, "skills"):
+            mask |= 1 << self._intern(skill)
+        self.ids[row] = cid
+        self._masks[row] = mask
+        self._exp[row] = _as_int(new.get("years_experience", 0))
+        self._edu[row] = EDU_SCORES.get(norm_term(new, "education_level", "unknown"), 0.2)
+        self._visa_ok[row] = norm_term(new, "visa_status", "unknown") in NO_SPONSORSHIP_STATUSES
+
+    def _materialise(self):
+        if self._arrays is None:
+            words = max(1, (len(self._skill_ids) + 63) // 64)
+            packed = b"".join(m.to_bytes(words * 8, "little") for m in self._masks)
+            self._arrays = (
+                np.frombuffer(packed, dtype="<u8").reshape(len(self._masks), words),
+                np.array(self._exp, dtype=np.int64),
+                np.array(self._edu, dtype=np.float64),
+                np.array(self._visa_ok, dtype=bool),
+                np.array([cid is not None for cid in self.ids], dtype=bool),
+            )
+        return self._arrays
+
+    def _required_ids(self, req_skills: Set[str]) -> Optional[List[int]]:
+        """Skill ids of the required skills, or None if some required skill is held by nobody."""
+        if any(s not in self._skill_ids for s in req_skills):
+            return None
+        return [self._skill_ids[s] for s in req_skills]
+
+    def _has_bit(self, skills, rows, sid: int):
+        return ((skills[rows, sid >> 6] >> np.uint64(sid & 63)) & np.uint64(1)).astype(bool)
+
+    def _score(self, rows: Sequence[int], req_skills: Set[str], weights: Dict[str, float]):
+        """Per-row (total, skills, experience, education) scores aligned with ``rows``: arrays with NumPy, else lists."""
+        if np is not None:
+            skills, exp, edu, _, _ = self._materialise()
+            idx = np.array(rows, dtype=np.intp)
+            if req_skills:
+                matched = np.zeros(len(idx), dtype=np.int64)
+                for sid in (self._skill_ids[s] for s in req_skills if s in self._skill_ids):
+                    matched += self._has_bit(skills, idx, sid)
+                skills_score = matched / max(1, len(req_skills))
+            else:
+                skills_score = np.ones(len(idx))
+            years = exp[idx]
+            exp_score = np.clip(np.where(years >= 10, 1.0, years / 10.0), 0.0, 1.0)
+            edu_score = edu[idx]
+            total = (weights["skills"] * skills_score) + (weights["experience"] * exp_score) + (weights["education"] * edu_score)
+            return total, skills_score, exp_score, edu_score
+
+        job_mask = 0
+        for s in req_skills:
+            if s in self._skill_ids:
+                job_mask |= 1 << self._skill_ids[s]
+        totals, skills_scores, exp_scores, edu_scores = [], [], [], []
+        for row in rows:
+            skills_score = 1.0 if not req_skills else (bin(self._masks[row] & job_mask).count("1") / max(1, len(req_skills)))
+            years = self._exp[row]
+            exp_score = min(max(1.0 if years >= 10 else years / 10.0, 0.0), 1.0)
+            edu_score = self._edu[row]
+            totals.append((weights["skills"] * skills_score) + (weights["experience"] * exp_score) + (weights["education"] * edu_score))
+            skills_scores.append(skills_score)
+            exp_scores.append(exp_score)
+            edu_scores.append(edu_score)
+        return totals, skills_scores, exp_scores, edu_scores
+
+    def eligible_rows(self, job: Dict[str, Any]) -> Sequence[int]:
+        """Rows passing the filter_eligibility rules: all required skills, min experience, visa (an array with NumPy)."""
+        required = self._required_ids(set(norm_skills(job, "required_skills")))
+        if required is None:
+            return []
+        min_exp = int(job.get("min_experience_years", 0))
+        visa_required = bool(job.get("visa_required", False))
+
+        if np is not None:
+            skills, exp, _, visa_ok, alive = self._materialise()
+            ok = alive & (exp >= min_exp)
+            if visa_required:
+                ok &= visa_ok
+            all_rows = np.arange(len(self.ids))
+            for sid in required:
+                ok &= self._has_bit(skills, all_rows, sid)
+            return np.flatnonzero(ok)
+
+        job_mask = 0
+        for sid in required:
+            job_mask |= 1 << sid
+        return [row for row, cid in enumerate(self.ids)
+                if cid is not None and self._exp[row] >= min_exp
+                and (self._masks[row] & job_mask) == job_mask
+                and (self._visa_ok[row] or not visa_required)]
+
+    def _results(self, rows: Sequence[int], order: Iterable[int], scores) -> List[Dict[str, Any]]:
+        # only the rows in ``order`` become Python objects, each array converted in one call
+        if np is not None:
+            order = np.asarray(order, dtype=np.intp)
+            picked = [np.asarray(rows, dtype=np.intp)[order].tolist()] + [a[order].tolist() for a in scores]
+        else:
+            order = list(order)
+            picked = [[a[i] for i in order] for a in (rows,) + tuple(scores)]
+        return [{
+            "candidate_id": self.ids[row],
+            "score": round(total, 4),
+            "breakdown": {"skills": round(skill, 4), "experience": round(exp, 4), "education": round(edu, 4)}
+        } for row, total, skill, exp, edu in zip(*picked)]
+
+    def rank(self, job: Dict[str, Any], candidate_ids: Sequence[str],
+             weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """Score the given (normalised) candidate ids against ``job``, best first; unknown ids are skipped."""
+        weights = weights or DEFAULT_WEIGHTS
+        req_skills = set(norm_skills(job, "required_skills"))
+        rows = [self._row[cid] for cid in candidate_ids if cid in self._row]
+        scores = self._score(rows, req_skills, weights)
+        if np is not None:
+            order = np.argsort(-scores[0], kind="stable")
+        else:
+            order = sorted(range(len(rows)), key=scores[0].__getitem__, reverse=True)
+        return self._results(rows, order, scores)
+
+    def top_k(self, job: Dict[str, Any], k: int, weights: Optional[Dict[str, float]] = None,
+              eligible_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        Best ``k`` of the whole pool (ties by candidate id). With NumPy the
+        winners are picked on the score array (argpartition) and only they are
+        sorted; otherwise with a size-k heap.
+        """
+        weights = weights or DEFAULT_WEIGHTS
+        req_skills = set(norm_skills(job, "required_skills"))
+        if eligible_only:
+            rows = self.eligible_rows(job)
+        else:
+            rows = [row for row, cid in enumerate(self.ids) if cid is not None]
+        scores = self._score(rows, req_skills, weights)
+        totals = scores[0]
+        if np is not None and 0 < k < len(rows):
+            # everything scoring at least the k-th best, so ties at the cut are settled by id below
+            cutoff = totals[np.argpartition(-totals, k - 1)[k - 1]]
+            pool = np.flatnonzero(totals >= cutoff).tolist()
+        else:
+            pool = range(len(rows))
+        order = heapq.nsmallest(k, pool, key=lambda i: (-totals[i], self.ids[rows[i]]))
+        return self._results(rows, order, scores)
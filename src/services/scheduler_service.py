@@ -0,0 +1,106 @@
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Tuple
+
+from src.app.exceptions import ValidationError
+from src.app.utils import ensure_non_empty, normalise_text
+from src.domain.enums import ApplicationStatus
+from src.services.application_service import ApplicationService
+from src.services.interview_service import InterviewService
+from src.storage.repository import Repository
+
+
+class SchedulerService:
+    """
+    Batch interview scheduling for a job.
+    Interviewer availability windows are cut into back-to-back slots that skip
+    existing bookings, slots from all interviewers are merged earliest-first,
+    and each SHORTLISTED application takes the next free slot. All interviews
+    and status transitions are committed in a single save.
+    """
+
+    def __init__(self, repo: Repository):
+        self.repo = repo
+        self.apps = ApplicationService(repo)
+        self.interviews = InterviewService(repo)
+
+    def schedule_shortlisted(self, job_id: str, availability: Dict[str, List[Tuple[str, str]]],
+                             duration_minutes: int, location: str = "online") -> Dict[str, Any]:
+        if duration_minutes <= 0 or duration_minutes > 240:
+            raise ValidationError("duration_minutes must be between 1 and 240.")
+        windows = self._parse_availability(availability)
+        slot = timedelta(minutes=int(duration_minutes))
+
+        report = {"scheduled": [], "unscheduled": []}
+        with self.repo.transaction() as db:
+            shortlisted = [a["application_id"] for a in self.apps.list_applications_for_job(job_id)
+                           if a["status"] == ApplicationStatus.SHORTLISTED.value]
+            slots = heapq.merge(*[self._free_slots(name, spans, slot) for name, spans in windows.items()])
+
+            for aid in shortlisted:
+                nxt = next(slots, None)
+                if nxt is None:
+                    report["unscheduled"].append(aid)
+                    continue
+                start, interviewer = nxt
+                itv = self.interviews.schedule_interview(
+                    self._interview_id(db, aid), aid, start.isoformat(), duration_minutes, interviewer, location)
+                report["scheduled"].append({
+                    "application_id": aid,
+                    "interview_id": itv["interview_id"],
+                    "interviewer": itv["interviewer"],
+                    "scheduled_time": itv["scheduled_time"],
+                })
+            self.repo.save(db)
+        return report
+
+    def _parse_availability(self, availability: Dict[str, List[Tuple[str, str]]]) -> Dict[str, List[Tuple[datetime, datetime]]]:
+        windows: Dict[str, List[Tuple[datetime, datetime]]] = {}
+        for interviewer, spans in (availability or {}).items():
+            ensure_non_empty("interviewer", interviewer)
+            name = " ".join(interviewer.strip().split()).lower()
+            for start_iso, end_iso in spans:
+                try:
+                    start, end = datetime.fromisoformat(start_iso), datetime.fromisoformat(end_iso)
+                except ValueError:
+                    raise ValidationError("Availability windows must be ISO format.")
+                if end <= start:
+                    raise ValidationError("Availability window must end after it starts.")
+                windows.setdefault(name, []).append((start, end))
+        if not windows:
+            raise ValidationError("At least one availability window is required.")
+
+        # merge overlapping windows so one interviewer is never offered two overlapping slots
+        merged: Dict[str, List[Tuple[datetime, datetime]]] = {}
+        for name, spans in windows.items():
+            out: List[Tuple[datetime, datetime]] = []
+            for start, end in sorted(spans):
+                if out and start <= out[-1][1]:
+                    out[-1] = (out[-1][0], max(out[-1][1], end))
+                else:
+                    out.append((start, end))
+            merged[name] = out
+        return merged
+
+    def _free_slots(self, interviewer: str, spans: List[Tuple[datetime, datetime]],
+                    slot: timedelta) -> Iterator[Tuple[datetime, str]]:
+        for window_start, window_end in spans:
+            t = window_start
+            for booking in self.repo.interviewer_bookings(interviewer, window_start, window_end):
+                booked_start = datetime.fromisoformat(booking["scheduled_time"])
+                while t + slot <= booked_start:
+                    yield t, interviewer
+                    t += slot
+                t = max(t, booked_start + timedelta(minutes=int(booking["duration_minutes"])))
+            while t + slot <= window_end:
+                yield t, interviewer
+                t += slot
+
+    @staticmethod
+    def _interview_id(db: Dict[str, Any], application_id: str) -> str:
+        iid = normalise_text(f"int-{application_id}")
+        n = 1
+        while iid in db["interviews"]:
+            n += 1
+            iid = normalise_text(f"int-{application_id}-{n}")
+        return iid
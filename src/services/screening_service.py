@@ -1,12 +1,36 @@
-from typing import Dict, Any, List, Tuple
-from src.app.exceptions import NotFoundError
+from typing import Dict, Any, Hashable, List, Optional, Tuple
+from src.app.exceptions import NotFoundError, ValidationError
 from src.app.utils import normalise_text
+from src.domain.canonical import norm_skills, norm_term
+from src.services.ranking_engine import DEFAULT_WEIGHTS, EDU_SCORES, NO_SPONSORSHIP_STATUSES, RankingEngine
+from src.services.result_cache import ResultCache
+from src.storage.indexes import JobSkillIndex, RecordVersions
 from src.storage.repository import Repository
 
+
+def _copies(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # cached results are shared between calls, so callers get their own dicts (breakdowns included)
+    return [{k: dict(v) if isinstance(v, dict) else v for k, v in r.items()} for r in results]
+
+
 class ScreeningService:
     def __init__(self, repo: Repository):
         self.repo = repo
 
+    def _results_cache(self) -> ResultCache:
+        # lives with the loaded db, so a reload or rollback starts it afresh
+        return self.repo.index("screening_results", lambda db: ResultCache())
+
+    def _cache_key(self, kind: str, jid: str, cids: List[str],
+                   weights: Optional[Dict[str, float]] = None) -> Hashable:
+        versions = self.repo.index("record_versions", RecordVersions.build)
+        return (kind, jid, versions.version("jobs", jid),
+                tuple((cid, versions.version("candidates", cid)) for cid in cids),
+                tuple(sorted(weights.items())) if weights else None)
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self._results_cache().stats()
+
     def filter_eligibility(self, job_id: str, candidate_ids: List[str]) -> List[Dict[str, Any]]:
         db = self.repo.load()
         jid = normalise_text(job_id)
@@ -14,23 +38,28 @@ class ScreeningService:
         if not job:
             raise NotFoundError("Job not found.")
 
-        req_skills = set([normalise_text(s) for s in job.get("required_skills", [])])
+        cids = [normalise_text(c) for c in candidate_ids]
+        key = self._cache_key("eligibility", jid, cids)
+        cached = self._results_cache().get(key)
+        if cached is not None:
+            return _copies(cached)
+
+        req_skills = set(norm_skills(job, "required_skills"))
         min_exp = int(job.get("min_experience_years", 0))
         visa_required = bool(job.get("visa_required", False))
 
         out = []
-        for cid_raw in candidate_ids:
-            cid = normalise_text(cid_raw)
+        for cid in cids:
             cand = db["candidates"].get(cid)
             if not cand:
                 continue
 
-            cand_skills = set([normalise_text(s) for s in cand.get("skills", [])])
+            cand_skills = set(norm_skills(cand, "skills"))
             exp_ok = int(cand.get("years_experience", 0)) >= min_exp
             skills_ok = req_skills.issubset(cand_skills) if req_skills else True
 
             visa_ok = True
-            visa_status = normalise_text(cand.get("visa_status", "unknown"))
+            visa_status = norm_term(cand, "visa_status", "unknown")
             if visa_required:
                 visa_ok = (visa_status in {"no_sponsorship", "citizen", "pr", "settled"})
 
@@ -45,7 +74,8 @@ class ScreeningService:
                 if not visa_ok:
                     reasons.append("visa_mismatch")
                 out.append({"candidate_id": cid, "eligible": False, "reason": ",".join(reasons)})
-        return out
+        self._results_cache().put(key, out)
+        return _copies(out)
 
     def rank_candidates(self, job_id: str, candidate_ids: List[str],
                         weights: Dict[str, float] = None) -> List[Dict[str, Any]]:
@@ -55,34 +85,66 @@ class ScreeningService:
         if not job:
             raise NotFoundError("Job not found.")
 
-        weights = weights or {"skills": 0.5, "experience": 0.3, "education": 0.2}
-        req_skills = set([normalise_text(s) for s in job.get("required_skills", [])])
-        edu_map = {"phd": 1.0, "masters": 0.8, "bachelors": 0.6, "diploma": 0.4, "unknown": 0.2}
-
-        scored: List[Tuple[float, Dict[str, Any]]] = []
-        for cid_raw in candidate_ids:
-            cid = normalise_text(cid_raw)
-            cand = db["candidates"].get(cid)
-            if not cand:
-                continue
+        weights = weights or DEFAULT_WEIGHTS
+        cids = [normalise_text(c) for c in candidate_ids]
+        key = self._cache_key("rank", jid, cids, weights)
+        cached = self._results_cache().get(key)
+        if cached is not None:
+            return _copies(cached)
 
-            cand_skills = set([normalise_text(s) for s in cand.get("skills", [])])
-            skills_score = 1.0 if not req_skills else (len(req_skills.intersection(cand_skills)) / max(1, len(req_skills)))
-
-            exp = int(cand.get("years_experience", 0))
-            exp_score = 1.0 if exp >= 10 else exp / 10.0
-            exp_score = min(max(exp_score, 0.0), 1.0)
-
-            edu = normalise_text(cand.get("education_level", "unknown"))
-            edu_score = edu_map.get(edu, 0.2)
+        engine = self.repo.index("ranking_engine", RankingEngine.build)
+        ranked = engine.rank(job, cids, weights)
+        self._results_cache().put(key, ranked)
+        return _copies(ranked)
 
+    def top_k_candidates(self, job_id: str, k: int, eligible_only: bool = True,
+                         weights: Dict[str, float] = None) -> List[Dict[str, Any]]:
+        db = self.repo.load()
+        jid = normalise_text(job_id)
+        job = db["jobs"].get(jid)
+        if not job:
+            raise NotFoundError("Job not found.")
+        if k <= 0:
+            raise ValidationError("k must be positive.")
+
+        engine = self.repo.index("ranking_engine", RankingEngine.build)
+        return engine.top_k(job, k, weights or DEFAULT_WEIGHTS, eligible_only=eligible_only)
+
+    def match_jobs_for_candidate(self, candidate_id: str, eligible_only: bool = True,
+                                 weights: Dict[str, float] = None) -> List[Dict[str, Any]]:
+        """
+        Jobs the candidate fits, best first. Only jobs sharing at least one skill
+        with the candidate (or requiring none) are looked at, via the job skill index.
+        """
+        db = self.repo.load()
+        cid = normalise_text(candidate_id)
+        cand = db["candidates"].get(cid)
+        if not cand:
+            raise NotFoundError("Candidate not found.")
+
+        weights = weights or DEFAULT_WEIGHTS
+        cand_skills = set(norm_skills(cand, "skills"))
+        years = int(cand.get("years_experience", 0))
+        visa_ok = norm_term(cand, "visa_status", "unknown") in NO_SPONSORSHIP_STATUSES
+        exp_score = min(max(1.0 if years >= 10 else years / 10.0, 0.0), 1.0)
+        edu_score = EDU_SCORES.get(norm_term(cand, "education_level", "unknown"), 0.2)
+
+        index = self.repo.index("job_skills", JobSkillIndex.build)
+        scored: List[Tuple[Tuple, Dict[str, Any]]] = []
+        for jid, matched in index.matched_counts(cand_skills).items():
+            req_skills, min_exp, visa_required = index.requirements(jid)
+            eligible = matched == len(req_skills) and years >= min_exp and (visa_ok or not visa_required)
+            if eligible_only and not eligible:
+                continue
+            skills_score = 1.0 if not req_skills else matched / len(req_skills)
             total = (weights["skills"] * skills_score) + (weights["experience"] * exp_score) + (weights["education"] * edu_score)
-
-            scored.append((total, {
-                "candidate_id": cid,
+            # equal scores: prefer the more specific posting (more required skills matched)
+            scored.append(((-total, -len(req_skills), jid), {
+                "job_id": jid,
+                "eligible": eligible,
                 "score": round(total, 4),
                 "breakdown": {"skills": round(skills_score, 4), "experience": round(exp_score, 4), "education": round(edu_score, 4)}
             }))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
+        scored.sort(key=lambda x: x[0])
         return [item for _, item in scored]
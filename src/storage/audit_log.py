@@ -0,0 +1,112 @@
+import bisect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# one log object per file, shared by every Repository over the same store
+_logs: Dict[str, "AuditLog"] = {}
+_logs_lock = threading.Lock()
+
+
+def audit_log_for(path: Path) -> "AuditLog":
+    key = os.path.abspath(path)
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = _logs[key] = AuditLog(Path(path))
+        return log
+
+
+class AuditLog:
+    """
+    Append-only JSON Lines file of audit entries
+    ``{"application_id", "ts", "action", "details"}``. An in-memory index maps
+    application id -> (timestamps, byte offsets) sorted by timestamp, so one
+    application's history (or a time range of it) is read straight from its
+    offsets. Entries appended by other processes are indexed incrementally.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._ino: Optional[int] = None
+        self._end = 0
+        self._index: Dict[str, Tuple[List[str], List[int]]] = {}
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._ino, self._end, self._index = None, 0, {}
+            return
+        if st.st_ino != self._ino or st.st_size < self._end:
+            # replaced or truncated underneath us: index from scratch
+            self._ino, self._end, self._index = st.st_ino, 0, {}
+        if st.st_size == self._end:
+            return
+        with self.path.open("rb") as f:
+            f.seek(self._end)
+            offset = self._end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn tail from a crash mid-append; append() cuts it off
+                try:
+                    entry = json.loads(line)
+                    if isinstance(entry["application_id"], str) and isinstance(entry["ts"], str):
+                        self._add(entry["application_id"], entry["ts"], offset)
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                    pass
+                offset += len(line)
+            self._end = offset
+
+    def _add(self, application_id: str, ts: str, offset: int) -> None:
+        stamps, offsets = self._index.setdefault(application_id, ([], []))
+        i = bisect.bisect_right(stamps, ts)
+        stamps.insert(i, ts)
+        offsets.insert(i, offset)
+
+    def append(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Append a batch oldest first; the whole batch is checked before anything is written."""
+        entries = list(entries)
+        for e in entries:
+            if not (isinstance(e.get("application_id"), str) and isinstance(e.get("ts"), str)
+                    and isinstance(e.get("action"), str) and isinstance(e.get("details", {}), dict)):
+                raise ValueError(f"Malformed audit entry: {e!r}")
+        entries.sort(key=lambda e: e["ts"])
+        lines = [(e, (json.dumps(e, separators=(",", ":")) + "\n").encode("utf-8")) for e in entries]
+        if not lines:
+            return
+        with self._lock:
+            self._refresh()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size > self._end:
+                os.truncate(self.path, self._end)
+            with self.path.open("ab") as f:
+                for entry, line in lines:
+                    self._add(entry["application_id"], entry["ts"], self._end)
+                    f.write(line)
+                    self._end += len(line)
+            self._ino = os.stat(self.path).st_ino
+
+    def query(self, application_id: str, since: Optional[str] = None, until: Optional[str] = None,
+              offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Entries of one application with since <= ts < until, oldest first, paged; plus how many match in total."""
+        with self._lock:
+            self._refresh()
+            stamps, offsets = self._index.get(application_id, ([], []))
+            lo = bisect.bisect_left(stamps, since) if since else 0
+            hi = bisect.bisect_left(stamps, until) if until else len(stamps)
+            hi = max(lo, hi)
+            start = lo + offset
+            stop = hi if limit is None else min(hi, start + limit)
+            positions = offsets[start:stop]
+        entries = []
+        if positions:
+            with self.path.open("rb") as f:
+                for pos in positions:
+                    f.seek(pos)
+                    entry = json.loads(f.readline())
+                    entries.append({"ts": entry["ts"], "action": entry["action"], "details": entry.get("details") or {}})
+        return entries, hi - lo
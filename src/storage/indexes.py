@@ -0,0 +1,687 @@
+import bisect
+import heapq
+import itertools
+import math
+import re
+from datetime import datetime, timezone
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Set, Tuple
+from src.app.utils import normalise_text
+from src.domain.canonical import norm_field, norm_skills, norm_term
+from src.domain.enums import ApplicationStatus
+
+
+def _listen(collection, listener) -> None:
+    # plain dicts (e.g. a db handed to save() by a script) cannot notify; the index is rebuilt per load then
+    if hasattr(collection, "listeners"):
+        collection.listeners.append(listener)
+
+
+class EmailIndex:
+    """Normalised email -> candidate ids over db["candidates"]."""
+
+    def __init__(self):
+        self._owners: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "EmailIndex":
+        idx = cls()
+        for cid, cand in db["candidates"].items():
+            idx.update(cid, None, cand)
+        _listen(db["candidates"], idx.update)
+        return idx
+
+    def update(self, cid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        if old is not None:
+            _unlink(self._owners, norm_field(old, "email"), cid)
+        if new is not None:
+            self._owners.setdefault(norm_field(new, "email"), set()).add(cid)
+
+    def owners(self, email: str) -> Set[str]:
+        return self._owners.get(normalise_text(email), set())
+
+
+class ApplicationIndex:
+    """
+    Secondary indexes over db["applications"]:
+    (job_id, candidate_id) -> ids of non-withdrawn applications, and job_id /
+    candidate_id -> application ids (insertion ordered).
+    """
+
+    def __init__(self):
+        self._active: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._by_job: Dict[str, Dict[str, None]] = {}
+        self._by_candidate: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "ApplicationIndex":
+        idx = cls()
+        for aid, app in db["applications"].items():
+            idx.update(aid, None, app)
+        _listen(db["applications"], idx.update)
+        return idx
+
+    @staticmethod
+    def _drop(index: Dict, key, aid: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(aid, None)
+            if not ids:
+                del index[key]
+
+    def update(self, aid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        old = old or {}
+        new = new or {}
+        old_pair = (old.get("job_id"), old.get("candidate_id"))
+        new_pair = (new.get("job_id"), new.get("candidate_id"))
+        if old:
+            self._drop(self._active, old_pair, aid)
+            # leave unchanged postings alone so per-job listings keep their insertion order
+            if old_pair[0] != new_pair[0] or not new:
+                self._drop(self._by_job, old_pair[0], aid)
+            if old_pair[1] != new_pair[1] or not new:
+                self._drop(self._by_candidate, old_pair[1], aid)
+        if new:
+            if new.get("status") != ApplicationStatus.WITHDRAWN.value:
+                self._active.setdefault(new_pair, {})[aid] = None
+            self._by_job.setdefault(new_pair[0], {})[aid] = None
+            self._by_candidate.setdefault(new_pair[1], {})[aid] = None
+
+    def active(self, job_id: str, candidate_id: str) -> List[str]:
+        return list(self._active.get((job_id, candidate_id), ()))
+
+    def for_job(self, job_id: str) -> List[str]:
+        return list(self._by_job.get(job_id, ()))
+
+    def for_candidate(self, candidate_id: str) -> List[str]:
+        return list(self._by_candidate.get(candidate_id, ()))
+
+
+def to_epoch(dt: datetime) -> float:
+    # naive timestamps are stored as-is by the services, so read them as UTC to avoid DST jumps
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class InterviewerSchedule:
+    """
+    Per-interviewer bookings over db["interviews"], each a list of
+    (start_epoch, end_epoch, interview_id) kept sorted for bisect. Cancelled
+    interviews are left out. Tracking the longest booking per interviewer
+    bounds how far before a window an overlapping booking can start.
+    """
+
+    def __init__(self):
+        self._bookings: Dict[str, List[Tuple[float, float, str]]] = {}
+        self._longest: Dict[str, float] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "InterviewerSchedule":
+        idx = cls()
+        for iid, itv in db["interviews"].items():
+            idx.update(iid, None, itv)
+        _listen(db["interviews"], idx.update)
+        return idx
+
+    @staticmethod
+    def _entry(iid: str, itv: Dict[str, Any]) -> Optional[Tuple[str, Tuple[float, float, str]]]:
+        if itv.get("cancelled"):
+            return None
+        try:
+            start = to_epoch(datetime.fromisoformat(itv["scheduled_time"]))
+            end = start + int(itv["duration_minutes"]) * 60
+            return str(itv["interviewer"]).lower(), (start, end, iid)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def update(self, iid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        if old is not None:
+            entry = self._entry(iid, old)
+            if entry is not None:
+                bookings = self._bookings.get(entry[0], [])
+                i = bisect.bisect_left(bookings, entry[1])
+                if i < len(bookings) and bookings[i] == entry[1]:
+                    del bookings[i]
+        if new is not None:
+            entry = self._entry(iid, new)
+            if entry is not None:
+                interviewer, booking = entry
+                bisect.insort(self._bookings.setdefault(interviewer, []), booking)
+                self._longest[interviewer] = max(self._longest.get(interviewer, 0.0), booking[1] - booking[0])
+
+    def overlapping(self, interviewer: str, start: datetime, end: datetime) -> List[str]:
+        """Ids of the interviewer's bookings that overlap [start, end), in start order."""
+        bookings = self._bookings.get(interviewer, [])
+        lo_epoch, hi_epoch = to_epoch(start), to_epoch(end)
+        lo = bisect.bisect_left(bookings, (lo_epoch - self._longest.get(interviewer, 0.0),))
+        hi = bisect.bisect_left(bookings, (hi_epoch,))
+        return [iid for s, e, iid in bookings[lo:hi] if e > lo_epoch]
+
+
+class JobSkillIndex:
+    """
+    Inverted index over db["jobs"]: required skill -> job ids, plus each job's
+    (required skills, min_experience_years, visa_required). Answers "which jobs
+    does this skill set cover" by walking only the postings of the given skills.
+    """
+
+    def __init__(self):
+        self._by_skill: Dict[str, Set[str]] = {}
+        self._no_skills: Set[str] = set()
+        self._requirements: Dict[str, Tuple[FrozenSet[str], int, bool]] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "JobSkillIndex":
+        idx = cls()
+        for jid, job in db["jobs"].items():
+            idx.update(jid, None, job)
+        _listen(db["jobs"], idx.update)
+        return idx
+
+    def update(self, jid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        previous = self._requirements.pop(jid, None)
+        if previous is not None:
+            for skill in previous[0]:
+                self._by_skill[skill].discard(jid)
+                if not self._by_skill[skill]:
+                    del self._by_skill[skill]
+            self._no_skills.discard(jid)
+        if new is not None:
+            skills = frozenset(norm_skills(new, "required_skills"))
+            try:
+                min_exp = int(new.get("min_experience_years", 0))
+            except (TypeError, ValueError):
+                min_exp = 0
+            self._requirements[jid] = (skills, min_exp, bool(new.get("visa_required", False)))
+            for skill in skills:
+                self._by_skill.setdefault(skill, set()).add(jid)
+            if not skills:
+                self._no_skills.add(jid)
+
+    def matched_counts(self, skills: Set[str]) -> Dict[str, int]:
+        """job id -> how many of its required skills are in ``skills``, for every job sharing one (or requiring none)."""
+        counts = dict.fromkeys(self._no_skills, 0)
+        for skill in skills:
+            for jid in self._by_skill.get(skill, ()):
+                counts[jid] = counts.get(jid, 0) + 1
+        return counts
+
+    def requirements(self, jid: str) -> Tuple[FrozenSet[str], int, bool]:
+        return self._requirements[jid]
+
+
+class RecordVersions:
+    """
+    Per-record version numbers for every collection, bumped on each write.
+    Versions come from one counter per loaded db, so a (collection, id, version)
+    triple never names two different record states. A collection is only
+    numbered (and listened to) the first time one of its versions is asked for.
+    """
+
+    def __init__(self, db: Dict[str, Any]):
+        self._db = db
+        self._counter = itertools.count(1)
+        self._versions: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "RecordVersions":
+        return cls(db)
+
+    def _section(self, name: str) -> Dict[str, int]:
+        versions = self._versions.get(name)
+        if versions is None:
+            section = self._db[name]
+            versions = self._versions[name] = {obj_id: next(self._counter) for obj_id in section}
+            _listen(section, self._listener(versions))
+        return versions
+
+    def _listener(self, versions: Dict[str, int]):
+        def bump(obj_id: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+            if new is None:
+                versions.pop(obj_id, None)
+            else:
+                versions[obj_id] = next(self._counter)
+        return bump
+
+    def version(self, section: str, obj_id: str) -> Optional[int]:
+        return self._section(section).get(obj_id)
+
+
+_ID_MAX = "\U0010ffff"
+
+
+def _number(value: Any) -> float:
+    # malformed legacy values sort as 0 rather than breaking the column order
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _unlink(index: Dict[str, Set[str]], key: str, rid: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(rid)
+        if not ids:
+            del index[key]
+
+
+def _containing(index: Dict[str, Set[str]], fragment: str) -> Set[str]:
+    """Ids under every key containing ``fragment`` (scans distinct keys, not records)."""
+    exact = index.get(fragment)
+    ids: Set[str] = set(exact) if exact else set()
+    for key, key_ids in index.items():
+        if fragment in key and key != fragment:
+            ids |= key_ids
+    return ids
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SortedColumns:
+    """
+    Numeric fields of a collection as sorted (value, id) lists, so a range is
+    located with two bisects and its size is known before any id is collected.
+    """
+
+    def __init__(self, fields: Tuple[str, ...], rows: Iterable[Tuple[str, Tuple[float, ...]]] = ()):
+        self.fields = fields
+        self._values: Dict[str, Tuple[float, ...]] = dict(rows)
+        self._columns: Dict[str, List[Tuple[float, str]]] = {
+            f: sorted((values[n], rid) for rid, values in self._values.items()) for n, f in enumerate(fields)}
+
+    def add(self, rid: str, values: Tuple[float, ...]) -> None:
+        self._values[rid] = values
+        for field, value in zip(self.fields, values):
+            bisect.insort(self._columns[field], (value, rid))
+
+    def remove(self, rid: str) -> None:
+        for field, value in zip(self.fields, self._values.pop(rid, ())):
+            column = self._columns[field]
+            i = bisect.bisect_left(column, (value, rid))
+            if i < len(column) and column[i] == (value, rid):
+                del column[i]
+
+    def _span(self, field: str, lo: Optional[float], hi: Optional[float]) -> Tuple[int, int]:
+        column = self._columns[field]
+        start = 0 if lo is None else bisect.bisect_left(column, (lo, ""))
+        # every id sorts below _ID_MAX, so this lands after the last entry equal to hi
+        stop = len(column) if hi is None else bisect.bisect_right(column, (hi, _ID_MAX))
+        return start, max(start, stop)
+
+    def count_range(self, field: str, lo: Optional[float], hi: Optional[float]) -> int:
+        """How many records have lo <= field <= hi (None: unbounded), without collecting them."""
+        start, stop = self._span(field, lo, hi)
+        return stop - start
+
+    def in_range(self, field: str, lo: Optional[float], hi: Optional[float]) -> Set[str]:
+        start, stop = self._span(field, lo, hi)
+        return {rid for _, rid in self._columns[field][start:stop]}
+
+    def within(self, ids: Iterable[str], field: str, lo: Optional[float], hi: Optional[float]) -> Set[str]:
+        """The ids of ``ids`` in the range, checked one by one (cheaper than in_range when ``ids`` is small)."""
+        n = self.fields.index(field)
+        return {rid for rid in ids if (lo is None or self._values[rid][n] >= lo)
+                and (hi is None or self._values[rid][n] <= hi)}
+
+    def intersect(self, sets: Iterable[Set[str]],
+                  ranges: Iterable[Tuple[str, Optional[float], Optional[float]]]) -> Optional[Set[str]]:
+        """
+        Ids in every set and every (field, lo, hi) range, or None when there are
+        no filters. Filters are applied smallest first; a range's size comes from
+        bisect alone and its ids are only collected when it is the smallest.
+        """
+        filters: List[Tuple[int, Any]] = [(len(ids), ids) for ids in sets]
+        filters.extend((self.count_range(*bounds), bounds) for bounds in ranges)
+        filters.sort(key=lambda f: f[0])
+
+        ids: Optional[Set[str]] = None
+        for _, matched in filters:
+            if isinstance(matched, tuple):
+                ids = self.in_range(*matched) if ids is None else self.within(ids, *matched)
+            else:
+                ids = set(matched) if ids is None else ids & matched
+            if not ids:
+                return set()
+        return ids
+
+
+class JobSearchIndex:
+    """
+    Search structures over db["jobs"]: normalised location and job_type ->
+    job ids (hash indexes, which also give the facet counts), each job's
+    normalised (title, location, id) sort key, and all sort keys kept sorted,
+    so a page of results is read off in order instead of sorting every match.
+    Salary bounds and required experience are kept as SortedColumns
+    (``ranges``) for range filters. Title keywords are substring matches; they
+    are answered from the distinct normalised titles, found through a
+    trigram -> titles index (built on the first keyword search), so a keyword
+    search never walks every job.
+    """
+
+    NUMERIC_FIELDS = ("min_salary", "max_salary", "min_experience_years")
+
+    def __init__(self):
+        self._by_location: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_title: Dict[str, Set[str]] = {}
+        self._title_grams: Optional[Dict[str, Set[str]]] = None
+        self._fields: Dict[str, Tuple[str, str, str]] = {}
+        self._sorted: List[Tuple[str, str, str]] = []
+        self.ranges = SortedColumns(self.NUMERIC_FIELDS)
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "JobSearchIndex":
+        idx = cls()
+        idx._sorted = sorted(idx._add(jid, job) for jid, job in db["jobs"].items())
+        idx.ranges = SortedColumns(cls.NUMERIC_FIELDS, ((jid, cls._numbers(job)) for jid, job in db["jobs"].items()))
+        _listen(db["jobs"], idx.update)
+        return idx
+
+    @classmethod
+    def _numbers(cls, job: Dict[str, Any]) -> Tuple[float, ...]:
+        return tuple(_number(job.get(f)) for f in cls.NUMERIC_FIELDS)
+
+    def _add(self, jid: str, job: Dict[str, Any]) -> Tuple[str, str, str]:
+        title, loc, jt = norm_field(job, "title"), norm_field(job, "location"), norm_term(job, "job_type")
+        self._fields[jid] = (title, loc, jt)
+        self._by_location.setdefault(loc, set()).add(jid)
+        self._by_type.setdefault(jt, set()).add(jid)
+        if self._title_grams is not None and title not in self._by_title:
+            self._add_grams(title)
+        self._by_title.setdefault(title, set()).add(jid)
+        return title, loc, jid
+
+    def update(self, jid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        previous = self._fields.pop(jid, None)
+        if previous is not None:
+            title, loc, jt = previous
+            _unlink(self._by_location, loc, jid)
+            _unlink(self._by_type, jt, jid)
+            _unlink(self._by_title, title, jid)
+            if self._title_grams is not None and title not in self._by_title:
+                for gram in _grams(title):
+                    _unlink(self._title_grams, gram, title)
+            i = bisect.bisect_left(self._sorted, (title, loc, jid))
+            if i < len(self._sorted) and self._sorted[i] == (title, loc, jid):
+                del self._sorted[i]
+            self.ranges.remove(jid)
+        if new is not None:
+            bisect.insort(self._sorted, self._add(jid, new))
+            self.ranges.add(jid, self._numbers(new))
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _add_grams(self, title: str) -> None:
+        for gram in _grams(title):
+            self._title_grams.setdefault(gram, set()).add(title)
+
+    def with_title(self, fragment: str) -> Set[str]:
+        """Jobs whose normalised title contains ``fragment``."""
+        if self._title_grams is None:
+            self._title_grams = {}
+            for title in self._by_title:
+                self._add_grams(title)
+        grams = _grams(fragment)
+        postings = sorted((self._title_grams.get(g, set()) for g in grams), key=len)
+        if not postings or len(postings[0]) * 4 > len(self._by_title):
+            # shorter than a trigram, or a common one: checking the distinct titles is as cheap
+            return _containing(self._by_title, fragment)
+        titles = set(postings[0])
+        for posting in postings[1:]:
+            if not titles:
+                break
+            titles &= posting
+        ids: Set[str] = set()
+        for title in titles:
+            if fragment in title:
+                ids |= self._by_title[title]
+        return ids
+
+    def with_location(self, fragment: str) -> Set[str]:
+        """Jobs whose normalised location contains ``fragment``."""
+        return _containing(self._by_location, fragment)
+
+    def with_type(self, job_type: str) -> Set[str]:
+        return self._by_type.get(job_type, set())
+
+    def facets(self, ids: Optional[Set[str]] = None) -> Dict[str, Dict[str, int]]:
+        """Jobs per location and per job_type, over ``ids`` or (cheaply) over every job."""
+        if ids is None:
+            return {"location": {k: len(v) for k, v in self._by_location.items()},
+                    "job_type": {k: len(v) for k, v in self._by_type.items()}}
+        location: Dict[str, int] = {}
+        job_type: Dict[str, int] = {}
+        for jid in ids:
+            _, loc, jt = self._fields[jid]
+            location[loc] = location.get(loc, 0) + 1
+            job_type[jt] = job_type.get(jt, 0) + 1
+        return {"location": location, "job_type": job_type}
+
+    def page(self, ids: Optional[Set[str]], offset: int, limit: Optional[int]) -> List[str]:
+        """Ids of ``ids`` (None: every job) in (title, location, id) order, sliced to [offset, offset + limit)."""
+        end = None if limit is None else offset + limit
+        if ids is None:
+            return [key[2] for key in self._sorted[offset:end]]
+        if limit is None or len(ids) * 8 <= len(self._sorted):
+            # few matches: sorting them beats walking the full order
+            keys = sorted((self._fields[jid][0], self._fields[jid][1], jid) for jid in ids)
+            return [key[2] for key in keys[offset:end]]
+        # many matches: about one in eight keys is a hit, so walking stops after ~8 * end keys
+        out: List[str] = []
+        seen = 0
+        for _, _, jid in self._sorted:
+            if jid in ids:
+                if seen >= offset:
+                    out.append(jid)
+                    if len(out) == limit:
+                        break
+                seen += 1
+        return out
+
+
+class CandidateSearchIndex:
+    """
+    Search structures over db["candidates"]: skill -> candidate ids (posting
+    lists), normalised location -> ids, and years of experience and education
+    as SortedColumns. ``education_rank`` maps a normalised education level to
+    a number ordered by seniority; unlisted levels rank as "unknown".
+    """
+
+    NUMERIC_FIELDS = ("years_experience", "education")
+
+    def __init__(self, education_rank: Dict[str, float]):
+        self._education_rank = education_rank
+        self._by_skill: Dict[str, Set[str]] = {}
+        self._by_location: Dict[str, Set[str]] = {}
+        self._entries: Dict[str, Tuple[FrozenSet[str], str]] = {}
+        self.ranges = SortedColumns(self.NUMERIC_FIELDS)
+
+    @classmethod
+    def build(cls, db: Dict[str, Any], education_rank: Dict[str, float]) -> "CandidateSearchIndex":
+        idx = cls(education_rank)
+        for cid, cand in db["candidates"].items():
+            idx._add(cid, cand)
+        idx.ranges = SortedColumns(cls.NUMERIC_FIELDS, ((cid, idx._numbers(cand)) for cid, cand in db["candidates"].items()))
+        _listen(db["candidates"], idx.update)
+        return idx
+
+    def education_rank(self, level: str) -> float:
+        return self._education_rank.get(normalise_text(level), self._education_rank.get("unknown", 0.0))
+
+    def _numbers(self, cand: Dict[str, Any]) -> Tuple[float, ...]:
+        level = norm_term(cand, "education_level", "unknown")
+        return _number(cand.get("years_experience")), self._education_rank.get(level, self._education_rank.get("unknown", 0.0))
+
+    def _add(self, cid: str, cand: Dict[str, Any]) -> None:
+        skills = frozenset(norm_skills(cand, "skills"))
+        loc = norm_field(cand, "location")
+        self._entries[cid] = (skills, loc)
+        for skill in skills:
+            self._by_skill.setdefault(skill, set()).add(cid)
+        self._by_location.setdefault(loc, set()).add(cid)
+
+    def update(self, cid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        previous = self._entries.pop(cid, None)
+        if previous is not None:
+            skills, loc = previous
+            for skill in skills:
+                _unlink(self._by_skill, skill, cid)
+            _unlink(self._by_location, loc, cid)
+            self.ranges.remove(cid)
+        if new is not None:
+            self._add(cid, new)
+            self.ranges.add(cid, self._numbers(new))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ids(self) -> Set[str]:
+        return set(self._entries)
+
+    def with_skills(self, skills: Iterable[str], any_skill: bool = False) -> Set[str]:
+        """Candidates with every skill (or, with ``any_skill``, at least one); postings are intersected smallest first."""
+        postings = sorted((self._by_skill.get(s, set()) for s in set(skills)), key=len)
+        if any_skill:
+            return set().union(*postings)
+        if not postings:
+            return self.ids()
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            if not ids:
+                break
+            ids &= posting
+        return ids
+
+    def with_location(self, fragment: str) -> Set[str]:
+        """Candidates whose normalised location contains ``fragment``."""
+        return _containing(self._by_location, fragment)
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenise(text: str) -> List[str]:
+    return _TOKEN_RE.findall(normalise_text(text))
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class JobTextIndex:
+    """
+    BM25 full-text index over each job's title, location and required skills.
+    Postings map term -> {job id: term frequency}; the vocabulary is also kept
+    sorted (prefix lookups by bisect) and, for typo tolerance, indexed by
+    character trigrams. Everything is updated per job through the listener.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_len: Dict[str, int] = {}
+        self._total_len = 0
+        self._vocab: List[str] = []
+        self._by_trigram: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def build(cls, db: Dict[str, Any]) -> "JobTextIndex":
+        idx = cls()
+        for jid, job in db["jobs"].items():
+            idx.update(jid, None, job)
+        _listen(db["jobs"], idx.update)
+        return idx
+
+    @staticmethod
+    def _terms(job: Dict[str, Any]) -> Dict[str, int]:
+        # stored fields are already normalised, so they only need splitting
+        tokens = _TOKEN_RE.findall(norm_field(job, "title")) + _TOKEN_RE.findall(norm_field(job, "location"))
+        for skill in norm_skills(job, "required_skills"):
+            tokens += _TOKEN_RE.findall(skill)
+        counts: Dict[str, int] = {}
+        for t in tokens:
+            counts[t] = counts.get(t, 0) + 1
+        return counts
+
+    def _add_term(self, term: str) -> None:
+        bisect.insort(self._vocab, term)
+        for gram in trigrams(term):
+            self._by_trigram.setdefault(gram, set()).add(term)
+
+    def _drop_term(self, term: str) -> None:
+        del self._vocab[bisect.bisect_left(self._vocab, term)]
+        for gram in trigrams(term):
+            terms = self._by_trigram[gram]
+            terms.discard(term)
+            if not terms:
+                del self._by_trigram[gram]
+
+    def update(self, jid: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        previous = self._doc_terms.pop(jid, None)
+        if previous is not None:
+            self._total_len -= self._doc_len.pop(jid)
+            for term in previous:
+                posting = self._postings[term]
+                del posting[jid]
+                if not posting:
+                    del self._postings[term]
+                    self._drop_term(term)
+        if new is not None:
+            terms = self._terms(new)
+            self._doc_terms[jid] = terms
+            self._doc_len[jid] = sum(terms.values())
+            self._total_len += self._doc_len[jid]
+            for term, tf in terms.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = {}
+                    self._add_term(term)
+                posting[jid] = tf
+
+    def _expand(self, token: str, prefix: bool, fuzzy: bool) -> List[Tuple[str, float]]:
+        """Index terms standing in for a query token, each with a weight in (0, 1]."""
+        out = [(token, 1.0)] if token in self._postings else []
+        if prefix:
+            i = bisect.bisect_left(self._vocab, token)
+            while i < len(self._vocab) and self._vocab[i].startswith(token):
+                if self._vocab[i] != token:
+                    out.append((self._vocab[i], 1.0))
+                i += 1
+        if fuzzy and not out:
+            grams = trigrams(token)
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for term in self._by_trigram.get(gram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            scored = [(n / len(grams | trigrams(term)), term) for term, n in shared.items()]
+            out = [(term, sim) for sim, term in heapq.nlargest(3, scored) if sim >= 0.3]
+        return out
+
+    def search(self, query: str, k: int, prefix: bool = True, fuzzy: bool = False) -> List[Tuple[str, float]]:
+        """Top ``k`` (job id, BM25 score), best first; ties by id. A query token scores by its best-matching term."""
+        n_docs = len(self._doc_len)
+        if not n_docs:
+            return []
+        avg_len = self._total_len / n_docs
+        scores: Dict[str, float] = {}
+        for token in dict.fromkeys(tokenise(query)):
+            best: Dict[str, float] = {}
+            for term, weight in self._expand(token, prefix, fuzzy):
+                posting = self._postings[term]
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                for jid, tf in posting.items():
+                    norm = tf + self.K1 * (1 - self.B + self.B * self._doc_len[jid] / avg_len)
+                    score = weight * idf * tf * (self.K1 + 1) / norm
+                    if score > best.get(jid, 0.0):
+                        best[jid] = score
+            for jid, score in best.items():
+                scores[jid] = scores.get(jid, 0.0) + score
+        return heapq.nsmallest(k, ((jid, score) for jid, score in scores.items()), key=lambda js: (-js[1], js[0]))
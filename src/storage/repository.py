@@ -1,7 +1,14 @@
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterator, List, Optional, Set, Tuple
 from src.app.config import DATA_FILE
+from src.domain.canonical import SCHEMA_VERSION, canonical_candidate, canonical_job, is_current
+from src.storage.audit_log import audit_log_for
+from src.storage.indexes import ApplicationIndex, EmailIndex, InterviewerSchedule
 
 DEFAULT_DB = {
     "jobs": {},
@@ -10,23 +17,396 @@ DEFAULT_DB = {
     "interviews": {}
 }
 
+# one-shot store upgrades (run by Repository.run_pending_migrations) -> the version each one brings a store to
+MIGRATIONS = {"audit_trails": 1, "canonical_fields": SCHEMA_VERSION}
+
+# journal mode folds the log into a new snapshot once it outgrows the snapshot (and this floor)
+JOURNAL_COMPACT_MIN_BYTES = 1024 * 1024
+
+# (st_mtime_ns, st_size, st_ino) of a file, or None when it does not exist
+FileSignature = Optional[Tuple[int, int, int]]
+Signature = Tuple[FileSignature, FileSignature]
+
+_cache: Dict[str, Tuple[Signature, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+class Collection(dict):
+    """
+    A db section (id -> record) that remembers which ids were written or removed
+    since the last save and tells its listeners (the indexes built over it)
+    about every change as ``listener(id, old_record, new_record)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty: Set[str] = set()
+        self.listeners: List[Callable[[str, Optional[Dict], Optional[Dict]], None]] = []
+
+    def _changed(self, key, old, new) -> None:
+        self.dirty.add(key)
+        for listener in self.listeners:
+            listener(key, old, new)
+
+    def __setitem__(self, key, value):
+        old = dict.get(self, key)
+        super().__setitem__(key, value)
+        self._changed(key, old, value)
+
+    def __delitem__(self, key):
+        old = self[key]
+        super().__delitem__(key)
+        self._changed(key, old, None)
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        old = super().pop(key)
+        self._changed(key, old, None)
+        return old
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+
+class Store(dict):
+    """The loaded db: section name -> Collection, plus the indexes built over it (dropped with it)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.indexes: Dict[str, Any] = {}
+
+
+def _empty_db() -> Dict[str, Any]:
+    return Store({k: Collection() for k in DEFAULT_DB})
+
+
+def _file_signature(path: Path) -> FileSignature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 class Repository:
-    def __init__(self, filepath: Path = DATA_FILE):
+    """
+    JSON file store.
+    The parsed database is cached in-process per file path and only re-read when
+    the file's mtime/size/inode change, so repeated loads cost a dict lookup.
+    The returned db is shared: callers must not mutate it unless they save it.
+
+    Inside ``with repo.transaction():`` every load returns the same in-memory db,
+    saves are deferred and the file is written once when the block exits; an
+    exception discards the pending changes instead.
+
+    With ``journal=True`` a save appends only the changed records to
+    ``<file>.journal`` instead of rewriting the file; the journal is replayed on
+    load and folded into a compact snapshot by ``compact()`` (run automatically
+    once the journal outgrows the snapshot).
+
+    Application audit trails live outside the records in an append-only log
+    (``<file>.audit``); entries added with ``append_audit`` are written when the
+    store is next saved and dropped if the change is rolled back.
+    """
+
+    def __init__(self, filepath: Path = DATA_FILE, journal: bool = False):
         self.filepath = filepath
+        self.journal = journal
+        self._tx_db: Optional[Dict[str, Any]] = None
+        self._tx_depth = 0
+        self._tx_dirty = False
+        self._pending_audit: List[Dict[str, Any]] = []
+
+    @property
+    def journal_path(self) -> Path:
+        return self.filepath.with_name(self.filepath.name + ".journal")
+
+    @property
+    def audit_path(self) -> Path:
+        return self.filepath.with_name(self.filepath.name + ".audit")
+
+    @property
+    def saves_incrementally(self) -> bool:
+        """Whether a save writes only the changed records rather than rewriting the store."""
+        return self.journal
+
+    @property
+    def migrations_path(self) -> Path:
+        return self.filepath.with_name(self.filepath.name + ".migrations")
+
+    def _cache_key(self) -> str:
+        return os.path.abspath(self.filepath)
+
+    def _signature(self) -> Signature:
+        return (_file_signature(self.filepath), _file_signature(self.journal_path) if self.journal else None)
 
     def load(self) -> Dict[str, Any]:
-        if not self.filepath.exists():
-            return dict(DEFAULT_DB)
+        if self._tx_db is not None:
+            return self._tx_db
+        key = self._cache_key()
+        sig = self._signature()
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached is not None and cached[0] == sig:
+                return cached[1]
+
+        db = self._read() if sig[0] is not None else _empty_db()
+        if sig[1] is not None:
+            self._replay(db)
+            sig = self._signature()
+        with _cache_lock:
+            _cache[key] = (sig, db)
+        return db
+
+    def _read(self) -> Dict[str, Any]:
         try:
             with self.filepath.open("r", encoding="utf-8") as f:
                 data = json.load(f)
             for k in DEFAULT_DB.keys():
                 data.setdefault(k, {})
-            return data
+            return Store({k: Collection(v) if isinstance(v, dict) else v for k, v in data.items()})
         except (json.JSONDecodeError, OSError):
-            return dict(DEFAULT_DB)
+            return _empty_db()
+
+    def _replay(self, db: Dict[str, Any]) -> None:
+        good = 0
+        with self.journal_path.open("rb") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    rec = None
+                if rec is None or not line.endswith(b"\n"):
+                    # torn write from a crash mid-append: drop it so later appends start on a clean line
+                    os.truncate(self.journal_path, good)
+                    break
+                good += len(line)
+                section = db.setdefault(rec["c"], Collection())
+                if rec.get("del"):
+                    section.pop(rec["id"], None)
+                else:
+                    section[rec["id"]] = rec["v"]
+        for section in db.values():
+            if isinstance(section, Collection):
+                section.dirty.clear()
 
     def save(self, db: Dict[str, Any]) -> None:
+        if self._tx_depth:
+            self._tx_db = db
+            self._tx_dirty = True
+            return
+        self._commit(db)
+
+    def _commit(self, db: Dict[str, Any]) -> None:
+        # history first: an entry for a change lost in a crash is better than a change with no history
+        self._flush_audit()
+        self._write(db)
+
+    def _write(self, db: Dict[str, Any]) -> None:
+        # without change tracking (a plain dict section) only a full snapshot is safe
+        if self.journal and self.filepath.exists() and all(
+                isinstance(v, Collection) for v in db.values() if isinstance(v, dict)):
+            self._append_journal(db)
+        else:
+            self._write_snapshot(db)
+
+    def _write_snapshot(self, db: Dict[str, Any]) -> None:
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
-        with self.filepath.open("w", encoding="utf-8") as f:
-            json.dump(db, f, indent=2, sort_keys=True)
+        tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            if self.journal:
+                json.dump(db, f, separators=(",", ":"))
+            else:
+                json.dump(db, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.filepath)
+        # replaying a stale journal over the new snapshot is harmless, so a crash here loses nothing
+        if self.journal and self.journal_path.exists():
+            self.journal_path.unlink()
+        for section in db.values():
+            if isinstance(section, Collection):
+                section.dirty.clear()
+        self._remember(db)
+
+    def _append_journal(self, db: Dict[str, Any]) -> None:
+        lines = []
+        for name, section in db.items():
+            if not isinstance(section, Collection):
+                continue
+            for obj_id in section.dirty:
+                if obj_id in section:
+                    rec = {"c": name, "id": obj_id, "v": section[obj_id]}
+                else:
+                    rec = {"c": name, "id": obj_id, "del": True}
+                lines.append(json.dumps(rec, separators=(",", ":")) + "\n")
+            section.dirty.clear()
+        if lines:
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        self._remember(db)
+
+        journal_size = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        if journal_size > max(JOURNAL_COMPACT_MIN_BYTES, self.filepath.stat().st_size):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot and remove it."""
+        self._write_snapshot(self.load())
+
+    def _remember(self, db: Dict[str, Any]) -> None:
+        with _cache_lock:
+            _cache[self._cache_key()] = (self._signature(), db)
+
+    def invalidate(self) -> None:
+        """Drop the cached copy (e.g. after another writer touched the file) and any unsaved audit entries."""
+        self._pending_audit.clear()
+        with _cache_lock:
+            _cache.pop(self._cache_key(), None)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """Unit of work: one load, one save at commit, rollback on error. Nested blocks join the outer one."""
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield self._tx_db
+            finally:
+                self._tx_depth -= 1
+            return
+
+        self._tx_db = self.load()
+        self._tx_depth = 1
+        self._tx_dirty = False
+        try:
+            yield self._tx_db
+            if self._tx_dirty:
+                self._commit(self._tx_db)
+        except BaseException:
+            self.invalidate()
+            raise
+        finally:
+            self._tx_depth = 0
+            self._tx_db = None
+            self._tx_dirty = False
+
+    # Lookups the services push down to the store. These scan the JSON db;
+    # SqliteRepository answers them with indexed queries.
+
+    def index(self, name: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Return index ``name`` over the current db, building it on first use. Collections keep it current."""
+        db = self.load()
+        indexes = getattr(db, "indexes", None)
+        if indexes is None:
+            return build(db)
+        if name not in indexes:
+            indexes[name] = build(db)
+        return indexes[name]
+
+    def candidate_id_for_email(self, email: str, exclude_id: Optional[str] = None) -> Optional[str]:
+        owners = self.index("candidate_email", EmailIndex.build).owners(email)
+        return next((cid for cid in owners if cid != exclude_id), None)
+
+    def active_application(self, job_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+        ids = self.index("applications", ApplicationIndex.build).active(job_id, candidate_id)
+        return self.load()["applications"][ids[0]] if ids else None
+
+    def applications_for_job(self, job_id: str) -> List[Dict[str, Any]]:
+        apps = self.load()["applications"]
+        return [apps[aid] for aid in self.index("applications", ApplicationIndex.build).for_job(job_id)]
+
+    def applications_for_candidate(self, candidate_id: str) -> List[Dict[str, Any]]:
+        apps = self.load()["applications"]
+        return [apps[aid] for aid in self.index("applications", ApplicationIndex.build).for_candidate(candidate_id)]
+
+    def overlapping_interview(self, interviewer: str, start: datetime, end: datetime) -> Optional[Dict[str, Any]]:
+        bookings = self.interviewer_bookings(interviewer, start, end)
+        return bookings[0] if bookings else None
+
+    def interviewer_bookings(self, interviewer: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """Non-cancelled interviews of ``interviewer`` overlapping [start, end), earliest first."""
+        interviews = self.load()["interviews"]
+        ids = self.index("interviewer_schedule", InterviewerSchedule.build).overlapping(interviewer, start, end)
+        return [interviews[iid] for iid in ids]
+
+    def append_audit(self, application_id: str, action: str, details: Optional[Dict[str, Any]] = None,
+                     ts: Optional[str] = None) -> None:
+        self._pending_audit.append({"application_id": application_id, "ts": ts or datetime.utcnow().isoformat(),
+                                    "action": action, "details": details or {}})
+
+    def _flush_audit(self) -> None:
+        if self._pending_audit:
+            audit_log_for(self.audit_path).append(self._pending_audit)
+            self._pending_audit = []
+
+    def audit_trail(self, application_id: str, since: Optional[str] = None, until: Optional[str] = None,
+                    offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of an application's history (since <= ts < until, oldest first) and the number of matching entries."""
+        # entries still embedded in records written before the audit log existed come first
+        app = self.load()["applications"].get(application_id) or {}
+        legacy = [e for e in app.get("audit_trail") or []
+                  if (not since or e.get("ts", "") >= since) and (not until or e.get("ts", "") < until)]
+        page = legacy[offset:] if limit is None else legacy[offset:offset + limit]
+        rest = None if limit is None else limit - len(page)
+        entries, total = audit_log_for(self.audit_path).query(
+            application_id, since, until, max(0, offset - len(legacy)), rest)
+        return page + entries, len(legacy) + total
+
+    def migrate_audit_trails(self) -> int:
+        """Move trails embedded in application records into the audit log; returns how many entries moved."""
+        moved = 0
+        with self.transaction() as db:
+            for aid, app in list(db["applications"].items()):
+                if "audit_trail" not in app:
+                    continue
+                for e in app["audit_trail"]:
+                    self.append_audit(aid, e.get("action", ""), e.get("details"), e.get("ts"))
+                    moved += 1
+                db["applications"][aid] = {k: v for k, v in app.items() if k != "audit_trail"}
+                self.save(db)
+        return moved
+
+    def migrate_canonical_fields(self) -> int:
+        """Rewrite jobs and candidates stored before the current schema version with their canonical fields; returns how many."""
+        migrated = 0
+        with self.transaction() as db:
+            for section, canonical in (("jobs", canonical_job), ("candidates", canonical_candidate)):
+                for rid, rec in list(db[section].items()):
+                    if not is_current(rec):
+                        db[section][rid] = canonical(rec)
+                        migrated += 1
+            if migrated:
+                self.save(db)
+        return migrated
+
+    def run_pending_migrations(self) -> List[str]:
+        """
+        Run the MIGRATIONS this store has not had yet, recording each in
+        ``migrations_path`` so later starts skip them without reading any records.
+        Returns the names of the migrations that ran.
+        """
+        try:
+            applied = json.loads(self.migrations_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            applied = {}
+        if not isinstance(applied, dict):
+            applied = {}
+        ran = [name for name, version in MIGRATIONS.items() if applied.get(name) != version]
+        for name in ran:
+            getattr(self, f"migrate_{name}")()
+            applied[name] = MIGRATIONS[name]
+        if ran:
+            self.migrations_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.migrations_path.with_name(self.migrations_path.name + ".tmp")
+            tmp.write_text(json.dumps(applied, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.migrations_path)
+        return ran
+
+    def iter_section(self, section: str) -> Iterator[Dict[str, Any]]:
+        """Records of ``section`` one at a time, without building a second copy of the collection."""
+        yield from self.load()[section].values()
@@ -0,0 +1,171 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+
+from src.app.config import DATA_FILE, SPLIT_DIR
+from src.storage.audit_log import audit_log_for
+from src.storage.repository import (DEFAULT_DB, Collection, FileSignature, Repository, Store, _cache,
+                                    _cache_lock, _file_signature)
+
+
+class LazyStore(Store):
+    """
+    A Store whose sections are read from their own files on first access.
+    Iterating the store (items/values/keys) reads every section, so code that
+    only indexes the sections it needs never parses the others.
+    """
+
+    def __init__(self, repo: "SplitRepository"):
+        super().__init__()
+        self._repo = repo
+        self.signatures: Dict[str, FileSignature] = {}
+
+    def __missing__(self, key: str) -> Collection:
+        if key not in DEFAULT_DB:
+            raise KeyError(key)
+        self.signatures[key] = _file_signature(self._repo.section_path(key))
+        section = self._repo._read_section(key)
+        dict.__setitem__(self, key, section)
+        return section
+
+    def _load_all(self) -> None:
+        for name in DEFAULT_DB:
+            self[name]
+
+    def loaded(self) -> Iterator[str]:
+        return iter(list(dict.keys(self)))
+
+    def get(self, key, default=None):
+        return self[key] if key in DEFAULT_DB else dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in DEFAULT_DB or dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+
+class SplitRepository(Repository):
+    """
+    One JSON file per collection (``<dir>/jobs.json`` ...), each parsed only when
+    a service first touches that collection and rewritten only when it has
+    changed. A cached store is reused until one of its loaded files changes.
+    A store still in the single-file format is split on first use; the old file
+    is left in place as a backup. Sections are replaced one file at a time, so
+    a crash mid-save can leave a transaction applied to some collections only.
+    """
+
+    def __init__(self, dirpath: Path = SPLIT_DIR, legacy_file: Optional[Path] = DATA_FILE):
+        super().__init__(dirpath)
+        self.legacy_file = legacy_file
+
+    @property
+    def audit_path(self) -> Path:
+        return self.filepath / "audit.jsonl"
+
+    @property
+    def migrations_path(self) -> Path:
+        return self.filepath / "migrations.json"
+
+    def section_path(self, section: str) -> Path:
+        return self.filepath / f"{section}.json"
+
+    def _is_current(self, db: LazyStore) -> bool:
+        return all(_file_signature(self.section_path(name)) == sig for name, sig in db.signatures.items())
+
+    def load(self) -> Dict[str, Any]:
+        if self._tx_db is not None:
+            return self._tx_db
+        key = self._cache_key()
+        with _cache_lock:
+            cached = _cache.get(key)
+        if cached is not None and self._is_current(cached[1]):
+            return cached[1]
+
+        self._migrate_legacy()
+        db = LazyStore(self)
+        with _cache_lock:
+            _cache[key] = (None, db)
+        return db
+
+    def _read_section(self, section: str) -> Collection:
+        try:
+            with self.section_path(section).open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return Collection()
+        return Collection(data if isinstance(data, dict) else {})
+
+    def _write_section(self, section: str, records: Dict[str, Any]) -> None:
+        path = self.section_path(section)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _write(self, db: Dict[str, Any]) -> None:
+        self.filepath.mkdir(parents=True, exist_ok=True)
+        if not isinstance(db, LazyStore):
+            # a plain dict from a script: write what it holds and reread lazily next time
+            for name in DEFAULT_DB:
+                self._write_section(name, db.get(name, {}))
+            self.invalidate()
+            return
+
+        for name in db.loaded():
+            section = dict.__getitem__(db, name)
+            if isinstance(section, Collection) and not section.dirty:
+                continue
+            self._write_section(name, section)
+            if isinstance(section, Collection):
+                section.dirty.clear()
+            db.signatures[name] = _file_signature(self.section_path(name))
+        for name in DEFAULT_DB:
+            # a complete set of files marks the layout as initialised (see _migrate_legacy)
+            if not self.section_path(name).exists():
+                self._write_section(name, {})
+        with _cache_lock:
+            _cache[self._cache_key()] = (None, db)
+
+    def compact(self) -> None:
+        """Nothing to fold: every save already rewrites whole section files."""
+
+    def _migrate_legacy(self) -> None:
+        if all(self.section_path(name).exists() for name in DEFAULT_DB):
+            return
+        if self.legacy_file is None or not Path(self.legacy_file).exists():
+            return
+        # rerun in full if interrupted: the layout only counts as migrated once every file exists
+        legacy = Repository(self.legacy_file)
+        db = legacy.load()
+        self.filepath.mkdir(parents=True, exist_ok=True)
+        # history (the legacy audit log plus any trails still inside records) moves into this layout's log;
+        # nothing writes to it before migration, so a partial log is from an interrupted run
+        if self.audit_path.exists():
+            self.audit_path.unlink()
+        entries = [{"application_id": aid, "ts": e["ts"], "action": e["action"], "details": e["details"]}
+                   for aid in db["applications"] for e in legacy.audit_trail(aid)[0]]
+        audit_log_for(self.audit_path).append(entries)
+        for name in DEFAULT_DB:
+            records = db.get(name, {})
+            if name == "applications":
+                records = {aid: {k: v for k, v in app.items() if k != "audit_trail"} for aid, app in records.items()}
+            self._write_section(name, records)
@@ -0,0 +1,289 @@
+import argparse
+import json
+import sqlite3
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+from src.app.config import DATA_FILE, SQLITE_FILE
+from src.app.utils import normalise_text
+from src.domain.canonical import norm_field
+from src.domain.enums import ApplicationStatus
+from src.storage.repository import DEFAULT_DB, Repository, Store
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS candidates (
+    id TEXT PRIMARY KEY,
+    email TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates (email);
+CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    job_id TEXT,
+    candidate_id TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_job_candidate_status ON applications (job_id, candidate_id, status);
+CREATE INDEX IF NOT EXISTS idx_applications_candidate ON applications (candidate_id);
+CREATE TABLE IF NOT EXISTS interviews (
+    id TEXT PRIMARY KEY,
+    application_id TEXT,
+    interviewer TEXT,
+    scheduled_time TEXT,
+    end_time TEXT,
+    cancelled INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_interviews_interviewer_time ON interviews (interviewer, scheduled_time);
+CREATE INDEX IF NOT EXISTS idx_interviews_time ON interviews (scheduled_time);
+CREATE TABLE IF NOT EXISTS audit_entries (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id TEXT NOT NULL,
+    ts TEXT,
+    action TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_entries_application_ts ON audit_entries (application_id, ts);
+"""
+
+# indexed columns kept next to the JSON blob of each record
+_COLUMNS = {
+    "jobs": (),
+    "candidates": ("email",),
+    "applications": ("job_id", "candidate_id", "status"),
+    "interviews": ("application_id", "interviewer", "scheduled_time", "end_time", "cancelled"),
+}
+
+
+def _interview_end(itv: Dict[str, Any]) -> Optional[str]:
+    try:
+        start = datetime.fromisoformat(itv["scheduled_time"])
+        return (start + timedelta(minutes=int(itv["duration_minutes"]))).isoformat()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _column_values(section: str, rec: Dict[str, Any]) -> Tuple:
+    if section == "candidates":
+        return (norm_field(rec, "email"),)
+    if section == "applications":
+        return (rec.get("job_id"), rec.get("candidate_id"), rec.get("status"))
+    if section == "interviews":
+        return (rec.get("application_id"), str(rec.get("interviewer", "")).lower(),
+                rec.get("scheduled_time"), _interview_end(rec), int(bool(rec.get("cancelled"))))
+    return ()
+
+
+class SqlCollection(MutableMapping):
+    """
+    Dict-like view of one table. Writes go straight to the connection and become
+    durable on commit; like Collection, listeners hear ``(id, old, new)`` per write.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, section: str):
+        self.conn = conn
+        self.section = section
+        self.listeners: List[Callable[[str, Optional[Dict], Optional[Dict]], None]] = []
+        cols = ("id", "data") + _COLUMNS[section]
+        self._upsert = f"INSERT OR REPLACE INTO {section} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+
+    def decode(self, rows) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(obj_id, json.loads(data)) for obj_id, data in rows]
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        rows = self.conn.execute(f"SELECT id, data FROM {self.section} WHERE id = ?", (key,)).fetchall()
+        if not rows:
+            raise KeyError(key)
+        return self.decode(rows)[0][1]
+
+    def __contains__(self, key) -> bool:
+        return self.conn.execute(f"SELECT 1 FROM {self.section} WHERE id = ?", (key,)).fetchone() is not None
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        old = self.get(key) if self.listeners else None
+        rec = dict(value)
+        trail = rec.pop("audit_trail", None) if self.section == "applications" else None
+        self.conn.execute(self._upsert, (key, json.dumps(rec)) + _column_values(self.section, rec))
+        if trail:
+            # a trail still embedded in a record (old JSON data): store the entries not seen yet
+            (stored,) = self.conn.execute(
+                "SELECT COUNT(*) FROM audit_entries WHERE application_id = ?", (key,)).fetchone()
+            self.conn.executemany(
+                "INSERT INTO audit_entries (application_id, ts, action, details) VALUES (?, ?, ?, ?)",
+                [(key, e.get("ts"), e.get("action"), json.dumps(e.get("details") or {})) for e in trail[stored:]])
+        for listener in self.listeners:
+            listener(key, old, value)
+
+    def __delitem__(self, key: str) -> None:
+        old = self.get(key) if self.listeners else None
+        if self.conn.execute(f"DELETE FROM {self.section} WHERE id = ?", (key,)).rowcount == 0:
+            raise KeyError(key)
+        for listener in self.listeners:
+            listener(key, old, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self.conn.execute(f"SELECT id FROM {self.section}")])
+
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.section}").fetchone()[0]
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return self.decode(self.conn.execute(f"SELECT id, data FROM {self.section}").fetchall())
+
+    def values(self) -> List[Dict[str, Any]]:
+        return [rec for _, rec in self.items()]
+
+
+class SqliteRepository(Repository):
+    """
+    SQLite store with the same load/save/transaction contract as Repository.
+    Each collection is a table holding the record as JSON plus indexed columns,
+    and the lookups services push down (email, active application, interviewer
+    overlap) run as indexed queries instead of scans.
+    """
+
+    def __init__(self, filepath: Path = SQLITE_FILE):
+        super().__init__(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.filepath))
+        self.conn.executescript(_SCHEMA)
+        self._db = Store({name: SqlCollection(self.conn, name) for name in DEFAULT_DB})
+        self._data_version = self._current_data_version()
+
+    @property
+    def saves_incrementally(self) -> bool:
+        return True
+
+    def _current_data_version(self) -> int:
+        # changes whenever another connection commits to the file
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _drop_indexes(self) -> None:
+        self._db.indexes.clear()
+        for section in self._db.values():
+            section.listeners.clear()
+
+    def load(self) -> Dict[str, Any]:
+        if not self._tx_depth:
+            if self.conn.in_transaction:
+                # forget writes a previous caller made but never saved
+                self.invalidate()
+            version = self._current_data_version()
+            if version != self._data_version:
+                self._data_version = version
+                self._drop_indexes()
+        return self._db
+
+    def _write(self, db: Dict[str, Any]) -> None:
+        self.conn.commit()
+
+    def invalidate(self) -> None:
+        self.conn.rollback()
+        self._drop_indexes()
+
+    def compact(self) -> None:
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def candidate_id_for_email(self, email: str, exclude_id: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute("SELECT id FROM candidates WHERE email = ? AND id IS NOT ? LIMIT 1",
+                                (normalise_text(email), exclude_id)).fetchone()
+        return row[0] if row else None
+
+    def active_application(self, job_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT id, data FROM applications WHERE job_id = ? AND candidate_id = ? AND status != ? LIMIT 1",
+            (job_id, candidate_id, ApplicationStatus.WITHDRAWN.value)).fetchall()
+        return self._db["applications"].decode(rows)[0][1] if rows else None
+
+    def applications_for_job(self, job_id: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT id, data FROM applications WHERE job_id = ?", (job_id,)).fetchall()
+        return [rec for _, rec in self._db["applications"].decode(rows)]
+
+    def applications_for_candidate(self, candidate_id: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT id, data FROM applications WHERE candidate_id = ?", (candidate_id,)).fetchall()
+        return [rec for _, rec in self._db["applications"].decode(rows)]
+
+    def overlapping_interview(self, interviewer: str, start: datetime, end: datetime) -> Optional[Dict[str, Any]]:
+        bookings = self.interviewer_bookings(interviewer, start, end)
+        return bookings[0] if bookings else None
+
+    def interviewer_bookings(self, interviewer: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT data FROM interviews WHERE interviewer = ? AND cancelled = 0 "
+            "AND scheduled_time < ? AND end_time > ? ORDER BY scheduled_time",
+            (interviewer, end.isoformat(), start.isoformat())).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def append_audit(self, application_id: str, action: str, details: Optional[Dict[str, Any]] = None,
+                     ts: Optional[str] = None) -> None:
+        # part of the open SQLite transaction, so it commits or rolls back with the change it records
+        self.conn.execute("INSERT INTO audit_entries (application_id, ts, action, details) VALUES (?, ?, ?, ?)",
+                          (application_id, ts or datetime.utcnow().isoformat(), action, json.dumps(details or {})))
+
+    def audit_trail(self, application_id: str, since: Optional[str] = None, until: Optional[str] = None,
+                    offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        where = "application_id = ?" + (" AND ts >= ?" if since else "") + (" AND ts < ?" if until else "")
+        params = [application_id] + [t for t in (since, until) if t]
+        (total,) = self.conn.execute(f"SELECT COUNT(*) FROM audit_entries WHERE {where}", params).fetchone()
+        rows = self.conn.execute(
+            f"SELECT ts, action, details FROM audit_entries WHERE {where} ORDER BY ts, seq LIMIT ? OFFSET ?",
+            params + [-1 if limit is None else limit, offset]).fetchall()
+        return [{"ts": ts, "action": action, "details": json.loads(details)} for ts, action, details in rows], total
+
+    def migrate_audit_trails(self) -> int:
+        return 0  # trails have always been kept in audit_entries here
+
+    def iter_section(self, section: str) -> Iterator[Dict[str, Any]]:
+        records = self.load()[section]
+        cursor = self.conn.execute(f"SELECT id, data FROM {section}")
+        while True:
+            rows = cursor.fetchmany(500)
+            if not rows:
+                return
+            for _, rec in records.decode(rows):
+                yield rec
+
+
+def migrate_json_to_sqlite(json_path: Path = DATA_FILE, sqlite_path: Path = SQLITE_FILE) -> Dict[str, int]:
+    source_repo = Repository(json_path)
+    source = source_repo.load()
+    target = SqliteRepository(sqlite_path)
+    counts = {}
+    try:
+        with target.transaction() as db:
+            for section in DEFAULT_DB:
+                records = source.get(section, {})
+                for obj_id, rec in records.items():
+                    db[section][obj_id] = {k: v for k, v in rec.items() if k != "audit_trail"}
+                counts[section] = len(records)
+            for aid in source["applications"]:
+                for e in source_repo.audit_trail(aid)[0]:
+                    target.append_audit(aid, e["action"], e["details"], e["ts"])
+            target.save(db)
+    finally:
+        target.close()
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert the JSON data store into a SQLite store.")
+    parser.add_argument("json_path", nargs="?", default=str(DATA_FILE))
+    parser.add_argument("sqlite_path", nargs="?", default=str(SQLITE_FILE))
+    args = parser.parse_args(argv)
+    counts = migrate_json_to_sqlite(Path(args.json_path), Path(args.sqlite_path))
+    print("Migrated:", counts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.screening_service import ScreeningService
+
+from tests._helpers import make_repo
+
+
+def create_job(repo, job_id, skills, min_exp=0, visa=False):
+    JobService(repo).create_job_posting(
+        job_id=job_id, title="Role", location="London", job_type="full_time",
+        min_salary=30000, max_salary=50000, required_skills=skills, min_experience_years=min_exp, visa_required=visa
+    )
+
+
+def test_match_jobs_applies_skill_experience_and_visa_rules(tmp_path):
+    repo = make_repo(tmp_path)
+    create_job(repo, "J_ALL", ["python", "sql"])
+    create_job(repo, "J_ONE", ["python"])
+    create_job(repo, "J_NONE", [])
+    create_job(repo, "J_MISSING", ["python", "rust"])
+    create_job(repo, "J_SENIOR", ["python"], min_exp=5)
+    create_job(repo, "J_VISA", ["sql"], visa=True)
+    CandidateService(repo).create_candidate_profile(
+        candidate_id="CAND001", name="A", email="a@example.com", phone="+447700900123", location="London",
+        years_experience=2, skills=["Python", "SQL"], education_level="masters", visa_status="needs_sponsorship"
+    )
+    svc = ScreeningService(repo)
+
+    assert [r["job_id"] for r in svc.match_jobs_for_candidate("CAND001")] == ["j_all", "j_one", "j_none"]
+
+    partial = {r["job_id"]: r for r in svc.match_jobs_for_candidate("CAND001", eligible_only=False)}
+    assert partial["j_missing"]["eligible"] is False
+    assert partial["j_missing"]["breakdown"]["skills"] == 0.5
+    assert partial["j_senior"]["eligible"] is False
+    assert partial["j_visa"]["eligible"] is False
+
+
+def test_match_jobs_follows_job_edits(tmp_path):
+    repo = make_repo(tmp_path)
+    create_job(repo, "J1", ["rust"])
+    CandidateService(repo).create_candidate_profile(
+        candidate_id="CAND001", name="A", email="a@example.com", phone="+447700900123", location="London",
+        years_experience=2, skills=["python"], education_level="masters", visa_status="citizen"
+    )
+    svc = ScreeningService(repo)
+    assert svc.match_jobs_for_candidate("CAND001") == []
+
+    JobService(repo).edit_job_posting("J1", {"required_skills": ["python"]})
+    assert [r["job_id"] for r in svc.match_jobs_for_candidate("CAND001")] == ["j1"]
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.services.candidate_service import CandidateService
+from src.services.ranking_engine import EDU_SCORES
+from src.services.screening_service import ScreeningService
+from src.services.job_service import JobService
+
+from tests._helpers import make_repo
+
+SKILLS = ["python", "sql", "java", "aws", "excel"]
+EDUCATION = ["diploma", "bachelors", "masters", "phd", "unknown"]
+
+
+def seed(repo, n):
+    rnd = random.Random(3)
+    svc = CandidateService(repo)
+    for i in range(n):
+        svc.create_candidate_profile(f"C{i:03d}", f"Cand {i}", f"c{i}@example.com", "+441234567890",
+                                     rnd.choice(["London", "Leeds", "York"]), rnd.randint(0, 12),
+                                     rnd.sample(SKILLS, rnd.randint(0, 3)), rnd.choice(EDUCATION), "citizen")
+    return svc
+
+
+def brute_force(repo, skills=(), match="all", location="", min_exp=None, min_edu=None):
+    out = []
+    for cid, c in repo.load()["candidates"].items():
+        have = set(c["skills"])
+        if skills and not (set(skills) <= have if match == "all" else set(skills) & have):
+            continue
+        if location not in c["location"].lower():
+            continue
+        if min_exp is not None and c["years_experience"] < min_exp:
+            continue
+        if min_edu is not None and EDU_SCORES[c["education_level"]] < EDU_SCORES[min_edu]:
+            continue
+        out.append(cid)
+    return sorted(out)
+
+
+@pytest.mark.parametrize("skills,match,location,min_exp,min_edu", [
+    ([], "all", "", None, None),
+    (["python"], "all", "", None, None),
+    (["Python", "SQL"], "all", "", None, None),
+    (["python", "sql"], "any", "", None, None),
+    (["cobol"], "any", "", None, None),
+    ([], "all", "york", 5, None),
+    (["aws"], "all", "leeds", None, "masters"),
+    (["python", "java"], "any", "lon", 3, "bachelors"),
+])
+def test_search_matches_a_full_scan(tmp_path, skills, match, location, min_exp, min_edu):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 120)
+    expected = brute_force(repo, [s.lower() for s in skills], match, location, min_exp, min_edu)
+    filters = dict(skills=skills, match=match, location=location, min_experience=min_exp, min_education=min_edu)
+
+    assert svc.search_candidate_ids(**filters) == expected
+    pages = []
+    for offset in range(0, len(expected) + 9, 9):
+        res = svc.search_candidates(**filters, offset=offset, limit=9)
+        assert res["total"] == len(expected)
+        pages += [c["candidate_id"] for c in res["results"]]
+    assert pages == expected
+
+
+def test_ids_feed_ranking_and_index_follows_updates(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 30)
+    JobService(repo).create_job_posting("J1", "Dev", "London", "full_time", 1, 2, ["python"], 0, False)
+    ids = svc.search_candidate_ids(skills=["python"])
+    ranked = ScreeningService(repo).rank_candidates("J1", ids)
+    assert sorted(r["candidate_id"] for r in ranked) == ids
+
+    svc.update_candidate_profile("C000", {"skills": ["rust"], "location": "Paris"})
+    assert svc.search_candidate_ids(skills=["rust"]) == ["c000"]
+    assert svc.search_candidate_ids(location="paris") == ["c000"]
+    assert "c000" not in svc.search_candidate_ids(skills=["rust"], location="london")
+
+    with pytest.raises(ValidationError):
+        svc.search_candidates(match="some")
+    with pytest.raises(ValidationError):
+        svc.search_candidates(min_education="kindergarten")
+    with pytest.raises(ValidationError):
+        svc.search_candidates(min_experience=5, max_experience=2)
@@ -0,0 +1,44 @@
+import json
+import pytest
+from src.services.candidate_service import CandidateService
+from src.services.bulk_import_service import BulkImportService
+from src.app.exceptions import ValidationError
+
+from tests._helpers import make_repo
+
+
+def create_candidate(svc, cid, email):
+    return svc.create_candidate_profile(
+        candidate_id=cid, name="Candidate", email=email, phone="+447700900111", location="Leicester",
+        years_experience=1, skills=["python"], education_level="masters", visa_status="no_sponsorship"
+    )
+
+
+def test_email_change_frees_old_address(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = CandidateService(repo)
+    create_candidate(svc, "CAND001", "one@example.com")
+    svc.update_candidate_profile("CAND001", {"email": "new@example.com"})
+
+    create_candidate(svc, "CAND002", "ONE@example.com")
+    with pytest.raises(ValidationError):
+        create_candidate(svc, "CAND003", "new@example.com")
+
+
+def test_update_to_own_email_is_allowed(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = CandidateService(repo)
+    create_candidate(svc, "CAND001", "one@example.com")
+    assert svc.update_candidate_profile("CAND001", {"email": "One@Example.com"})["email"] == "One@Example.com"
+
+
+def test_bulk_imported_emails_are_indexed(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = CandidateService(repo)
+    create_candidate(svc, "CAND001", "one@example.com")
+    bulk = tmp_path / "bulk.json"
+    bulk.write_text(json.dumps({"candidates": [{"candidate_id": "cand002", "email": "two@example.com"}]}))
+    BulkImportService(repo).import_from_json(str(bulk))
+
+    with pytest.raises(ValidationError):
+        create_candidate(svc, "CAND003", "Two@example.com")
@@ -0,0 +1,84 @@
+import copy
+import json
+
+from src.services.bulk_import_service import BulkImportService
+from src.services.candidate_service import CandidateService
+from src.services.job_service import JobService
+from src.services.screening_service import ScreeningService
+
+from tests._helpers import make_repo
+
+
+def seed(repo):
+    JobService(repo).create_job_posting(
+        job_id="J1", title="Role", location="London", job_type="full_time",
+        min_salary=30000, max_salary=50000, required_skills=["python"], min_experience_years=1, visa_required=False
+    )
+    CandidateService(repo).create_candidate_profile(
+        candidate_id="CAND001", name="A", email="a@example.com", phone="+447700900123", location="London",
+        years_experience=3, skills=["python"], education_level="masters", visa_status="citizen"
+    )
+
+
+def test_repeat_ranking_hits_cache_and_weights_are_part_of_key(tmp_path):
+    repo = make_repo(tmp_path)
+    seed(repo)
+    svc = ScreeningService(repo)
+
+    first = svc.rank_candidates("J1", ["CAND001"])
+    assert svc.rank_candidates("j1", ["cand001"]) == first
+    assert svc.cache_stats()["hits"] == 1
+
+    svc.rank_candidates("J1", ["CAND001"], weights={"skills": 1.0, "experience": 0.0, "education": 0.0})
+    svc.filter_eligibility("J1", ["CAND001"])
+    svc.filter_eligibility("J1", ["CAND001"])
+    assert svc.cache_stats()["hits"] == 2
+    assert svc.cache_stats()["misses"] == 3
+
+
+def test_edits_invalidate_only_touched_results(tmp_path):
+    repo = make_repo(tmp_path)
+    seed(repo)
+    svc = ScreeningService(repo)
+    assert svc.filter_eligibility("J1", ["CAND001"])[0]["eligible"] is True
+
+    JobService(repo).edit_job_posting("J1", {"min_experience_years": 5})
+    assert svc.filter_eligibility("J1", ["CAND001"])[0]["reason"] == "insufficient_experience"
+
+    before = svc.rank_candidates("J1", ["CAND001"])[0]["score"]
+    CandidateService(repo).update_candidate_profile("CAND001", {"education_level": "phd"})
+    assert svc.rank_candidates("J1", ["CAND001"])[0]["score"] > before
+    assert svc.cache_stats()["hits"] == 0
+
+
+def test_bulk_import_of_a_listed_candidate_is_picked_up(tmp_path):
+    repo = make_repo(tmp_path)
+    seed(repo)
+    svc = ScreeningService(repo)
+    assert [r["candidate_id"] for r in svc.rank_candidates("J1", ["CAND001", "CAND002"])] == ["cand001"]
+
+    bulk = tmp_path / "bulk.json"
+    bulk.write_text(json.dumps({"candidates": [{
+        "candidate_id": "CAND002", "name": "B", "email": "b@example.com", "phone": "+447700900124",
+        "location": "London", "years_experience": 12, "skills": ["python"],
+        "education_level": "phd", "visa_status": "citizen"
+    }]}))
+    BulkImportService(repo).import_from_json(str(bulk))
+
+    assert [r["candidate_id"] for r in svc.rank_candidates("J1", ["CAND001", "CAND002"])] == ["cand002", "cand001"]
+    assert svc.cache_stats()["hits"] == 0
+
+
+def test_callers_cannot_change_cached_results(tmp_path):
+    repo = make_repo(tmp_path)
+    seed(repo)
+    svc = ScreeningService(repo)
+
+    for call in (lambda: svc.rank_candidates("J1", ["CAND001"]), lambda: svc.filter_eligibility("J1", ["CAND001"])):
+        first = call()
+        expected = copy.deepcopy(first)
+        first[0]["note"] = "seen"
+        first[0].get("breakdown", {})["skills"] = -1.0
+        again = call()
+        again[0]["note2"] = "seen"
+        assert call() == expected
@@ -0,0 +1,48 @@
+import csv
+import json
+import pytest
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.screening_service import ScreeningService
+from src.services.batch_screening_service import BatchScreeningService
+
+from tests._helpers import make_repo
+
+
+def setup(repo):
+    for jid, skills in (("JOB001", ["python"]), ("JOB002", ["sql"]), ("JOB003", ["rust"])):
+        JobService(repo).create_job_posting(
+            job_id=jid, title="Role", location="London", job_type="full_time",
+            min_salary=30000, max_salary=50000, required_skills=skills, min_experience_years=0, visa_required=False
+        )
+    for i, skills in enumerate((["python", "sql"], ["python"], ["sql"])):
+        CandidateService(repo).create_candidate_profile(
+            candidate_id=f"CAND00{i}", name="A", email=f"a{i}@example.com", phone="+447700900123", location="London",
+            years_experience=i * 4, skills=skills, education_level="masters", visa_status="citizen"
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_screen_all_jsonl_matches_top_k(tmp_path, workers):
+    repo = make_repo(tmp_path)
+    setup(repo)
+    out = tmp_path / "screen.jsonl"
+
+    summary = BatchScreeningService(repo).screen_all(str(out), workers=workers, chunk_size=1)
+    assert summary["jobs"] == 3
+    results = {r["job_id"]: r for r in map(json.loads, out.read_text().splitlines())}
+    screening = ScreeningService(repo)
+    for jid in ("job001", "job002", "job003"):
+        assert results[jid]["candidates"] == screening.top_k_candidates(jid, 10)
+    assert results["job003"]["eligible_count"] == 0
+
+
+def test_screen_selected_jobs_to_csv(tmp_path):
+    repo = make_repo(tmp_path)
+    setup(repo)
+    out = tmp_path / "screen.csv"
+
+    summary = BatchScreeningService(repo).screen_all(str(out), fmt="csv", job_ids=["JOB001"], workers=1, limit=1)
+    rows = list(csv.DictReader(out.open()))
+    assert summary["rows"] == 1
+    assert [(r["job_id"], r["rank"], r["candidate_id"]) for r in rows] == [("job001", "1", "cand001")]
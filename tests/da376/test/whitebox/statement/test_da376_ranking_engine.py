@@ -0,0 +1,94 @@
+import random
+import pytest
+from src.services import ranking_engine
+from src.services.ranking_engine import RankingEngine
+from src.app.utils import normalise_text
+
+
+def reference_rank(db, job, candidate_ids, weights):
+    # the original one-candidate-at-a-time scoring loop
+    req_skills = set([normalise_text(s) for s in job.get("required_skills", [])])
+    edu_map = {"phd": 1.0, "masters": 0.8, "bachelors": 0.6, "diploma": 0.4, "unknown": 0.2}
+    scored = []
+    for cid in candidate_ids:
+        cand = db["candidates"].get(cid)
+        if not cand:
+            continue
+        cand_skills = set([normalise_text(s) for s in cand.get("skills", [])])
+        skills_score = 1.0 if not req_skills else (len(req_skills.intersection(cand_skills)) / max(1, len(req_skills)))
+        exp = int(cand.get("years_experience", 0))
+        exp_score = min(max(1.0 if exp >= 10 else exp / 10.0, 0.0), 1.0)
+        edu_score = edu_map.get(normalise_text(cand.get("education_level", "unknown")), 0.2)
+        total = (weights["skills"] * skills_score) + (weights["experience"] * exp_score) + (weights["education"] * edu_score)
+        scored.append((total, {
+            "candidate_id": cid,
+            "score": round(total, 4),
+            "breakdown": {"skills": round(skills_score, 4), "experience": round(exp_score, 4), "education": round(edu_score, 4)}
+        }))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [item for _, item in scored]
+
+
+def random_db(n, seed=7):
+    rnd = random.Random(seed)
+    pool = [f"skill{i}" for i in range(90)]
+    levels = ["phd", "masters", "bachelors", "diploma", "unknown", "bootcamp"]
+    candidates = {}
+    for i in range(n):
+        candidates[f"c{i}"] = {
+            "candidate_id": f"c{i}",
+            "skills": rnd.sample(pool, rnd.randint(0, 8)),
+            "years_experience": rnd.randint(0, 14),
+            "education_level": rnd.choice(levels),
+        }
+    return {"candidates": candidates}, pool
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_engine_matches_reference_scoring(monkeypatch, use_numpy):
+    if use_numpy and ranking_engine.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(ranking_engine, "np", None)
+
+    db, pool = random_db(400)
+    engine = RankingEngine.build(db)
+    weights = {"skills": 0.6, "experience": 0.25, "education": 0.15}
+    ids = list(db["candidates"]) + ["missing", "c3"]
+    for job in ({"required_skills": pool[:3]}, {"required_skills": ["skill70", "unknown skill"]}, {"required_skills": []}):
+        assert engine.rank(job, ids, weights) == reference_rank(db, job, ids, weights)
+
+
+def test_engine_follows_candidate_updates():
+    db, _ = random_db(3)
+    engine = RankingEngine.build(db)
+    job = {"required_skills": ["rust"]}
+    engine.update("c1", db["candidates"]["c1"], dict(db["candidates"]["c1"], skills=["Rust"]))
+    engine.update("c2", db["candidates"]["c2"], None)
+
+    ranked = engine.rank(job, ["c0", "c1", "c2"], ranking_engine.DEFAULT_WEIGHTS)
+    assert [r["candidate_id"] for r in ranked][0] == "c1"
+    assert "c2" not in [r["candidate_id"] for r in ranked]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_top_k_matches_filter_then_full_sort(monkeypatch, use_numpy):
+    if use_numpy and ranking_engine.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(ranking_engine, "np", None)
+
+    db, pool = random_db(600)
+    for i, cand in enumerate(db["candidates"].values()):
+        cand["visa_status"] = "citizen" if i % 3 else "needs_sponsorship"
+    engine = RankingEngine.build(db)
+    job = {"required_skills": pool[:2], "min_experience_years": 3, "visa_required": True}
+
+    eligible = [cid for cid, c in db["candidates"].items()
+                if set(pool[:2]) <= set(c["skills"]) and c["years_experience"] >= 3 and c["visa_status"] == "citizen"]
+    expected = sorted(reference_rank(db, job, eligible, ranking_engine.DEFAULT_WEIGHTS),
+                      key=lambda r: (-r["score"], r["candidate_id"]))
+    top = engine.top_k(job, 5)
+    assert [r["candidate_id"] for r in top] == [r["candidate_id"] for r in expected[:5]]
+    assert len(engine.top_k(job, 10_000)) == len(eligible)
+    assert len(engine.top_k(job, 10_000, eligible_only=False)) == 600
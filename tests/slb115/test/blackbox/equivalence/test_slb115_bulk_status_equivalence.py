@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from src.app.exceptions import NotFoundError, ValidationError
+from src.services.application_service import ApplicationService
+from src.services.candidate_service import CandidateService
+from src.services.job_service import JobService
+
+from tests._helpers import make_repo
+
+
+def setup(repo, n):
+    JobService(repo).create_job_posting(job_id="J1", title="Dev", location="London", job_type="full_time",
+                                        min_salary=1, max_salary=2, required_skills=[], min_experience_years=0,
+                                        visa_required=False)
+    svc = ApplicationService(repo)
+    for i in range(n):
+        CandidateService(repo).create_candidate_profile(
+            candidate_id=f"C{i}", name="A", email=f"c{i}@example.com", phone="+447700900123", location="London",
+            years_experience=1, skills=[], education_level="masters", visa_status="citizen")
+        svc.submit_application(f"A{i}", "J1", f"C{i}")
+    return svc
+
+
+def test_bulk_update_by_ids_reports_each_outcome_and_saves_once(tmp_path, monkeypatch):
+    repo = make_repo(tmp_path)
+    svc = setup(repo, 3)
+    svc.update_application_status("A2", "rejected", "no")
+    writes = []
+    real_write = repo._write
+    monkeypatch.setattr(repo, "_write", lambda db: (writes.append(1), real_write(db)))
+
+    res = svc.bulk_update_status(["A0", "a1", "A2", "A9"], "screened", "batch")
+
+    assert (res["updated"], res["failed"]) == (2, 2)
+    assert [r["ok"] for r in res["results"]] == [True, True, False, False]
+    assert res["results"][2]["error"] == "Invalid transition: rejected -> screened"
+    assert res["results"][3]["error"] == "Application not found."
+    assert len(writes) == 1
+    assert json.loads(repo.filepath.read_text())["applications"]["a1"]["status"] == "screened"
+    assert svc.get_application_status("A0")["audit_trail"][-1]["details"]["reason"] == "batch"
+
+
+def test_bulk_update_selects_by_job_and_current_status(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = setup(repo, 4)
+    svc.update_application_status("A0", "screened", "")
+
+    res = svc.bulk_update_status(None, "rejected", "role closed", job_id="J1", current_status="applied")
+    assert [r["application_id"] for r in res["results"]] == ["a1", "a2", "a3"]
+    assert svc.get_application_status("A0")["status"] == "screened"
+
+    assert svc.bulk_update_status(None, "rejected", job_id="J1", current_status="applied")["results"] == []
+    with pytest.raises(ValidationError):
+        svc.bulk_update_status(["A0"], "hired")
+    with pytest.raises(ValidationError):
+        svc.bulk_update_status(None, "rejected")
+    with pytest.raises(NotFoundError):
+        svc.bulk_update_status(None, "rejected", job_id="J9")
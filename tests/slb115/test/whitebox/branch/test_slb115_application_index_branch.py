@@ -0,0 +1,47 @@
+import pytest
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.application_service import ApplicationService
+from src.app.exceptions import ConflictError
+
+from tests._helpers import make_repo
+
+
+def setup(repo):
+    for jid in ("JOB001", "JOB002"):
+        JobService(repo).create_job_posting(
+            job_id=jid, title="SE", location="London", job_type="full_time",
+            min_salary=30000, max_salary=50000, required_skills=["python"], min_experience_years=0, visa_required=False
+        )
+    for i in (1, 2):
+        CandidateService(repo).create_candidate_profile(
+            candidate_id=f"CAND00{i}", name="A", email=f"a{i}@example.com", phone="+447700900123",
+            location="London", years_experience=1, skills=["python"], education_level="bachelors", visa_status="no_sponsorship"
+        )
+
+
+def test_resubmit_after_withdraw_is_allowed(tmp_path):
+    repo = make_repo(tmp_path)
+    setup(repo)
+    svc = ApplicationService(repo)
+    svc.submit_application("APP001", "JOB001", "CAND001")
+    with pytest.raises(ConflictError):
+        svc.submit_application("APP002", "JOB001", "CAND001")
+
+    svc.withdraw_application("APP001")
+    assert svc.submit_application("APP002", "JOB001", "CAND001")["status"] == "applied"
+
+
+def test_job_listing_follows_status_changes(tmp_path):
+    repo = make_repo(tmp_path)
+    setup(repo)
+    svc = ApplicationService(repo)
+    svc.submit_application("APP001", "JOB001", "CAND001")
+    svc.submit_application("APP002", "JOB001", "CAND002")
+    svc.submit_application("APP003", "JOB002", "CAND001")
+    svc.update_application_status("APP001", "screened", "ok")
+
+    listed = svc.list_applications_for_job("JOB001")
+    assert [a["application_id"] for a in listed] == ["app001", "app002"]
+    assert listed[0]["status"] == "screened"
+    assert [a["application_id"] for a in repo.applications_for_candidate("cand001")] == ["app001", "app003"]
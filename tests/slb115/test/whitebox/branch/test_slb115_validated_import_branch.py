@@ -0,0 +1,137 @@
+import json
+
+from src.services.application_service import ApplicationService
+from src.services.bulk_import_service import BulkImportService
+
+from tests._helpers import make_repo
+
+
+def job(jid, **kw):
+    return dict({"job_id": jid, "title": " Data  Engineer ", "location": "London", "job_type": "Full_Time",
+                 "min_salary": 30000, "max_salary": 50000, "required_skills": ["Python", "python", " SQL "]}, **kw)
+
+
+def cand(cid, email, **kw):
+    return dict({"candidate_id": cid, "name": "Ann", "email": email, "phone": "+447700900123",
+                 "location": "Leeds", "years_experience": 2, "skills": ["Python"]}, **kw)
+
+
+PAYLOAD = {
+    "jobs": [job("J1"), job("J2", min_salary=60000), job("J1"), "oops"],
+    "candidates": [cand("C1", "a@example.com"), cand("C2", "bad-email"), cand("C3", "a@example.com"),
+                   cand("C4", "d@example.com", years_experience="ten")],
+    "applications": [
+        {"application_id": "A1", "job_id": "J1", "candidate_id": "C1", "status": "shortlisted"},
+        {"application_id": "A2", "job_id": "J2", "candidate_id": "C1"},
+        {"application_id": "A3", "job_id": "J1", "candidate_id": "C9"},
+        {"application_id": "A4", "job_id": "J1", "candidate_id": "C1"},
+        {"application_id": "A5", "job_id": "J1", "candidate_id": "C1", "status": "hired"},
+    ],
+    "interviews": [
+        {"interview_id": "I1", "application_id": "A1", "scheduled_time": "2026-03-02T10:00:00",
+         "duration_minutes": 60, "interviewer": "Bob"},
+        {"interview_id": "I2", "application_id": "A1", "scheduled_time": "2026-03-02T10:30:00",
+         "duration_minutes": 30, "interviewer": " bob "},
+        {"interview_id": "I3", "application_id": "A9", "scheduled_time": "2026-03-02T12:00:00",
+         "duration_minutes": 30, "interviewer": "Bob"},
+        {"interview_id": "I4", "application_id": "A1", "scheduled_time": "tomorrow",
+         "duration_minutes": 30, "interviewer": "Bob"},
+    ],
+}
+
+
+def run(tmp_path, workers, chunk_size):
+    tmp_path.mkdir(exist_ok=True)
+    repo = make_repo(tmp_path)
+    bulk = tmp_path / "bulk.json"
+    bulk.write_text(json.dumps(PAYLOAD))
+    return repo, BulkImportService(repo).import_validated(str(bulk), workers=workers, chunk_size=chunk_size)
+
+
+def test_validated_import_rejects_bad_and_dangling_records(tmp_path):
+    repo, report = run(tmp_path, workers=1, chunk_size=500)
+
+    assert report["jobs"]["imported"] == 1
+    assert report["jobs"]["errors"] == [
+        "jobs[1]: Minimum salary cannot exceed maximum salary.",
+        "jobs[2]: job_id already exists: j1",
+        "jobs[3]: not an object",
+    ]
+    assert report["candidates"]["errors"] == [
+        "candidates[1]: Invalid email format.",
+        "candidates[2]: Email already exists.",
+        "candidates[3]: years_experience must be an integer.",
+    ]
+    assert report["applications"]["errors"] == [
+        "applications[1]: Job not found: j2",
+        "applications[2]: Candidate not found: c9",
+        "applications[3]: Duplicate application for same job and candidate.",
+        "applications[4]: Invalid status: hired",
+    ]
+    assert report["interviews"]["errors"] == [
+        "interviews[1]: Interviewer is double-booked.",
+        "interviews[2]: Application not found: a9",
+        "interviews[3]: scheduled_time must be ISO format.",
+    ]
+
+    db = repo.load()
+    assert db["jobs"]["j1"]["title"] == "Data Engineer"
+    assert db["jobs"]["j1"]["required_skills"] == ["python", "sql"]
+    trail = ApplicationService(repo).get_application_status("A1")["audit_trail"]
+    assert [e["action"] for e in trail] == ["created"]
+    assert db["interviews"]["i1"]["interviewer"] == "bob"
+
+
+def test_worker_pool_gives_the_same_report(tmp_path):
+    _, serial = run(tmp_path / "serial", workers=1, chunk_size=500)
+    _, parallel = run(tmp_path / "parallel", workers=2, chunk_size=2)
+    assert parallel == serial
+
+
+def test_malformed_skills_reject_only_their_record(tmp_path):
+    repo = make_repo(tmp_path)
+    bulk = tmp_path / "skills.json"
+    bulk.write_text(json.dumps({
+        "jobs": [job("J1", required_skills=5), job("J2")],
+        "candidates": [cand("C1", "a@example.com", skills=[1, 2]), cand("C2", "b@example.com", skills="python"),
+                       cand("C3", "c@example.com", skills=None)],
+    }))
+    report = BulkImportService(repo).import_validated(str(bulk), workers=1)
+
+    assert report["jobs"]["errors"] == ["jobs[0]: required_skills must be a list of strings."]
+    assert report["candidates"]["errors"] == ["candidates[0]: skills must be a list of strings.",
+                                              "candidates[1]: skills must be a list of strings."]
+    db = repo.load()
+    assert list(db["jobs"]) == ["j2"]
+    assert db["candidates"]["c3"]["skills"] == []
+
+
+def test_malformed_audit_trail_rejects_only_its_record(tmp_path):
+    repo = make_repo(tmp_path)
+    bulk = tmp_path / "trail.json"
+    app = {"job_id": "J1", "candidate_id": "C1", "status": "withdrawn"}
+    bulk.write_text(json.dumps({
+        "jobs": [job("J1")],
+        "candidates": [cand("C1", "a@example.com")],
+        "applications": [
+            dict(app, application_id="A1", audit_trail=[{"ts": 5, "action": "created"},
+                                                         {"ts": "2024", "action": "created"}]),
+            dict(app, application_id="A2", audit_trail=[{"ts": "last week", "action": "created"}]),
+            dict(app, application_id="A3", audit_trail=[{"ts": "2024-01-01T00:00:00", "action": "created",
+                                                         "details": "none"}]),
+            dict(app, application_id="A4", audit_trail=[{"ts": "2024-02-01T00:00:00", "action": "withdrawn"},
+                                                        {"ts": "2024-01-01T00:00:00", "action": "created"}]),
+        ],
+    }))
+    report = BulkImportService(repo).import_validated(str(bulk), workers=1)
+
+    assert report["applications"]["errors"] == [
+        "applications[0]: audit_trail entries need a ts and an action string.",
+        "applications[1]: audit_trail ts must be ISO format.",
+        "applications[2]: audit_trail details must be an object.",
+    ]
+    svc = ApplicationService(repo)
+    assert [e["action"] for e in svc.get_application_status("A4")["audit_trail"]] == ["created", "withdrawn"]
+    # the log stays usable for later saves
+    svc.submit_application("A5", "J1", "C1")
+    assert svc.get_application_status("A5")["audit_total"] == 1
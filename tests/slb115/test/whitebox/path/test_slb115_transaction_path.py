@@ -0,0 +1,59 @@
+import pytest
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.application_service import ApplicationService
+from src.app.exceptions import ConflictError
+from src.storage.repository import Repository
+
+from tests._helpers import make_repo
+
+
+class CountingRepository(Repository):
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.writes = 0
+
+    def _write(self, db):
+        self.writes += 1
+        super()._write(db)
+
+
+def setup_job_and_candidates(repo, n):
+    JobService(repo).create_job_posting(
+        job_id="JOB001", title="SE", location="London", job_type="full_time",
+        min_salary=30000, max_salary=50000, required_skills=["python"], min_experience_years=0, visa_required=False
+    )
+    for i in range(n):
+        CandidateService(repo).create_candidate_profile(
+            candidate_id=f"CAND{i:03d}", name="A", email=f"a{i}@example.com", phone="+447700900123",
+            location="London", years_experience=1, skills=["python"], education_level="bachelors", visa_status="no_sponsorship"
+        )
+
+
+def test_transaction_writes_once_at_commit(tmp_path):
+    repo = CountingRepository(make_repo(tmp_path).filepath)
+    setup_job_and_candidates(repo, 3)
+    repo.writes = 0
+    svc = ApplicationService(repo)
+
+    with repo.transaction():
+        for i in range(3):
+            svc.submit_application(f"APP{i:03d}", "JOB001", f"CAND{i:03d}")
+        assert repo.writes == 0
+
+    assert repo.writes == 1
+    repo.invalidate()
+    assert len(repo.load()["applications"]) == 3
+
+
+def test_transaction_rolls_back_on_conflict(tmp_path):
+    repo = make_repo(tmp_path)
+    setup_job_and_candidates(repo, 1)
+    svc = ApplicationService(repo)
+
+    with pytest.raises(ConflictError):
+        with repo.transaction():
+            svc.submit_application("APP001", "JOB001", "CAND000")
+            svc.submit_application("APP002", "JOB001", "CAND000")
+
+    assert repo.load()["applications"] == {}
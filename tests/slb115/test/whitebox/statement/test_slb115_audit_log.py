@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.services.application_service import ApplicationService
+from src.services.candidate_service import CandidateService
+from src.services.job_service import JobService
+from src.storage.audit_log import AuditLog
+from src.storage.repository import Repository
+
+from tests._helpers import make_repo
+
+
+def setup_app(repo):
+    JobService(repo).create_job_posting(job_id="J1", title="Dev", location="London", job_type="full_time",
+                                        min_salary=1, max_salary=2, required_skills=[], min_experience_years=0,
+                                        visa_required=False)
+    CandidateService(repo).create_candidate_profile(
+        candidate_id="C1", name="A", email="a@example.com", phone="+447700900123", location="London",
+        years_experience=1, skills=[], education_level="masters", visa_status="citizen")
+    svc = ApplicationService(repo)
+    svc.submit_application("A1", "J1", "C1")
+    svc.update_application_status("A1", "screened", "cv ok")
+    svc.update_application_status("A1", "shortlisted", "strong")
+    return svc
+
+
+def test_history_is_kept_out_of_records_and_paged(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = setup_app(repo)
+
+    assert "audit_trail" not in json.loads(repo.filepath.read_text())["applications"]["a1"]
+    status = svc.get_application_status("A1")
+    assert [e["action"] for e in status["audit_trail"]] == ["created", "status_change", "status_change"]
+    assert status["audit_total"] == 3
+
+    page = svc.get_application_status("A1", offset=1, limit=1)
+    assert [e["details"].get("reason") for e in page["audit_trail"]] == ["cv ok"]
+    assert page["audit_total"] == 3
+
+    second = status["audit_trail"][1]["ts"]
+    ranged = svc.get_application_status("A1", since=second)
+    assert ranged["audit_total"] == 2
+    assert svc.get_application_status("A1", until=second)["audit_trail"] == status["audit_trail"][:1]
+
+    # a fresh process reads the same history from the log file
+    assert ApplicationService(Repository(repo.filepath)).get_application_status("A1")["audit_total"] == 3
+    with pytest.raises(ValidationError):
+        svc.get_application_status("A1", since="yesterday")
+
+
+def test_rolled_back_changes_leave_no_history(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = setup_app(repo)
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            svc.update_application_status("A1", "rejected", "oops")
+            raise RuntimeError("abort")
+    assert svc.get_application_status("A1")["audit_total"] == 3
+
+
+def test_embedded_trails_are_migrated_and_torn_tail_dropped(tmp_path):
+    repo = make_repo(tmp_path)
+    data = json.loads(repo.filepath.read_text())
+    data["applications"]["a1"] = {"application_id": "a1", "job_id": "j1", "candidate_id": "c1", "status": "applied",
+                                  "created_at": "2025-01-01T00:00:00", "updated_at": "2025-01-01T00:00:00",
+                                  "audit_trail": [{"ts": "2025-01-01T00:00:00", "action": "created", "details": {}}]}
+    repo.filepath.write_text(json.dumps(data))
+    svc = ApplicationService(repo)
+    assert svc.get_application_status("A1")["audit_total"] == 1
+
+    assert repo.migrate_audit_trails() == 1
+    assert "audit_trail" not in repo.load()["applications"]["a1"]
+
+    with repo.audit_path.open("a") as f:
+        f.write('{"application_id": "a1", "ts": "2025-01-0')
+    svc.withdraw_application("A1")
+    assert [e["action"] for e in svc.get_application_status("A1")["audit_trail"]] == ["created", "withdrawn"]
+
+
+def test_a_bad_entry_leaves_the_log_untouched(tmp_path):
+    log = AuditLog(tmp_path / "x.audit")
+    good = {"application_id": "a1", "ts": "2025-01-02T00:00:00", "action": "created", "details": {}}
+    with pytest.raises(ValueError):
+        log.append([good, dict(good, ts=5)])
+    assert not log.path.exists()
+
+    log.append([good, dict(good, ts="2025-01-01T00:00:00", action="imported")])
+    assert [e["action"] for e in log.query("a1")[0]] == ["imported", "created"]
@@ -0,0 +1,79 @@
+import json
+
+from src.domain.canonical import INTERNAL_FIELDS, SCHEMA_VERSION
+from src.services.candidate_service import CandidateService
+from src.services.job_service import JobService
+from src.services.screening_service import ScreeningService
+from src.storage.repository import Repository
+
+
+def legacy_repo(tmp_path):
+    # as written before canonical fields existed, including un-normalised imports
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps({
+        "jobs": {"j1": {"job_id": "j1", "title": "Data  Engineer", "location": "London", "job_type": "Full_Time",
+                        "min_salary": 1, "max_salary": 2, "required_skills": ["Python", "SQL"],
+                        "min_experience_years": 1, "visa_required": False}},
+        "candidates": {"c1": {"candidate_id": "c1", "name": "Ann", "email": "Ann@Example.com", "phone": "+441234567",
+                              "location": "London ", "years_experience": 3, "skills": ["python", "Sql "],
+                              "education_level": "Masters", "visa_status": "citizen"}},
+        "applications": {}, "interviews": {},
+    }))
+    return Repository(path)
+
+
+def reads(repo):
+    return (JobService(repo).search_jobs("data engineer", "london", "full_time"),
+            ScreeningService(repo).filter_eligibility("j1", ["c1"]),
+            ScreeningService(repo).rank_candidates("j1", ["c1"]),
+            CandidateService(repo).search_candidate_ids(skills=["sql"], location="london", min_education="masters"),
+            repo.candidate_id_for_email("ann@example.com"))
+
+
+def test_legacy_records_read_the_same_before_and_after_migration(tmp_path):
+    repo = legacy_repo(tmp_path)
+    jobs, eligible, ranked, cids, owner = reads(repo)
+    assert [j["job_id"] for j in jobs] == ["j1"] and eligible[0]["eligible"] and cids == ["c1"] and owner == "c1"
+
+    assert repo.migrate_canonical_fields() == 2
+    assert repo.migrate_canonical_fields() == 0
+    repo.invalidate()
+    db = repo.load()
+    assert db["jobs"]["j1"]["title_norm"] == "data engineer"
+    assert db["jobs"]["j1"]["required_skills"] == ["python", "sql"]
+    assert db["candidates"]["c1"]["email_norm"] == "ann@example.com"
+    assert db["candidates"]["c1"]["email"] == "Ann@Example.com"
+    assert db["candidates"]["c1"]["schema_version"] == SCHEMA_VERSION
+    after = reads(repo)
+    assert [j["job_id"] for j in after[0]] == ["j1"]
+    assert after[1:] == (eligible, ranked, cids, owner)
+
+
+def test_service_writes_store_canonical_fields(tmp_path):
+    repo = legacy_repo(tmp_path)
+    job = JobService(repo).edit_job_posting("J1", {"title": "  Platform   Engineer"})
+    cand = CandidateService(repo).update_candidate_profile("c1", {"location": "Leeds"})
+    created = CandidateService(repo).create_candidate_profile("C2", "Bo", "Bo@X.com", "+441234567", "York", 1,
+                                                              ["Go"], "phd", "pr")
+    db = repo.load()
+    assert db["jobs"]["j1"]["title_norm"] == "platform engineer"
+    assert db["candidates"]["c1"]["location_norm"] == "leeds"
+    assert db["candidates"]["c1"]["schema_version"] == SCHEMA_VERSION
+    assert db["candidates"]["c2"]["email_norm"] == "bo@x.com"
+
+    # the bookkeeping fields stay in storage; what services hand out is unchanged
+    assert job["title"] == "Platform Engineer" and cand["skills"] == ["python", "sql"]
+    for rec in (job, cand, created, CandidateService(repo).view_candidate_profile("c2"),
+                *JobService(repo).search_jobs("platform"), *JobService(repo).search_jobs_text("platform"),
+                *CandidateService(repo).search_candidates(skills=["go"])["results"]):
+        assert not INTERNAL_FIELDS & set(rec)
+
+
+def test_pending_migrations_run_once_per_store(tmp_path, monkeypatch):
+    repo = legacy_repo(tmp_path)
+    assert repo.run_pending_migrations() == ["audit_trails", "canonical_fields"]
+    assert repo.load()["jobs"]["j1"]["schema_version"] == SCHEMA_VERSION
+
+    fresh = Repository(repo.filepath)
+    monkeypatch.setattr(Repository, "load", lambda self: (_ for _ in ()).throw(AssertionError("records read")))
+    assert fresh.run_pending_migrations() == []
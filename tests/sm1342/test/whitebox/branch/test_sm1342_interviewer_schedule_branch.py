@@ -0,0 +1,50 @@
+from datetime import datetime
+from src.storage.indexes import InterviewerSchedule
+
+
+def booking(iid, start, minutes, interviewer="alex", cancelled=False):
+    return iid, {"interview_id": iid, "scheduled_time": start, "duration_minutes": minutes,
+                 "interviewer": interviewer, "cancelled": cancelled}
+
+
+def make_schedule(*bookings):
+    return InterviewerSchedule.build({"interviews": dict(bookings)})
+
+
+def test_overlap_found_from_long_booking_starting_well_before():
+    schedule = make_schedule(
+        booking("i1", "2025-12-20T08:00:00", 240),
+        booking("i2", "2025-12-20T11:00:00", 30),
+        booking("i3", "2025-12-20T13:00:00", 30),
+    )
+    hits = schedule.overlapping("alex", datetime(2025, 12, 20, 11, 45), datetime(2025, 12, 20, 12, 15))
+    assert hits == ["i1"]
+
+
+def test_adjacent_slots_do_not_overlap():
+    schedule = make_schedule(booking("i1", "2025-12-20T10:00:00", 60))
+    assert schedule.overlapping("alex", datetime(2025, 12, 20, 11, 0), datetime(2025, 12, 20, 12, 0)) == []
+    assert schedule.overlapping("alex", datetime(2025, 12, 20, 9, 0), datetime(2025, 12, 20, 10, 0)) == []
+
+
+def test_cancelled_and_other_interviewers_are_ignored():
+    schedule = make_schedule(
+        booking("i1", "2025-12-20T10:00:00", 60, cancelled=True),
+        booking("i2", "2025-12-20T10:00:00", 60, interviewer="Sam"),
+    )
+    assert schedule.overlapping("alex", datetime(2025, 12, 20, 10, 0), datetime(2025, 12, 20, 11, 0)) == []
+    assert schedule.overlapping("sam", datetime(2025, 12, 20, 10, 0), datetime(2025, 12, 20, 11, 0)) == ["i2"]
+
+
+def test_range_query_and_cancellation_update():
+    schedule = make_schedule(
+        booking("i1", "2025-12-20T09:00:00", 60),
+        booking("i2", "2025-12-21T09:00:00", 60),
+        booking("i3", "2025-12-22T09:00:00", 60),
+    )
+    day_range = (datetime(2025, 12, 20, 12, 0), datetime(2025, 12, 22, 9, 30))
+    assert schedule.overlapping("alex", *day_range) == ["i2", "i3"]
+
+    old = booking("i2", "2025-12-21T09:00:00", 60)[1]
+    schedule.update("i2", old, dict(old, cancelled=True))
+    assert schedule.overlapping("alex", *day_range) == ["i3"]
@@ -0,0 +1,71 @@
+import math
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.services.job_service import JobService
+from src.storage.indexes import tokenise
+
+from tests._helpers import make_repo
+
+JOBS = [
+    ("J1", "Python Developer", "London", ["python", "django"]),
+    ("J2", "Senior Python Engineer", "Leeds", ["python", "aws", "python"]),
+    ("J3", "Java Developer", "London", ["java", "spring"]),
+    ("J4", "Data Analyst", "York", ["sql", "excel"]),
+    ("J5", "C++ Engineer", "Paris", ["c++"]),
+]
+
+
+def seed(repo):
+    svc = JobService(repo)
+    for jid, title, loc, skills in JOBS:
+        svc.create_job_posting(job_id=jid, title=title, location=loc, job_type="full_time", min_salary=1,
+                               max_salary=2, required_skills=skills, min_experience_years=0, visa_required=False)
+    return svc
+
+
+def bm25(repo, query):
+    # reference scoring straight from the stored jobs, exact terms only
+    docs = {}
+    for jid, j in repo.load()["jobs"].items():
+        docs[jid] = tokenise(j["title"]) + tokenise(j["location"]) + [t for s in j["required_skills"] for t in tokenise(s)]
+    avg = sum(len(d) for d in docs.values()) / len(docs)
+    scores = {}
+    for term in set(tokenise(query)):
+        df = sum(term in d for d in docs.values())
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for jid, d in docs.items():
+            tf = d.count(term)
+            if tf:
+                scores[jid] = scores.get(jid, 0) + idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * len(d) / avg))
+    return sorted(scores.items(), key=lambda s: (-s[1], s[0]))
+
+
+@pytest.mark.parametrize("query", ["python", "london developer", "c++ paris", "engineer python aws"])
+def test_exact_scores_match_reference(tmp_path, query):
+    repo = make_repo(tmp_path)
+    svc = seed(repo)
+    res = svc.search_jobs_text(query, k=10, prefix=False)
+    assert [(j["job_id"], j["score"]) for j in res] == [(jid, round(s, 4)) for jid, s in bm25(repo, query)]
+
+
+def test_prefix_fuzzy_top_k_and_updates(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = seed(repo)
+    assert svc.search_jobs_text("pyth", prefix=False) == []
+    assert {j["job_id"] for j in svc.search_jobs_text("pyth")} == {"j1", "j2"}
+    assert svc.search_jobs_text("pythn") == []
+    assert svc.search_jobs_text("pythn", fuzzy=True)[0]["job_id"] in {"j1", "j2"}
+    assert len(svc.search_jobs_text("developer engineer", k=2)) == 2
+
+    svc.edit_job_posting("J4", {"title": "Python Data Analyst"})
+    assert "j4" in {j["job_id"] for j in svc.search_jobs_text("python")}
+    svc.edit_job_posting("J5", {"title": "Rust Engineer", "required_skills": ["rust"]})
+    assert svc.search_jobs_text("c++") == []
+    assert svc.search_jobs_text("rust")[0]["job_id"] == "j5"
+
+    with pytest.raises(ValidationError):
+        svc.search_jobs_text("")
+    with pytest.raises(ValidationError):
+        svc.search_jobs_text("python", k=0)
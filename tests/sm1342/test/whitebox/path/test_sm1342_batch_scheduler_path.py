@@ -0,0 +1,49 @@
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.application_service import ApplicationService
+from src.services.interview_service import InterviewService
+from src.services.scheduler_service import SchedulerService
+
+from tests._helpers import make_repo
+
+
+def setup_shortlisted(repo, n):
+    JobService(repo).create_job_posting(
+        job_id="JOB001", title="SE", location="London", job_type="full_time",
+        min_salary=30000, max_salary=50000, required_skills=["python"], min_experience_years=0, visa_required=False
+    )
+    apps = ApplicationService(repo)
+    with repo.transaction():
+        for i in range(n):
+            CandidateService(repo).create_candidate_profile(
+                candidate_id=f"CAND{i:03d}", name="Candidate", email=f"c{i}@example.com", phone="+447700900123",
+                location="London", years_experience=1, skills=["python"], education_level="bachelors",
+                visa_status="no_sponsorship"
+            )
+            apps.submit_application(f"APP{i:03d}", "JOB001", f"CAND{i:03d}")
+            apps.update_application_status(f"APP{i:03d}", "screened", "ok")
+            apps.update_application_status(f"APP{i:03d}", "shortlisted", "ok")
+
+
+def test_batch_schedule_fills_free_slots_earliest_first(tmp_path):
+    repo = make_repo(tmp_path)
+    setup_shortlisted(repo, 5)
+    # existing booking blocks alex 10:00-11:00 (app000 is taken by hand first)
+    InterviewService(repo).schedule_interview("INT000", "APP000", "2025-12-20T10:00:00", 60, "alex", "online")
+
+    report = SchedulerService(repo).schedule_shortlisted("JOB001", {
+        "Alex": [("2025-12-20T09:00:00", "2025-12-20T12:00:00")],
+        "sam": [("2025-12-20T09:30:00", "2025-12-20T10:30:00")],
+    }, 60)
+
+    placed = [(s["interviewer"], s["scheduled_time"]) for s in report["scheduled"]]
+    assert placed == [
+        ("alex", "2025-12-20T09:00:00"),
+        ("sam", "2025-12-20T09:30:00"),
+        ("alex", "2025-12-20T11:00:00"),
+    ]
+    assert report["unscheduled"] == ["app004"]
+
+    statuses = {a["application_id"]: a["status"] for a in ApplicationService(repo).list_applications_for_job("JOB001")}
+    assert statuses == {"app000": "interview_scheduled", "app001": "interview_scheduled",
+                        "app002": "interview_scheduled", "app003": "interview_scheduled", "app004": "shortlisted"}
@@ -0,0 +1,85 @@
+import csv
+import json
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.services.candidate_service import CandidateService
+from src.services.export_service import SECTION_FIELDS, ExportService
+from src.services.job_service import JobService
+from src.storage.sqlite_repository import SqliteRepository
+
+from tests._helpers import make_repo
+
+
+def seed(repo):
+    jobs = JobService(repo)
+    for jid, title, loc in [("J1", "Data Engineer", "London"), ("J2", "Web Developer", "Leeds")]:
+        jobs.create_job_posting(job_id=jid, title=title, location=loc, job_type="full_time", min_salary=30000,
+                                max_salary=50000, required_skills=["python"], min_experience_years=0, visa_required=False)
+    cands = CandidateService(repo)
+    for cid, skills, years in [("C1", ["python", "sql"], 12), ("C2", ["java"], 1)]:
+        cands.create_candidate_profile(candidate_id=cid, name=cid, email=f"{cid}@example.com", phone="+447700900123",
+                                       location="London", years_experience=years, skills=skills,
+                                       education_level="masters", visa_status="citizen")
+
+
+def read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_collection_export_projects_and_filters(tmp_path, backend):
+    repo = make_repo(tmp_path) if backend == "json" else SqliteRepository(tmp_path / "db.sqlite3")
+    seed(repo)
+    svc = ExportService(repo)
+
+    out = tmp_path / "cands.ndjson"
+    summary = svc.export_collection("candidates", str(out), fields=["candidate_id", "skills"], filters={"skills": "SQL"})
+    assert summary["rows"] == 1
+    assert read_ndjson(out) == [{"candidate_id": "c1", "skills": ["python", "sql"]}]
+
+    out = tmp_path / "jobs.csv"
+    svc.export_collection("jobs", str(out), fmt="csv", filters={"location": ["leeds", "paris"]})
+    rows = list(csv.DictReader(out.open()))
+    assert [r["job_id"] for r in rows] == ["j2"]
+    assert rows[0]["required_skills"] == "python"
+
+
+def test_csv_header_comes_from_the_model_not_the_first_row(tmp_path):
+    repo = make_repo(tmp_path)
+    db = repo.load()
+    # a sparse record first (as a raw import may leave it), a full one after it
+    db["jobs"]["j0"] = {"job_id": "j0", "title": "Sparse"}
+    repo.save(db)
+    seed(repo)
+
+    out = tmp_path / "jobs.csv"
+    ExportService(repo).export_collection("jobs", str(out), fmt="csv")
+    with out.open() as f:
+        header = next(csv.reader(f))
+    assert header == list(SECTION_FIELDS["jobs"])
+    assert "min_salary" in header and "title_norm" not in header
+    rows = {r["job_id"]: r for r in csv.DictReader(out.open())}
+    assert rows["j0"]["min_salary"] == "" and rows["j1"]["min_salary"] == "30000"
+
+
+def test_search_and_ranking_exports(tmp_path):
+    repo = make_repo(tmp_path)
+    seed(repo)
+    svc = ExportService(repo)
+
+    out = tmp_path / "search.ndjson"
+    assert svc.export_search_jobs(str(out), keyword="engineer", fields=["job_id"])["rows"] == 1
+    assert read_ndjson(out) == [{"job_id": "j1"}]
+
+    out = tmp_path / "rank.csv"
+    svc.export_ranking("J1", str(out), fmt="csv")
+    rows = list(csv.DictReader(out.open()))
+    assert [(r["rank"], r["candidate_id"]) for r in rows] == [("1", "c1"), ("2", "c2")]
+    assert rows[0]["skills"] == "1.0"
+
+    with pytest.raises(ValidationError):
+        svc.export_collection("offers", str(out))
+    with pytest.raises(ValidationError):
+        svc.export_collection("jobs", str(out), fmt="xml")
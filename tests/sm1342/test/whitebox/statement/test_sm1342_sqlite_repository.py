@@ -0,0 +1,73 @@
+import json
+import pytest
+from src.services.job_service import JobService
+from src.services.candidate_service import CandidateService
+from src.services.application_service import ApplicationService
+from src.services.interview_service import InterviewService
+from src.app.exceptions import ConflictError, ValidationError
+from src.storage.sqlite_repository import SqliteRepository, migrate_json_to_sqlite
+
+from tests._helpers import make_repo
+
+
+def setup_shortlisted_app(repo, job_id, app_id, cand_id, email):
+    JobService(repo).create_job_posting(
+        job_id=job_id, title="SE", location="London", job_type="full_time",
+        min_salary=30000, max_salary=50000, required_skills=["python"], min_experience_years=0, visa_required=False
+    )
+    CandidateService(repo).create_candidate_profile(
+        candidate_id=cand_id, name="Candidate", email=email, phone="+447700900123",
+        location="London", years_experience=1, skills=["python"], education_level="bachelors", visa_status="no_sponsorship"
+    )
+    ApplicationService(repo).submit_application(app_id, job_id, cand_id)
+    ApplicationService(repo).update_application_status(app_id, "screened", "ok")
+    ApplicationService(repo).update_application_status(app_id, "shortlisted", "ok")
+
+
+def test_sqlite_services_round_trip(tmp_path):
+    repo = SqliteRepository(tmp_path / "test_db.sqlite3")
+    setup_shortlisted_app(repo, "JOB001", "APP001", "CAND001", "a1@example.com")
+    setup_shortlisted_app(repo, "JOB002", "APP002", "CAND002", "a2@example.com")
+
+    with pytest.raises(ValidationError):
+        CandidateService(repo).create_candidate_profile(
+            candidate_id="CAND003", name="Dup", email="A1@example.com", phone="+447700900123",
+            location="London", years_experience=1, skills=[], education_level="", visa_status=""
+        )
+    with pytest.raises(ConflictError):
+        ApplicationService(repo).submit_application("APP003", "JOB001", "CAND001")
+
+    svc = InterviewService(repo)
+    svc.schedule_interview("INT001", "APP001", "2025-12-20T10:00:00", 60, "interviewer1", "online")
+    with pytest.raises(ConflictError):
+        svc.schedule_interview("INT002", "APP002", "2025-12-20T10:30:00", 60, "Interviewer1", "online")
+
+    status = ApplicationService(repo).get_application_status("APP001")
+    assert status["status"] == "interview_scheduled"
+    assert [e["action"] for e in status["audit_trail"]] == [
+        "created", "status_change", "status_change", "interview_scheduled"]
+    repo.close()
+
+
+def test_sqlite_transaction_rollback(tmp_path):
+    repo = SqliteRepository(tmp_path / "test_db.sqlite3")
+    with pytest.raises(ConflictError):
+        with repo.transaction():
+            setup_shortlisted_app(repo, "JOB001", "APP001", "CAND001", "a1@example.com")
+            raise ConflictError("boom")
+    assert len(repo.load()["jobs"]) == 0
+    repo.close()
+
+
+def test_migrate_json_store(tmp_path):
+    json_repo = make_repo(tmp_path)
+    setup_shortlisted_app(json_repo, "JOB001", "APP001", "CAND001", "a1@example.com")
+
+    counts = migrate_json_to_sqlite(json_repo.filepath, tmp_path / "migrated.sqlite3")
+    assert counts == {"jobs": 1, "candidates": 1, "applications": 1, "interviews": 0}
+
+    repo = SqliteRepository(tmp_path / "migrated.sqlite3")
+    app = repo.load()["applications"]["app001"]
+    assert app == json.loads(json_repo.filepath.read_text())["applications"]["app001"]
+    assert repo.candidate_id_for_email("A1@EXAMPLE.COM") == "cand001"
+    repo.close()
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.services.job_service import JobService
+
+from tests._helpers import make_repo
+
+
+def seed(repo, n):
+    rnd = random.Random(11)
+    svc = JobService(repo)
+    for i in range(n):
+        low = rnd.choice([30000, 40000, 50000, 60000])
+        svc.create_job_posting(job_id=f"J{i:03d}", title=rnd.choice(["Engineer", "Analyst"]),
+                               location=rnd.choice(["London", "Leeds"]), job_type=rnd.choice(["full_time", "contract"]),
+                               min_salary=low, max_salary=low + rnd.choice([0, 10000, 20000]), required_skills=[],
+                               min_experience_years=rnd.randint(0, 6), visa_required=False)
+    return svc
+
+
+def brute_force(repo, location="", salary_min=None, salary_max=None, min_exp=None, max_exp=None):
+    return sorted(jid for jid, j in repo.load()["jobs"].items()
+                  if location in j["location"].lower()
+                  and (salary_min is None or j["max_salary"] >= salary_min)
+                  and (salary_max is None or j["min_salary"] <= salary_max)
+                  and (min_exp is None or j["min_experience_years"] >= min_exp)
+                  and (max_exp is None or j["min_experience_years"] <= max_exp))
+
+
+@pytest.mark.parametrize("location,salary_min,salary_max,min_exp,max_exp", [
+    ("", 50000, None, None, None),
+    ("", None, 50000, None, None),
+    ("", 50000, 50000, None, None),    # a band touching the bound still overlaps
+    ("", 50001, 59999, None, None),
+    ("", None, 29999, None, None),     # below every band
+    ("", None, None, 3, 3),
+    ("", None, None, None, 0),
+    ("leeds", 45000, 70000, 2, 5),
+])
+def test_range_filters_match_a_full_scan(tmp_path, location, salary_min, salary_max, min_exp, max_exp):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 150)
+    expected = brute_force(repo, location, salary_min, salary_max, min_exp, max_exp)
+    res = svc.search_jobs_faceted(location=location, limit=200, salary_min=salary_min, salary_max=salary_max,
+                                  min_experience=min_exp, max_experience=max_exp)
+    assert sorted(j["job_id"] for j in res["results"]) == expected
+    assert res["total"] == len(expected)
+
+
+def test_ranges_follow_edits_and_reject_bad_bounds(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 20)
+    svc.edit_job_posting("J000", {"min_salary": 200000, "max_salary": 250000, "min_experience_years": 10})
+    assert [j["job_id"] for j in svc.search_jobs(salary_min=150000)] == ["j000"]
+    assert [j["job_id"] for j in svc.search_jobs(min_experience=10, max_experience=10)] == ["j000"]
+    assert "j000" not in {j["job_id"] for j in svc.search_jobs(salary_max=100000)}
+
+    with pytest.raises(ValidationError):
+        svc.search_jobs(salary_min=10, salary_max=5)
+    with pytest.raises(ValidationError):
+        svc.search_jobs(min_experience=4, max_experience=1)
+    with pytest.raises(ValidationError):
+        svc.search_jobs(salary_min="high")
@@ -0,0 +1,86 @@
+import json
+
+from src.services.bulk_import_service import BulkImportService
+from src.services.candidate_service import CandidateService
+from src.services.export_service import ExportService
+
+from tests._helpers import make_repo
+
+
+def cand(cid, **kw):
+    return dict({"candidate_id": cid, "name": "Ann", "email": f"{cid.lower()}@example.com", "phone": "+447700900123",
+                 "location": "Leeds", "years_experience": 2, "skills": ["Python"]}, **kw)
+
+
+def upsert(repo, tmp_path, payload):
+    bulk = tmp_path / "feed.json"
+    bulk.write_text(json.dumps(payload))
+    return BulkImportService(repo).import_upsert(str(bulk))
+
+
+def test_upsert_classifies_inserted_updated_unchanged_and_rejected(tmp_path):
+    repo = make_repo(tmp_path)
+    job = {"job_id": "J1", "title": "Dev", "location": "London", "job_type": "full_time",
+           "min_salary": 30000, "max_salary": 50000}
+    app = {"application_id": "A1", "job_id": "J1", "candidate_id": "C1"}
+    first = upsert(repo, tmp_path, {"jobs": [job], "candidates": [cand("C1"), cand("C2"), cand("C3")],
+                                    "applications": [app]})
+    assert first["candidates"]["inserted"] == 3
+    assert first["applications"]["inserted"] == 1
+
+    report = upsert(repo, tmp_path, {
+        "jobs": [dict(job, created_at="2020-01-01T00:00:00")],
+        "candidates": [cand("C1"), cand("C2", skills=["Rust"], candidate_id="c2"),
+                       cand("C3", email="bad"), cand("C4")],
+        "applications": [dict(app, status="shortlisted")],
+    })
+
+    assert report["candidates"] == {"inserted": 1, "updated": 1, "unchanged": 1, "skipped": 1,
+                                    "errors": ["candidates[2]: Invalid email format."]}
+    # created_at is not editable, so the changed feed record leaves the job as it was
+    assert report["jobs"]["unchanged"] == 1
+    assert report["applications"]["errors"] == ["applications[0]: Invalid transition: applied -> shortlisted"]
+
+    db = repo.load()
+    assert db["candidates"]["c2"]["skills"] == ["rust"]
+    assert db["candidates"]["c3"]["email"] == "c3@example.com"
+    assert db["jobs"]["j1"]["created_at"] != "2020-01-01T00:00:00"
+
+
+def test_upsert_adopts_records_imported_without_a_hash(tmp_path):
+    repo = make_repo(tmp_path)
+    bulk = tmp_path / "plain.json"
+    feed = {"candidates": [cand("C1", name="  Ann   Lee ")]}
+    bulk.write_text(json.dumps(feed))
+    BulkImportService(repo).import_from_json(str(bulk))
+    assert repo.load()["candidates"]["c1"]["skills"] == ["python"]
+
+    # the raw import kept the name as sent; the first upsert tidies it through the edit rules
+    assert upsert(repo, tmp_path, feed)["candidates"]["updated"] == 1
+    assert repo.load()["candidates"]["c1"]["name"] == "Ann Lee"
+    again = upsert(repo, tmp_path, feed)
+    assert again["candidates"]["unchanged"] == 1
+    assert repo.load()["candidates"]["c1"]["source_hash"]
+
+
+def test_unchanged_reimport_does_not_rewrite_the_store(tmp_path):
+    repo = make_repo(tmp_path)
+    feed = {"candidates": [cand("C1"), cand("C2")]}
+    assert upsert(repo, tmp_path, feed)["candidates"]["inserted"] == 2
+    before = repo.filepath.stat()
+    assert upsert(repo, tmp_path, feed)["candidates"]["unchanged"] == 2
+    after = repo.filepath.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_source_hash_stays_out_of_service_results_and_exports(tmp_path):
+    repo = make_repo(tmp_path)
+    upsert(repo, tmp_path, {"candidates": [cand("C1")]})
+    assert repo.load()["candidates"]["c1"]["source_hash"]
+
+    svc = CandidateService(repo)
+    assert "source_hash" not in svc.view_candidate_profile("C1")
+    assert "source_hash" not in svc.search_candidates(skills=["python"])["results"][0]
+    out = tmp_path / "candidates.ndjson"
+    ExportService(repo).export_collection("candidates", str(out))
+    assert "source_hash" not in json.loads(out.read_text().splitlines()[0])
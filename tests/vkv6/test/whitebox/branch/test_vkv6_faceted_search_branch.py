@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from src.app.exceptions import ValidationError
+from src.app.utils import normalise_text
+from src.services.job_service import JobService
+
+from tests._helpers import make_repo
+
+TITLES = ["Data Engineer", "Web Developer", "data analyst", "QA Engineer"]
+LOCATIONS = ["London", "Leeds", "New York", "York"]
+TYPES = ["full_time", "part_time", "contract"]
+
+
+def seed(repo, n):
+    rnd = random.Random(7)
+    svc = JobService(repo)
+    for i in range(n):
+        svc.create_job_posting(job_id=f"J{i:03d}", title=rnd.choice(TITLES), location=rnd.choice(LOCATIONS),
+                               job_type=rnd.choice(TYPES), min_salary=1, max_salary=2, required_skills=[],
+                               min_experience_years=0, visa_required=False)
+    return svc
+
+
+def brute_force(repo, keyword, location, job_type):
+    k, loc, jt = normalise_text(keyword), normalise_text(location), normalise_text(job_type)
+    jobs = [j for j in repo.load()["jobs"].values()
+            if k in normalise_text(j["title"]) and loc in normalise_text(j["location"])
+            and (not jt or jt == normalise_text(j["job_type"]))]
+    return [j["job_id"] for j in sorted(jobs, key=lambda j: (normalise_text(j["title"]),
+                                                             normalise_text(j["location"]), j["job_id"]))]
+
+
+@pytest.mark.parametrize("keyword,location,job_type", [
+    ("", "", ""), ("engineer", "", ""), ("", "york", ""), ("", "", "contract"),
+    ("data", "london", "full_time"), ("nothing", "", ""), ("qa", "", ""), ("a eng", "", ""),
+])
+def test_pages_and_facets_match_a_full_scan(tmp_path, keyword, location, job_type):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 120)
+    expected = brute_force(repo, keyword, location, job_type)
+
+    assert [j["job_id"] for j in svc.search_jobs(keyword, location, job_type)] == expected
+    pages = []
+    for offset in range(0, len(expected) + 7, 7):
+        res = svc.search_jobs_faceted(keyword, location, job_type, offset=offset, limit=7)
+        assert res["total"] == len(expected)
+        pages += [j["job_id"] for j in res["results"]]
+    assert pages == expected
+
+    facets = svc.search_jobs_faceted(keyword, location, job_type)["facets"]
+    assert sum(facets["location"].values()) == len(expected)
+    assert sum(facets["job_type"].values()) == len(expected)
+
+
+def test_index_follows_edits(tmp_path):
+    repo = make_repo(tmp_path)
+    svc = seed(repo, 5)
+    before = svc.search_jobs_faceted()["facets"]["location"]
+    svc.edit_job_posting("J000", {"location": "Paris", "title": "Zeta Role"})
+
+    res = svc.search_jobs_faceted(location="paris")
+    assert [j["job_id"] for j in res["results"]] == ["j000"]
+    assert svc.search_jobs_faceted()["facets"]["location"]["paris"] == 1
+    assert sum(svc.search_jobs_faceted()["facets"]["location"].values()) == sum(before.values())
+    assert svc.search_jobs()[-1]["job_id"] == "j000"
+    assert [j["job_id"] for j in svc.search_jobs("zeta")] == ["j000"]
+    svc.edit_job_posting("J000", {"title": "Omega Role"})
+    assert svc.search_jobs("zeta") == []
+    with pytest.raises(ValidationError):
+        svc.search_jobs_faceted(limit=0)
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from src.services.bulk_import_service import BulkImportService
+from src.storage.repository import Repository
+
+from tests._helpers import make_repo
+
+
+def write_ndjson(path, n):
+    lines = [json.dumps({"type": "job", "job_id": "J1", "title": "Role"})]
+    lines += [json.dumps({"type": "candidate", "candidate_id": f"C{i:03d}", "name": f"N{i}"}) for i in range(n)]
+    lines += ["", "{not json", json.dumps({"type": "offer", "offer_id": "O1"}), json.dumps({"job_id": "J2"})]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def journal_repo(tmp_path):
+    # journal saves append only the new records, so every chunk is committed
+    return Repository(make_repo(tmp_path).filepath, journal=True)
+
+
+def test_stream_import_commits_in_chunks_and_reports_progress(tmp_path):
+    repo = journal_repo(tmp_path)
+    src = tmp_path / "export.ndjson"
+    write_ndjson(src, 9)
+    seen = []
+
+    report = BulkImportService(repo).import_ndjson(str(src), chunk_size=4, progress=seen.append)
+
+    assert report["jobs"]["imported"] == 1
+    assert report["candidates"]["imported"] == 9
+    assert report["lines"]["skipped"] == 3
+    assert [p["chunks"] for p in seen] == [1, 2, 3, 4]
+    assert seen[-1]["bytes"] == seen[-1]["total_bytes"]
+    assert len(repo.load()["candidates"]) == 9
+    assert not (tmp_path / "export.ndjson.progress").exists()
+
+
+def test_interrupted_import_resumes_after_last_committed_chunk(tmp_path, monkeypatch):
+    repo = journal_repo(tmp_path)
+    src = tmp_path / "export.ndjson"
+    write_ndjson(src, 9)
+    svc = BulkImportService(repo)
+
+    real_write, calls = repo._write, []
+
+    def crash_on_second_commit(db):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("disk full")
+        real_write(db)
+
+    monkeypatch.setattr(repo, "_write", crash_on_second_commit)
+    with pytest.raises(RuntimeError):
+        svc.import_ndjson(str(src), chunk_size=4)
+    assert len(repo.load()["candidates"]) == 3
+    assert (tmp_path / "export.ndjson.progress").exists()
+
+    monkeypatch.setattr(repo, "_write", real_write)
+    report = svc.import_ndjson(str(src), chunk_size=4)
+    assert report["candidates"] == {"imported": 9, "skipped": 0, "errors": []}
+    assert len(repo.load()["candidates"]) == 9
+
+
+def test_snapshot_store_spaces_commits_as_it_grows(tmp_path):
+    repo = make_repo(tmp_path)
+    src = tmp_path / "export.ndjson"
+    write_ndjson(src, 30)
+    seen = []
+
+    report = BulkImportService(repo).import_ndjson(str(src), chunk_size=4, progress=seen.append)
+
+    # each commit waits for as many new lines as the store already held records: 4, 4, 8, 16, rest
+    # (the blank line 32 does not count)
+    assert [p["lines"] for p in seen] == [4, 8, 16, 33, 35]
+    assert report["candidates"]["imported"] == 30
+    assert len(repo.load()["candidates"]) == 30
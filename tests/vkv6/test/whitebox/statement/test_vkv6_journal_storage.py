@@ -0,0 +1,59 @@
+import json
+from src.storage.repository import Repository
+from src.services.job_service import JobService
+
+
+def make_journal_repo(tmp_path):
+    return Repository(filepath=tmp_path / "test_db.json", journal=True)
+
+
+def create_job(repo, job_id):
+    return JobService(repo).create_job_posting(
+        job_id=job_id, title="Data Engineer", location="Leicester", job_type="full_time",
+        min_salary=35000, max_salary=55000, required_skills=["python"], min_experience_years=1, visa_required=False
+    )
+
+
+def test_journal_appends_only_changed_records(tmp_path):
+    repo = make_journal_repo(tmp_path)
+    create_job(repo, "JOB001")
+    snapshot = repo.filepath.read_text()
+
+    create_job(repo, "JOB002")
+    JobService(repo).edit_job_posting("JOB001", {"title": "Senior Data Engineer"})
+
+    assert repo.filepath.read_text() == snapshot
+    lines = repo.journal_path.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["job002", "job001"]
+
+
+def test_journal_is_replayed_and_compacted(tmp_path):
+    repo = make_journal_repo(tmp_path)
+    create_job(repo, "JOB001")
+    create_job(repo, "JOB002")
+    JobService(repo).edit_job_posting("JOB001", {"title": "Senior Data Engineer"})
+
+    repo.invalidate()
+    db = repo.load()
+    assert set(db["jobs"]) == {"job001", "job002"}
+    assert db["jobs"]["job001"]["title"] == "Senior Data Engineer"
+
+    repo.compact()
+    assert not repo.journal_path.exists()
+    repo.invalidate()
+    assert repo.load()["jobs"]["job001"]["title"] == "Senior Data Engineer"
+
+
+def test_torn_journal_tail_is_ignored(tmp_path):
+    repo = make_journal_repo(tmp_path)
+    create_job(repo, "JOB001")
+    create_job(repo, "JOB002")
+    with repo.journal_path.open("a", encoding="utf-8") as f:
+        f.write('{"c":"jobs","id":"job003","v":{')
+
+    repo.invalidate()
+    assert set(repo.load()["jobs"]) == {"job001", "job002"}
+
+    create_job(repo, "JOB004")
+    repo.invalidate()
+    assert set(repo.load()["jobs"]) == {"job001", "job002", "job004"}
@@ -0,0 +1,55 @@
+import json
+import os
+from src.storage.repository import Repository
+from src.services.job_service import JobService
+from src.app.exceptions import ValidationError
+
+from tests._helpers import make_repo
+
+
+def create_job(repo, job_id="JOB001"):
+    return JobService(repo).create_job_posting(
+        job_id=job_id, title="Data Engineer", location="Leicester", job_type="full_time",
+        min_salary=35000, max_salary=55000, required_skills=["python"], min_experience_years=1, visa_required=False
+    )
+
+
+def test_load_is_served_from_cache_until_file_changes(tmp_path):
+    repo = make_repo(tmp_path)
+    first = repo.load()
+    assert repo.load() is first
+
+    data = json.loads(repo.filepath.read_text())
+    data["jobs"]["job999"] = {"job_id": "job999"}
+    repo.filepath.write_text(json.dumps(data))
+    os.utime(repo.filepath, ns=(1, 1))
+
+    reloaded = repo.load()
+    assert reloaded is not first
+    assert "job999" in reloaded["jobs"]
+
+
+def test_cache_is_shared_between_repository_instances(tmp_path):
+    repo = make_repo(tmp_path)
+    create_job(repo)
+    other = Repository(filepath=repo.filepath)
+    assert "job001" in other.load()["jobs"]
+    assert other.load() is repo.load()
+
+
+def test_failed_edit_does_not_leak_into_cache(tmp_path):
+    repo = make_repo(tmp_path)
+    create_job(repo)
+    svc = JobService(repo)
+    try:
+        svc.edit_job_posting("JOB001", {"title": "Changed", "min_salary": 90000})
+    except ValidationError:
+        pass
+    assert repo.load()["jobs"]["job001"]["title"] == "Data Engineer"
+
+
+def test_invalidate_forces_reload(tmp_path):
+    repo = make_repo(tmp_path)
+    first = repo.load()
+    repo.invalidate()
+    assert repo.load() is not first
@@ -0,0 +1,55 @@
+import json
+import os
+
+from src.services.application_service import ApplicationService
+from src.services.candidate_service import CandidateService
+from src.services.job_service import JobService
+from src.storage.split_repository import SplitRepository
+
+from tests._helpers import make_repo
+
+
+def create_job(repo, jid):
+    JobService(repo).create_job_posting(job_id=jid, title="Dev", location="London", job_type="full_time",
+                                        min_salary=1, max_salary=2, required_skills=["python"],
+                                        min_experience_years=0, visa_required=False)
+
+
+def test_legacy_file_is_split_and_sections_load_lazily(tmp_path):
+    legacy = make_repo(tmp_path)
+    create_job(legacy, "J1")
+    CandidateService(legacy).create_candidate_profile(
+        candidate_id="C1", name="A", email="a@example.com", phone="+447700900123", location="London",
+        years_experience=1, skills=["python"], education_level="masters", visa_status="citizen")
+    ApplicationService(legacy).submit_application("A1", "J1", "C1")
+    ApplicationService(legacy).update_application_status("A1", "screened", "cv ok")
+
+    repo = SplitRepository(tmp_path / "split", legacy_file=legacy.filepath)
+    assert [j["job_id"] for j in JobService(repo).search_jobs("dev")] == ["j1"]
+    db = repo.load()
+    assert list(db.loaded()) == ["jobs"]
+    assert sorted(p.name for p in (tmp_path / "split").iterdir()) == [
+        "applications.json", "audit.jsonl", "candidates.json", "interviews.json", "jobs.json"]
+
+    status = ApplicationService(repo).get_application_status("A1")
+    assert status["status"] == "screened"
+    assert [e["action"] for e in status["audit_trail"]] == ["created", "status_change"]
+    assert sorted(db.loaded()) == ["applications", "jobs"]
+
+
+def test_save_rewrites_only_changed_sections_and_sees_outside_edits(tmp_path):
+    repo = SplitRepository(tmp_path / "split", legacy_file=None)
+    create_job(repo, "J1")
+    files = {name: tmp_path / "split" / f"{name}.json" for name in ("jobs", "candidates")}
+    for path in files.values():
+        os.utime(path, ns=(0, 0))
+
+    create_job(repo, "J2")
+    assert files["jobs"].stat().st_mtime_ns != 0
+    assert files["candidates"].stat().st_mtime_ns == 0
+
+    # another process edits jobs.json: the cached store is dropped and reread
+    data = json.loads(files["jobs"].read_text())
+    data["j1"]["title"] = "Changed"
+    files["jobs"].write_text(json.dumps(data))
+    assert SplitRepository(tmp_path / "split", legacy_file=None).load()["jobs"]["j1"]["title"] == "Changed"